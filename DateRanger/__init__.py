@@ -1,27 +1,56 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-import calendar
 from datetime import date
-from datetime import timedelta
 
 from DateRanger.utils import get_quarter
-from DateRanger.utils import get_monthrange
+from DateRanger.utils import get_days_in_month
+from DateRanger.utils import get_week_start
+from DateRanger.utils import get_month_index
+from DateRanger.utils import get_block_dates
+from DateRanger.views import DaySequence
+from DateRanger.views import WeekSequence
+from DateRanger.views import MonthSequence
+from DateRanger.views import QuarterSequence
+from DateRanger.views import YearSequence
 from DateRanger.objects import DateFrame
+from DateRanger.objects import DateFrameArray
+from DateRanger.objects import intern_frame
+from DateRanger.cache import memoize
+from DateRanger.table import lookup
+from DateRanger.business import get_calendar
 from DateRanger.exceptions import InvalidDateRange
 from DateRanger.exceptions import InvalidQuarter
 
 
+def _get_offsets(start, stop=None, step=1):
+    """
+    Get the first offset, length and step of range(start, stop, step).
+    """
+    offsets = range(start) if stop is None else range(start, stop, step)
+    return (offsets.start, len(offsets), offsets.step)
+
+
+def _to_dates(start, end):
+    """
+    Convert a pair of ordinals to a pair of dates.
+    """
+    return (date.fromordinal(start), date.fromordinal(end))
+
+
 class DateRanger(object):
 
     """
     A class for getting common bussiness date ranges.
     """
 
-    def __init__(self, base_date=None):
+    def __init__(self, base_date=None, intern_frames=False):
         """
         Argus:
             base_date - the base day. Example: date(2009, 11, 1)
+            intern_frames - share identical DateFrame objects across
+                            DateRanger instances (see intern_frame)
         """
+        self.frame_factory = intern_frame if intern_frames else DateFrame
         self.set_base_date(base_date)
 
     def set_base_date(self, base_date=None):
@@ -43,13 +72,13 @@ class DateRanger(object):
         """
         Get the DateRange of self.bdate.
         """
-        return DateFrame(self.bdate, self.bdate)
+        return self.frame_factory(self.bdate, self.bdate)
 
     def relative_day(self, days=0):
         """
         Calcuate a relative date from self.bdate.
         """
-        rday = self.bdate + timedelta(days=days)
+        rday = date.fromordinal(self.bdate.toordinal() + days)
         return (rday, rday)
 
     def prev_day(self, days=1):
@@ -61,7 +90,7 @@ class DateRanger(object):
         """
         ndays = days * -1
         start, end = self.relative_day(days=ndays)
-        return DateFrame(start, end)
+        return self.frame_factory(start, end)
 
     def next_day(self, days=1):
         """
@@ -71,8 +100,65 @@ class DateRanger(object):
             days - next n days
         """
         start, end = self.relative_day(days=days)
-        return DateFrame(start, end)
+        return self.frame_factory(start, end)
+
+    def relative_days(self, start, stop=None, step=1):
+        """
+        Get a lazy sequence of day ranges relative to self.bdate. Offsets
+        work like range(start, stop, step): item n is the range of
+        relative_day(offset n).
+        """
+        first, length, step = _get_offsets(start, stop, step)
+        base = self.bdate.toordinal()
+        return DaySequence(base + first, length, step)
+
+    def prev_days(self, days):
+        """
+        Get a lazy sequence of the n day ranges before self.bdate, the
+        latest first: item i is prev_day(i + 1).
+
+        Argus:
+            days - number of days
+        """
+        return self.relative_days(-1, -days - 1, -1)
+
+    def next_days(self, days):
+        """
+        Get a lazy sequence of the n day ranges after self.bdate: item i
+        is next_day(i + 1).
+
+        Argus:
+            days - number of days
+        """
+        return self.relative_days(1, days + 1)
+
+    def prev_business_day(self, days=1, calendar=None):
+        """
+        Get the DateRange of the working day n working days before
+        self.bdate.
+
+        Argus:
+            days - n working days ago
+            calendar - a BusinessCalendar or the name of a registered one,
+                       None for the default calendar
+        """
+        return self.next_business_day(days * -1, calendar)
+
+    def next_business_day(self, days=1, calendar=None):
+        """
+        Get the DateRange of the working day n working days after
+        self.bdate.
 
+        Argus:
+            days - next n working days
+            calendar - a BusinessCalendar or the name of a registered one,
+                       None for the default calendar
+        """
+        calendar = get_calendar(calendar)
+        rday = calendar.add_business_days(self.bdate, days)
+        return self.frame_factory(rday, rday)
+
+    @memoize('get_week_range', lambda self, base_date: base_date)
     def get_week_range(self, base_date):
         """
         Find the first/last day of the week for the given day.
@@ -81,24 +167,27 @@ class DateRanger(object):
         Argus:
             base_date - any date
         """
-        start =  base_date - timedelta(days=base_date.weekday()+1)
-        end = start + timedelta(days=6)
-        return (start, end)
+        ordinal = base_date.toordinal()
+        table = lookup(ordinal)
+        if table is not None:
+            return _to_dates(*table.week_range(ordinal))
+
+        start = get_week_start(ordinal)
+        return _to_dates(start, start + 6)
 
     def base_week(self):
         """
         Get DateRange of the week that contains self.bdate.
         """
         start, end = self.get_week_range(self.bdate)
-        return DateFrame(start, end)
+        return self.frame_factory(start, end)
 
     def relative_week(self, weeks=0):
         """
         Calcuate a relative week range from self.bdate.
         """
-        _, end_date = self.base_week().get_range()
-        start, end = self.get_week_range(end_date + timedelta(days=7*weeks))
-        return (start, end)
+        start = get_week_start(self.bdate.toordinal()) + weeks * 7
+        return _to_dates(start, start + 6)
 
     def prev_week(self, weeks=1):
         """
@@ -109,7 +198,7 @@ class DateRanger(object):
         """
         nweeks = weeks * -1
         start, end = self.relative_week(weeks=nweeks)
-        return DateFrame(start, end)
+        return self.frame_factory(start, end)
 
     def next_week(self, weeks=1):
         """
@@ -119,7 +208,37 @@ class DateRanger(object):
             weeks - next n weeks
         """
         start, end = self.relative_week(weeks=weeks)
-        return DateFrame(start, end)
+        return self.frame_factory(start, end)
+
+    def relative_weeks(self, start, stop=None, step=1):
+        """
+        Get a lazy sequence of week ranges relative to self.bdate. Offsets
+        work like range(start, stop, step): item n is the range of
+        relative_week(offset n).
+        """
+        first, length, step = _get_offsets(start, stop, step)
+        base = get_week_start(self.bdate.toordinal())
+        return WeekSequence(base + first * 7, length, step * 7)
+
+    def prev_weeks(self, weeks):
+        """
+        Get a lazy sequence of the n week ranges before self.bdate, the
+        latest first: item i is prev_week(i + 1).
+
+        Argus:
+            weeks - number of weeks
+        """
+        return self.relative_weeks(-1, -weeks - 1, -1)
+
+    def next_weeks(self, weeks):
+        """
+        Get a lazy sequence of the n week ranges after self.bdate: item i
+        is next_week(i + 1).
+
+        Argus:
+            weeks - number of weeks
+        """
+        return self.relative_weeks(1, weeks + 1)
 
     def get_month_range(self, year, month):
         """
@@ -129,40 +248,28 @@ class DateRanger(object):
             year
             month
         """
-        days = calendar.monthrange(year, month)[1]
-        start = date(year, month, 1)
-        end = date(year, month, days)
-        return (start, end)
+        if not 1 <= month <= 12:
+            raise ValueError('bad month number %r; must be 1-12' % (month,))
+        return (date(year, month, 1),
+                date(year, month, get_days_in_month(year, month)))
 
     def relative_month(self, months=0):
         """
         Calcuate a relative month range from self.bdate.
         """
-        month_sum = self.bmonth + months
-        if month_sum < 0:
-            back_months = abs(month_sum)
-            yeardelta = ((back_months // 12) + 1) * -1
-            month = 12 - (back_months % 12)
-        elif month_sum == 0:
-            yeardelta = -1
-            month = 12
-        elif month_sum <= 12:
-            yeardelta = 0
-            month = month_sum
-        else:
-            yeardelta = month_sum // 12
-            month = month_sum % 12
-        year = self.byear + yeardelta
-        start, end = self.get_month_range(year, month)
-        return (start, end)
+        year, month = divmod(self.byear * 12 + self.bmonth - 1 + months, 12)
+        month += 1
+        return (date(year, month, 1),
+                date(year, month, get_days_in_month(year, month)))
 
     def base_month(self):
         """
         Get the DateRange of the month that contains self.bdate
         """
         year, month = self.byear, self.bmonth
-        start, end = self.get_month_range(year, month)
-        return DateFrame(start, end)
+        return self.frame_factory(
+            date(year, month, 1),
+            date(year, month, get_days_in_month(year, month)))
 
     def prev_month(self, months=1):
         """
@@ -171,9 +278,8 @@ class DateRanger(object):
         Argus:
             months - n months ago
         """
-        nmonths = months * -1
-        start, end = self.relative_month(months=nmonths)
-        return DateFrame(start, end)
+        start, end = self.relative_month(-months)
+        return self.frame_factory(start, end)
 
     def next_month(self, months=1):
         """
@@ -182,9 +288,41 @@ class DateRanger(object):
         Argus:
             months - next n months
         """
-        start, end = self.relative_month(months=months)
-        return DateFrame(start, end)
+        start, end = self.relative_month(months)
+        return self.frame_factory(start, end)
+
+    def relative_months(self, start, stop=None, step=1):
+        """
+        Get a lazy sequence of month ranges relative to self.bdate. Offsets
+        work like range(start, stop, step): item n is the range of
+        relative_month(offset n).
+        """
+        first, length, step = _get_offsets(start, stop, step)
+        base = get_month_index(self.byear, self.bmonth)
+        return MonthSequence(base + first, length, step)
+
+    def prev_months(self, months):
+        """
+        Get a lazy sequence of the n month ranges before self.bdate, the
+        latest first: item i is prev_month(i + 1).
+
+        Argus:
+            months - number of months
+        """
+        return self.relative_months(-1, -months - 1, -1)
+
+    def next_months(self, months):
+        """
+        Get a lazy sequence of the n month ranges after self.bdate: item i
+        is next_month(i + 1).
+
+        Argus:
+            months - number of months
+        """
+        return self.relative_months(1, months + 1)
 
+    @memoize('get_quarter_range',
+             lambda self, year, quarter: (year, quarter))
     def get_quarter_range(self, year, quarter):
         """
         Get time range with specific year and quarter.
@@ -192,41 +330,28 @@ class DateRanger(object):
         if quarter not in (1, 2, 3, 4):
             raise InvalidQuarter()
 
-        start_month, end_month = get_monthrange(quarter)
-        days = calendar.monthrange(year, end_month)[1]
-        start = date(year, start_month, 1)
-        end = date(year, end_month, days)
-        return start, end
+        return get_block_dates(get_month_index(year, quarter * 3 - 2), 3)
 
+    @memoize('relative_quarter',
+             lambda self, quarters=0: (self.byear, self.bquarter, quarters))
     def relative_quarter(self, quarters=0):
         """
         Calcuate a relative quarters range from self.bdate.
         """
-        quarter_sum = self.bquarter + quarters
-        if quarter_sum < 0:
-            back_quarters = abs(quarter_sum)
-            yeardelta = ((back_quarters // 4) + 1) * -1
-            quarter = 4 - (back_quarters % 4)
-        elif quarter_sum == 0:
-            yeardelta = -1
-            quarter = 4
-        elif quarter_sum <= 4:
-            yeardelta = 0
-            quarter = quarter_sum
-        else:
-            yeardelta = quarter_sum // 4
-            quarter = quarter_sum % 4
-        year = self.byear + yeardelta
-        start, end = self.get_quarter_range(year, quarter)
-        return (start, end)
+        index = get_month_index(self.byear, self.bquarter * 3 - 2)
+        return get_block_dates(index + quarters * 3, 3)
 
     def base_quarter(self):
         """
         Get the DateRange of the quarter that contains self.bdate.
         """
-        quarter = get_quarter(self.bmonth)
-        start, end = self.get_quarter_range(self.byear, quarter)
-        return DateFrame(start, end)
+        ordinal = self.bdate.toordinal()
+        table = lookup(ordinal)
+        if table is not None:
+            start, end = _to_dates(*table.quarter_range(ordinal))
+        else:
+            start, end = self.get_quarter_range(self.byear, self.bquarter)
+        return self.frame_factory(start, end)
 
     def prev_quarter(self, quarters=1):
         """
@@ -237,7 +362,7 @@ class DateRanger(object):
         """
         nquarters = quarters * -1
         start, end = self.relative_quarter(quarters=nquarters)
-        return DateFrame(start, end)
+        return self.frame_factory(start, end)
 
     def next_quarter(self, quarters=1):
         """
@@ -247,27 +372,54 @@ class DateRanger(object):
             quarters - next n quarters
         """
         start, end = self.relative_quarter(quarters=quarters)
-        return DateFrame(start, end)
+        return self.frame_factory(start, end)
+
+    def relative_quarters(self, start, stop=None, step=1):
+        """
+        Get a lazy sequence of quarter ranges relative to self.bdate. Offsets
+        work like range(start, stop, step): item n is the range of
+        relative_quarter(offset n).
+        """
+        first, length, step = _get_offsets(start, stop, step)
+        base = get_month_index(self.byear, self.bquarter * 3 - 2)
+        return QuarterSequence(base + first * 3, length, step * 3)
+
+    def prev_quarters(self, quarters):
+        """
+        Get a lazy sequence of the n quarter ranges before self.bdate, the
+        latest first: item i is prev_quarter(i + 1).
+
+        Argus:
+            quarters - number of quarters
+        """
+        return self.relative_quarters(-1, -quarters - 1, -1)
+
+    def next_quarters(self, quarters):
+        """
+        Get a lazy sequence of the n quarter ranges after self.bdate: item i
+        is next_quarter(i + 1).
+
+        Argus:
+            quarters - number of quarters
+        """
+        return self.relative_quarters(1, quarters + 1)
 
     def get_year_range(self, year):
         """
         Get time range of the year.
         """
-        start = date(year, 1, 1)
-        end = date(year, 12, 31)
-        return (start, end)
+        return (date(year, 1, 1), date(year, 12, 31))
 
     def relative_year(self, years=0):
         year = self.byear + years
-        start, end = self.get_year_range(year)
-        return (start, end)
+        return (date(year, 1, 1), date(year, 12, 31))
 
     def base_year(self):
         """
         Get the DateRange of the year that contains self.bdate.
         """
-        start, end = self.get_year_range(self.byear)
-        return DateFrame(start, end)
+        year = self.byear
+        return self.frame_factory(date(year, 1, 1), date(year, 12, 31))
 
     def prev_year(self, years=1):
         """
@@ -276,9 +428,8 @@ class DateRanger(object):
         Argus:
             years - n years ago
         """
-        nyears = years * -1
-        start, end = self.relative_year(years=nyears)
-        return DateFrame(start, end)
+        year = self.byear - years
+        return self.frame_factory(date(year, 1, 1), date(year, 12, 31))
 
     def next_year(self, years=1):
         """
@@ -287,8 +438,38 @@ class DateRanger(object):
         Argus:
             year - next n years
         """
-        start, end = self.relative_year(years=years)
-        return DateFrame(start, end)
+        year = self.byear + years
+        return self.frame_factory(date(year, 1, 1), date(year, 12, 31))
+
+    def relative_years(self, start, stop=None, step=1):
+        """
+        Get a lazy sequence of year ranges relative to self.bdate. Offsets
+        work like range(start, stop, step): item n is the range of
+        relative_year(offset n).
+        """
+        first, length, step = _get_offsets(start, stop, step)
+        base = get_month_index(self.byear, 1)
+        return YearSequence(base + first * 12, length, step * 12)
+
+    def prev_years(self, years):
+        """
+        Get a lazy sequence of the n year ranges before self.bdate, the
+        latest first: item i is prev_year(i + 1).
+
+        Argus:
+            years - number of years
+        """
+        return self.relative_years(-1, -years - 1, -1)
+
+    def next_years(self, years):
+        """
+        Get a lazy sequence of the n year ranges after self.bdate: item i
+        is next_year(i + 1).
+
+        Argus:
+            years - number of years
+        """
+        return self.relative_years(1, years + 1)
 
     def from_date(self, from_date):
         """
@@ -300,7 +481,8 @@ class DateRanger(object):
         if from_date > self.bdate:
             raise InvalidDateRange()
 
-        return DateFrame(from_date, self.bdate + timedelta(days=1))
+        end = date.fromordinal(self.bdate.toordinal() + 1)
+        return self.frame_factory(from_date, end)
 
     def to_date(self, to_date):
         """
@@ -312,4 +494,5 @@ class DateRanger(object):
         if to_date < self.bdate:
             raise InvalidDateRange()
 
-        return DateFrame(self.bdate, to_date + timedelta(days=1))
+        end = date.fromordinal(to_date.toordinal() + 1)
+        return self.frame_factory(self.bdate, end)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from DateRanger.bucket import Bucketer
+
+
+class BucketStats(object):
+
+    """
+    Running count, sum, min and max of the values of one bucket.
+    """
+
+    __slots__ = ('count', 'sum', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """
+        Add a value to the statistics.
+        """
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        """
+        Return the mean of values, or None if there is no value.
+        """
+        if not self.count:
+            return None
+        return self.sum / float(self.count)
+
+    def __repr__(self):
+        return '<BucketStats count=%d sum=%r min=%r max=%r>' % (
+            self.count, self.sum, self.min, self.max)
+
+
+class StreamAggregator(object):
+
+    """
+    Aggregate a stream of (date, value) records into the buckets of
+    DateFrame.each_<granularity>(). Only buckets which received values are
+    reported, as (bucket, BucketStats) tuples in bucket order.
+
+    If records are sorted by date, a bucket is reported as soon as a record
+    of a later bucket arrives and at most one bucket is kept in memory.
+    Otherwise all buckets are kept until flush(). Records outside the frame
+    are counted in self.skipped.
+    """
+
+    def __init__(self, frame, granularity, presorted=True):
+        """
+        Argus:
+            frame - a DateFrame
+            granularity - 'day', 'week', 'month', 'quarter' or 'year'
+            presorted - whether records are sorted by date
+        """
+        self.bucketer = Bucketer(frame, granularity)
+        self.presorted = presorted
+        self.skipped = 0
+        self._stats = {}
+        self._current = -1
+
+    def add(self, day, value):
+        """
+        Add a record. Return a list of buckets closed by this record.
+        """
+        index = self.bucketer.locate(day)
+        if index < 0:
+            self.skipped += 1
+            return []
+
+        closed = []
+        if self.presorted and index != self._current:
+            if index < self._current:
+                raise ValueError('Records are not sorted: %r' % (day,))
+            closed = self.flush()
+            self._current = index
+
+        stats = self._stats.get(index)
+        if stats is None:
+            stats = self._stats[index] = BucketStats()
+        stats.add(value)
+        return closed
+
+    def flush(self):
+        """
+        Close all open buckets and return them.
+        """
+        buckets = self.bucketer.buckets
+        closed = [(buckets[index], self._stats[index])
+                  for index in sorted(self._stats)]
+        self._stats = {}
+        return closed
+
+    def run(self, records):
+        """
+        Consume (date, value) records and yield closed buckets.
+        """
+        for day, value in records:
+            for item in self.add(day, value):
+                yield item
+        for item in self.flush():
+            yield item
+
+
+def aggregate(frame, granularity, records, presorted=True):
+    """
+    Yield (bucket, BucketStats) for each bucket of the frame which received
+    values. See StreamAggregator.
+
+    Argus:
+        frame - a DateFrame
+        granularity - 'day', 'week', 'month', 'quarter' or 'year'
+        records - an iterable of (date, value)
+        presorted - whether records are sorted by date
+    """
+    return StreamAggregator(frame, granularity, presorted).run(records)
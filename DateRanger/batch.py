@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from datetime import date
+from datetime import timedelta
+
+from DateRanger.utils import get_numpy
+from DateRanger.utils import get_week_start
+from DateRanger.utils import get_month_index
+from DateRanger.utils import get_block_range
+
+
+class BatchDateRanger(object):
+
+    """
+    A vectorized DateRanger which resolves date ranges for many base dates
+    in one pass. Every method returns a tuple of (starts, ends) that matches
+    what DateRanger returns for each base date.
+
+    When NumPy is installed, base dates are converted to a datetime64[D]
+    array and the results are datetime64[D] arrays. Otherwise the results
+    are lists of date objects.
+    """
+
+    def __init__(self, base_dates):
+        """
+        Argus:
+            base_dates - datetime64[D] array or a list of dates.
+        """
+        self.set_base_dates(base_dates)
+
+    def set_base_dates(self, base_dates):
+        """
+        Set base dates.
+
+        Argus:
+            base_dates - datetime64[D] array or a list of dates.
+        """
+        np = get_numpy()
+        if np is not None:
+            self.bdates = np.asarray(base_dates, dtype='datetime64[D]')
+        else:
+            self.bdates = list(base_dates)
+
+    def __len__(self):
+        return len(self.bdates)
+
+    def _week_ranges(self, weeks):
+        """
+        Get week ranges `weeks` weeks away from the week of each base date.
+        """
+        if get_numpy() is not None:
+            days = self.bdates.astype('int64')
+            # 1970-01-01 is a Thursday, so weekday() == (days + 3) % 7
+            starts = days - (days + 3) % 7 - 1 + 7 * weeks
+            return (starts.astype('datetime64[D]'),
+                    (starts + 6).astype('datetime64[D]'))
+
+        starts, ends = [], []
+        for bdate in self.bdates:
+            start = get_week_start(bdate.toordinal()) + 7 * weeks
+            starts.append(date.fromordinal(start))
+            ends.append(date.fromordinal(start + 6))
+        return (starts, ends)
+
+    def _block_ranges(self, span, blocks):
+        """
+        Get ranges of month blocks (months, quarters or years) `blocks`
+        blocks away from the block of each base date.
+
+        Argus:
+            span - months in a block: 1, 3 or 12
+            blocks - offset in blocks
+        """
+        np = get_numpy()
+        if np is not None:
+            months = self.bdates.astype('datetime64[M]').astype('int64')
+            first = months - months % span + span * blocks
+            starts = first.astype('datetime64[M]').astype('datetime64[D]')
+            ends = (first + span).astype('datetime64[M]') \
+                .astype('datetime64[D]') - np.timedelta64(1, 'D')
+            return (starts, ends)
+
+        starts, ends = [], []
+        for bdate in self.bdates:
+            index = get_month_index(bdate.year, bdate.month) + span * blocks
+            start, end = get_block_range(index, span)
+            starts.append(date.fromordinal(start))
+            ends.append(date.fromordinal(end))
+        return (starts, ends)
+
+    def relative_day(self, days=0):
+        """
+        Calcuate relative dates from self.bdates.
+        """
+        np = get_numpy()
+        if np is not None:
+            rdays = self.bdates + np.timedelta64(days, 'D')
+            return (rdays, rdays.copy())
+
+        rdays = [bdate + timedelta(days=days) for bdate in self.bdates]
+        return (rdays, list(rdays))
+
+    def base_day(self):
+        """
+        Get the ranges of self.bdates.
+        """
+        return self.relative_day(0)
+
+    def prev_day(self, days=1):
+        """
+        Get the ranges that n days before self.bdates.
+
+        Argus:
+            days - n days ago
+        """
+        return self.relative_day(days * -1)
+
+    def next_day(self, days=1):
+        """
+        Get the ranges that n days after self.bdates.
+
+        Argus:
+            days - next n days
+        """
+        return self.relative_day(days)
+
+    def relative_week(self, weeks=0):
+        """
+        Calcuate relative week ranges from self.bdates.
+        """
+        return self._week_ranges(weeks)
+
+    def base_week(self):
+        """
+        Get the ranges of the weeks that contain self.bdates.
+        """
+        return self.relative_week(0)
+
+    def prev_week(self, weeks=1):
+        """
+        Get the ranges that n weeks before self.bdates.
+
+        Argus:
+            weeks - n weeks ago
+        """
+        return self.relative_week(weeks * -1)
+
+    def next_week(self, weeks=1):
+        """
+        Get the ranges that n weeks after self.bdates.
+
+        Argus:
+            weeks - next n weeks
+        """
+        return self.relative_week(weeks)
+
+    def relative_month(self, months=0):
+        """
+        Calcuate relative month ranges from self.bdates.
+        """
+        return self._block_ranges(1, months)
+
+    def base_month(self):
+        """
+        Get the ranges of the months that contain self.bdates.
+        """
+        return self.relative_month(0)
+
+    def prev_month(self, months=1):
+        """
+        Get the ranges that n months before self.bdates.
+
+        Argus:
+            months - n months ago
+        """
+        return self.relative_month(months * -1)
+
+    def next_month(self, months=1):
+        """
+        Get the ranges that n months after self.bdates.
+
+        Argus:
+            months - next n months
+        """
+        return self.relative_month(months)
+
+    def relative_quarter(self, quarters=0):
+        """
+        Calcuate relative quarter ranges from self.bdates.
+        """
+        return self._block_ranges(3, quarters)
+
+    def base_quarter(self):
+        """
+        Get the ranges of the quarters that contain self.bdates.
+        """
+        return self.relative_quarter(0)
+
+    def prev_quarter(self, quarters=1):
+        """
+        Get the ranges that n quarters before self.bdates.
+
+        Argus:
+            quarters - n quarters ago
+        """
+        return self.relative_quarter(quarters * -1)
+
+    def next_quarter(self, quarters=1):
+        """
+        Get the ranges that n quarters after self.bdates.
+
+        Argus:
+            quarters - next n quarters
+        """
+        return self.relative_quarter(quarters)
+
+    def relative_year(self, years=0):
+        """
+        Calcuate relative year ranges from self.bdates.
+        """
+        return self._block_ranges(12, years)
+
+    def base_year(self):
+        """
+        Get the ranges of the years that contain self.bdates.
+        """
+        return self.relative_year(0)
+
+    def prev_year(self, years=1):
+        """
+        Get the ranges that n years before self.bdates.
+
+        Argus:
+            years - n years ago
+        """
+        return self.relative_year(years * -1)
+
+    def next_year(self, years=1):
+        """
+        Get the ranges that n years after self.bdates.
+
+        Argus:
+            years - next n years
+        """
+        return self.relative_year(years)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from hashlib import sha1
+
+from DateRanger.cache import LRUCache
+from DateRanger.cover import DEFAULT_GRANULARITIES
+from DateRanger.cover import get_cover
+from DateRanger.utils import get_quarter
+
+
+FINGERPRINT_VERSION = 1
+
+_missing = object()
+
+
+def get_block_key(piece):
+    """
+    Get a stable, human readable key of a CoverPiece, such as
+    'year:2015', 'quarter:2015-Q1', 'month:2015-01', 'week:2015-01-04' or
+    'day:2015-01-05'. Weeks are keyed by their Sunday.
+    """
+    start = piece.start_date
+    if piece.granularity == 'year':
+        return 'year:%04d' % start.year
+    if piece.granularity == 'quarter':
+        return 'quarter:%04d-Q%d' % (start.year, get_quarter(start.month))
+    if piece.granularity == 'month':
+        return 'month:%04d-%02d' % (start.year, start.month)
+    return '%s:%04d-%02d-%02d' % (piece.granularity, start.year,
+                                  start.month, start.day)
+
+
+def get_fingerprint(piece, namespace=''):
+    """
+    Get a sha1 hex digest of a CoverPiece. The namespace (e.g. a metric
+    name and its parameters) keeps results of different computations
+    apart; FINGERPRINT_VERSION is bumped if block keys ever change.
+    """
+    text = '%d|%s|%s' % (FINGERPRINT_VERSION, namespace,
+                         get_block_key(piece))
+    return sha1(text.encode('utf-8')).hexdigest()
+
+
+def get_blocks(frame, granularities=DEFAULT_GRANULARITIES):
+    """
+    Split a DateFrame into canonical aligned blocks. Every block is a
+    whole calendar unit of one of the granularities, so its key depends
+    only on the unit and not on the frame. A frame gets a unit's block
+    when the unit lies inside it and no coarser unit inside it contains
+    the unit; e.g. a frame over a whole quarter gets the quarter block,
+    not its month blocks. Overlapping frames share the results of the
+    blocks they have in common. See cover.get_cover().
+    """
+    return get_cover(frame, granularities)
+
+
+class BlockCache(object):
+
+    """
+    Compute a value of a DateFrame from per-block results, computing only
+    the blocks which are not in the store yet.
+
+    Example:
+        cache = BlockCache(count_events, sum, namespace='events')
+        cache.get(DateFrame(date(2015, 1, 1), date(2015, 3, 15)))
+    """
+
+    def __init__(self, compute, combine, store=None, namespace='',
+                 granularities=DEFAULT_GRANULARITIES):
+        """
+        Argus:
+            compute - a callable which takes (start_date, end_date) of a
+                      block and returns its result
+            combine - a callable which takes a list of block results in
+                      date order and returns the result of the frame
+            store - an LRUCache or any object with get() and put(), keyed
+                    by fingerprints; a new LRUCache by default
+            namespace - see get_fingerprint()
+            granularities - see cover.get_cover()
+        """
+        self.compute = compute
+        self.combine = combine
+        self.store = LRUCache() if store is None else store
+        self.namespace = namespace
+        self.granularities = granularities
+        self.hits = 0
+        self.misses = 0
+
+    def get_block(self, piece):
+        """
+        Return the result of one block, computing and storing it if needed.
+        """
+        fingerprint = get_fingerprint(piece, self.namespace)
+        value = self.store.get(fingerprint, _missing)
+        if value is _missing:
+            self.misses += 1
+            value = self.compute(piece.start_date, piece.end_date)
+            self.store.put(fingerprint, value)
+        else:
+            self.hits += 1
+        return value
+
+    def get(self, frame):
+        """
+        Return the combined result of all blocks of a DateFrame.
+        """
+        return self.combine([self.get_block(piece) for piece
+                             in get_blocks(frame, self.granularities)])
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from DateRanger.utils import EPOCH_ORDINAL
+from DateRanger.views import BlockSequence
+
+
+GRANULARITIES = ('day', 'week', 'month', 'quarter', 'year')
+
+
+def get_buckets(frame, granularity):
+    """
+    Get the lazy sequence of buckets of a DateFrame.
+
+    Argus:
+        frame - a DateFrame
+        granularity - 'day', 'week', 'month', 'quarter' or 'year'
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError('Unknown granularity: %r' % (granularity,))
+    return getattr(frame, 'each_' + granularity)()
+
+
+class Bucketer(object):
+
+    """
+    Assign dates to the buckets which DateFrame.each_<granularity>() yields,
+    without building the list of buckets. Bucket `n` is the n-th item of
+    the sequence. Dates outside the frame get index -1.
+
+    With NumPy installed, dates are converted to a datetime64[D] array
+    (datetime64 values of any unit are truncated to days) and results are
+    NumPy arrays. Otherwise results are lists.
+    """
+
+    def __init__(self, frame, granularity):
+        """
+        Argus:
+            frame - a DateFrame
+            granularity - 'day', 'week', 'month', 'quarter' or 'year'
+        """
+        self.frame = frame
+        self.granularity = granularity
+        self.buckets = get_buckets(frame, granularity)
+        self.first_day = frame.start_date.toordinal()
+        self.last_day = frame.end_date.toordinal()
+
+    def locate(self, day):
+        """
+        Get the bucket index of a date, or -1 if it is outside the frame.
+        """
+        if not self.first_day <= day.toordinal() <= self.last_day:
+            return -1
+        return self.buckets.locate(day)
+
+    def get_start(self, index):
+        """
+        Get the start date of the bucket at `index`.
+        """
+        bucket = self.buckets[index]
+        return bucket[0] if isinstance(bucket, tuple) else bucket
+
+    def indexes(self, dates):
+        """
+        Get the bucket index of each date, -1 for dates outside the frame.
+
+        Argus:
+            dates - datetime64 array or an iterable of dates
+        """
+        if np is not None:
+            return self._numpy_indexes(as_datetime64(dates))
+        return [self.locate(day) for day in dates]
+
+    def starts(self, dates):
+        """
+        Get the start date of the bucket of each date. Dates outside the
+        frame get NaT (NumPy) or None.
+
+        Argus:
+            dates - datetime64 array or an iterable of dates
+        """
+        if np is None:
+            return [None if index < 0 else self.get_start(index)
+                    for index in self.indexes(dates)]
+
+        indexes = self.indexes(dates)
+        keys = self.buckets.first + indexes * self.buckets.step
+        if isinstance(self.buckets, BlockSequence):
+            months = (keys - 1970 * 12).astype('datetime64[M]')
+            starts = months.astype('datetime64[D]')
+        else:
+            starts = (keys - EPOCH_ORDINAL).astype('datetime64[D]')
+        starts[indexes < 0] = np.datetime64('NaT')
+        return starts
+
+    def _numpy_indexes(self, days):
+        buckets = self.buckets
+        ordinals = days.astype(np.int64) + EPOCH_ORDINAL
+        if isinstance(buckets, BlockSequence):
+            keys = days.astype('datetime64[M]').astype(np.int64) + 1970 * 12
+        else:
+            keys = ordinals
+        indexes = (keys - buckets.first) // buckets.step
+        outside = np.isnat(days) | \
+            (ordinals < self.first_day) | (ordinals > self.last_day) | \
+            (indexes < 0) | (indexes >= buckets.length) | \
+            (keys >= buckets.first + indexes * buckets.step + buckets.width)
+        indexes[outside] = -1
+        return indexes
+
+
+def as_datetime64(dates):
+    """
+    Convert dates to a datetime64[D] array.
+    """
+    if isinstance(dates, np.ndarray):
+        return dates.astype('datetime64[D]')
+    return np.asarray(list(dates), dtype='datetime64[D]')
+
+
+def bucket_indexes(frame, granularity, dates):
+    """
+    Get the bucket index of each date. See Bucketer.indexes().
+    """
+    return Bucketer(frame, granularity).indexes(dates)
+
+
+def bucket_starts(frame, granularity, dates):
+    """
+    Get the start date of the bucket of each date. See Bucketer.starts().
+    """
+    return Bucketer(frame, granularity).starts(dates)
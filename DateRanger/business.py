@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from array import array
+from datetime import date
+
+from DateRanger.utils import EPOCH_ORDINAL
+from DateRanger.utils import get_numpy
+from DateRanger.views import PeriodSequence
+from DateRanger.exceptions import OutOfCalendarRange
+
+
+DEFAULT_CALENDAR = 'default'
+
+_calendars = {}
+
+
+class BusinessCalendar(object):
+
+    """
+    Working days of one region: days which are not weekend days and not
+    holidays, from January 1st of `first_year` to December 31st of
+    `last_year`.
+
+    The calendar keeps a bitmap of working days, prefix sums over it and
+    the ordinals of all working days, so counting working days, adding N
+    working days and checking a date are O(1).
+    """
+
+    def __init__(self, holidays=(), weekend=(5, 6), first_year=1970,
+                 last_year=2100):
+        """
+        Argus:
+            holidays - an iterable of dates
+            weekend - weekdays (date.weekday()) which are not working days
+            first_year - the first year of the calendar
+            last_year - the last year of the calendar
+        """
+        self.first = date(first_year, 1, 1).toordinal()
+        self.last = date(last_year, 12, 31).toordinal()
+        self.weekend = frozenset(weekend)
+        self.holidays = frozenset(day.toordinal() for day in holidays)
+
+        size = self.last - self.first + 1
+        self.bitmap = bytearray((size + 7) // 8)
+        self.prefix = array('i', [0])
+        self.days = array('i')
+        for offset in range(size):
+            ordinal = self.first + offset
+            if (ordinal + 6) % 7 not in self.weekend and \
+                    ordinal not in self.holidays:
+                self.bitmap[offset >> 3] |= 1 << (offset & 7)
+                self.days.append(ordinal)
+            self.prefix.append(len(self.days))
+
+    def _offset(self, day):
+        """
+        Get the offset of a date in the calendar.
+        """
+        ordinal = day.toordinal()
+        if not self.first <= ordinal <= self.last:
+            raise OutOfCalendarRange(day)
+        return ordinal - self.first
+
+    def is_business_day(self, day):
+        """
+        Determine whether the date is a working day.
+        """
+        offset = self._offset(day)
+        return bool(self.bitmap[offset >> 3] & (1 << (offset & 7)))
+
+    def count(self, start_date, end_date):
+        """
+        Count working days from start_date to end_date, both included.
+        """
+        return self.prefix[self._offset(end_date) + 1] - \
+            self.prefix[self._offset(start_date)]
+
+    def add_business_days(self, day, days):
+        """
+        Get the date `days` working days after (or before, if negative) the
+        date. With days == 0, the date itself is returned if it is a working
+        day, otherwise the next working day.
+        """
+        offset = self._offset(day)
+        if days > 0:
+            position = self.prefix[offset + 1] + days - 1
+        elif days < 0:
+            position = self.prefix[offset] + days
+        else:
+            position = self.prefix[offset]
+        if not 0 <= position < len(self.days):
+            raise OutOfCalendarRange(day)
+        return date.fromordinal(self.days[position])
+
+    def each_business_day(self, start_date, end_date):
+        """
+        Return a lazy sequence of working days from start_date to end_date.
+        """
+        first = self.prefix[self._offset(start_date)]
+        last = self.prefix[self._offset(end_date) + 1]
+        return BusinessDaySequence(self, first, last - first)
+
+
+class BusinessDaySequence(PeriodSequence):
+
+    """
+    A lazy sequence of working days of a BusinessCalendar. Keys are
+    positions in calendar.days.
+    """
+
+    def __init__(self, calendar, first, length, step=1):
+        """
+        Argus:
+            calendar - a BusinessCalendar
+            first - position of the first working day
+            length - number of working days
+            step - difference between positions of adjacent items
+        """
+        super(BusinessDaySequence, self).__init__(first, length, step)
+        self.calendar = calendar
+
+    def replace(self, first, length, step):
+        return self.__class__(self.calendar, first, length, step)
+
+    def locate(self, day):
+        if self.get_key(day) is None:
+            return -1
+        return super(BusinessDaySequence, self).locate(day)
+
+    def make_item(self, key):
+        return date.fromordinal(self.calendar.days[key])
+
+    def get_key(self, item):
+        if not isinstance(item, date):
+            return None
+        try:
+            if not self.calendar.is_business_day(item):
+                return None
+        except OutOfCalendarRange:
+            return None
+        return self.get_date_key(item)
+
+    def get_date_key(self, day):
+        return self.calendar.prefix[self.calendar._offset(day)]
+
+    def get_ordinal_range(self, key):
+        ordinal = self.calendar.days[key]
+        return (ordinal, ordinal)
+
+    def _columns(self):
+        days = self.calendar.days
+        stop = self.first + self.length * self.step
+        starts = [date.fromordinal(days[key])
+                  for key in range(self.first, stop, self.step)]
+        return (starts, list(starts))
+
+    def _numpy_columns(self, keys):
+        np = get_numpy()
+        ordinals = np.asarray(self.calendar.days, dtype=np.int32)[keys]
+        starts = (ordinals.astype(np.int64) - EPOCH_ORDINAL).astype(
+            'datetime64[D]')
+        return (starts, starts.copy())
+
+
+def register_calendar(name, calendar):
+    """
+    Register a BusinessCalendar under a name.
+    """
+    _calendars[name] = calendar
+
+
+def get_calendar(calendar=None):
+    """
+    Get a BusinessCalendar by name. BusinessCalendar objects are returned
+    as they are. None means the 'default' calendar, which is Monday to
+    Friday without holidays unless another one is registered.
+    """
+    if isinstance(calendar, BusinessCalendar):
+        return calendar
+    if calendar is None:
+        calendar = DEFAULT_CALENDAR
+        if calendar not in _calendars:
+            register_calendar(calendar, BusinessCalendar())
+    try:
+        return _calendars[calendar]
+    except KeyError:
+        raise ValueError('Unknown business calendar: %r' % (calendar,))
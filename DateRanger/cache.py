@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from collections import namedtuple
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+
+
+DEFAULT_MAXSIZE = 1024
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+_caches = {}
+_settings = {'enabled': True, 'maxsize': DEFAULT_MAXSIZE}
+_missing = object()
+
+
+class LRUCache(object):
+
+    """
+    A thread-safe cache which keeps at most `maxsize` entries and evicts
+    the least recently used one.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        """
+        Argus:
+            maxsize - max number of entries
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """
+        Get the value of `key` and mark it as recently used. Hits do not
+        take the lock: reads and moves of single entries are atomic, and
+        the statistics may miss a few concurrent hits.
+        """
+        value = self._data.get(key, _missing)
+        if value is _missing:
+            self.misses += 1
+            return default
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            # evicted by another thread in the meantime
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Store `value` under `key`, evicting old entries if needed.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize):
+        """
+        Change the max number of entries.
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all entries and reset statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        Return a CacheInfo of this cache.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+
+def memoize(name, key):
+    """
+    Decorator which memoizes a function in the process-wide cache `name`.
+
+    Argus:
+        name - name of the cache, used by cache_info()
+        key - a function which takes the same arguments as the decorated
+              function and returns a hashable key
+    """
+    cache = _caches.setdefault(name, LRUCache(_settings['maxsize']))
+    get = cache.get
+    put = cache.put
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _settings['enabled']:
+                return func(*args, **kwargs)
+            cache_key = key(*args, **kwargs)
+            value = get(cache_key, _missing)
+            if value is _missing:
+                value = func(*args, **kwargs)
+                put(cache_key, value)
+            return value
+        return wrapper
+    return decorator
+
+
+def configure(maxsize=None, enabled=None):
+    """
+    Configure all caches.
+
+    Argus:
+        maxsize - max number of entries of each cache
+        enabled - turn caching on or off
+    """
+    if maxsize is not None:
+        _settings['maxsize'] = maxsize
+        for cache in _caches.values():
+            cache.resize(maxsize)
+    if enabled is not None:
+        _settings['enabled'] = enabled
+
+
+def is_enabled():
+    """
+    Determine whether caching is turned on.
+    """
+    return _settings['enabled']
+
+
+def cache_info():
+    """
+    Return a dict which maps the name of each cache to its CacheInfo.
+    """
+    return dict((name, cache.info()) for name, cache in _caches.items())
+
+
+def cache_clear():
+    """
+    Remove all entries from all caches and reset statistics.
+    """
+    for cache in _caches.values():
+        cache.clear()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from collections import namedtuple
+from datetime import date
+
+from DateRanger.utils import get_month_index
+from DateRanger.utils import get_block_range
+
+
+LEVELS = ('year', 'quarter', 'month', 'week', 'day')
+
+DEFAULT_GRANULARITIES = ('year', 'month', 'day')
+
+# months in a block of each month-based level
+_MONTH_SPANS = {'year': 12, 'quarter': 3, 'month': 1}
+
+CoverPiece = namedtuple('CoverPiece', ['granularity', 'start_date',
+                                       'end_date'])
+
+
+def check_granularities(granularities):
+    """
+    Validate granularities of a cover and return them as a tuple ending
+    with 'day'.
+    """
+    granularities = tuple(granularities)
+    for level in granularities:
+        if level not in LEVELS:
+            raise ValueError('Unknown granularity: %r' % (level,))
+    order = [LEVELS.index(level) for level in granularities]
+    if order != sorted(set(order)):
+        raise ValueError('Granularities must go from coarse to fine: %r' %
+                         (granularities,))
+    if not granularities or granularities[-1] != 'day':
+        granularities += ('day',)
+    return granularities
+
+
+def _get_units(first, last, level):
+    """
+    Get (start, end) ordinals of whole units of the level inside
+    [first, last].
+    """
+    if level == 'day':
+        return [(ordinal, ordinal) for ordinal in range(first, last + 1)]
+
+    if level == 'week':
+        # weeks start on Sunday; ordinal % 7 == 0 is a Sunday
+        start = first + (-first) % 7
+        return [(ordinal, ordinal + 6)
+                for ordinal in range(start, last - 5, 7)]
+
+    span = _MONTH_SPANS[level]
+    day = date.fromordinal(first)
+    index = get_month_index(day.year, day.month)
+    index -= index % span
+    if get_block_range(index, span)[0] < first:
+        index += span
+    units = []
+    while True:
+        start, end = get_block_range(index, span)
+        if end > last:
+            return units
+        units.append((start, end))
+        index += span
+
+
+def _cover(first, last, levels, pieces):
+    if first > last:
+        return
+    units = _get_units(first, last, levels[0])
+    if not units:
+        _cover(first, last, levels[1:], pieces)
+        return
+    _cover(first, units[0][0] - 1, levels[1:], pieces)
+    for start, end in units:
+        pieces.append(CoverPiece(levels[0], date.fromordinal(start),
+                                 date.fromordinal(end)))
+    _cover(units[-1][1] + 1, last, levels[1:], pieces)
+
+
+def get_cover(frame, granularities=DEFAULT_GRANULARITIES):
+    """
+    Split a DateFrame into the fewest calendar-aligned pieces: whole years
+    first, then whole quarters/months/weeks, then leftover days. Both
+    start_date and end_date are covered. Pieces are in date order.
+
+    Argus:
+        frame - a DateFrame
+        granularities - levels to use, from coarse to fine. 'day' is
+                        always added.
+    """
+    levels = check_granularities(granularities)
+    pieces = []
+    _cover(frame.start_date.toordinal(), frame.end_date.toordinal(),
+           levels, pieces)
+    return pieces
+
+
+class PartitionFormatter(object):
+
+    """
+    Turn cover pieces into partition keys with strftime templates.
+    Quarters are expanded to their months and weeks to their days.
+
+    Example:
+        PartitionFormatter() gives 'year=2014', 'year=2014/month=11' and
+        'year=2014/month=11/day=05'. PartitionFormatter(suffix='/*') gives
+        glob patterns such as 'year=2014/*'.
+    """
+
+    def __init__(self, year='year=%Y', month='year=%Y/month=%m',
+                 day='year=%Y/month=%m/day=%d', suffix=''):
+        """
+        Argus:
+            year - template of year partitions
+            month - template of month partitions
+            day - template of day partitions
+            suffix - string appended to every key
+        """
+        self.year = year
+        self.month = month
+        self.day = day
+        self.suffix = suffix
+
+    def __call__(self, piece):
+        """
+        Return a list of partition keys of a CoverPiece.
+        """
+        start = piece.start_date
+        if piece.granularity == 'year':
+            keys = [start.strftime(self.year)]
+        elif piece.granularity == 'quarter':
+            keys = [date(start.year, start.month + n, 1).strftime(self.month)
+                    for n in range(3)]
+        elif piece.granularity == 'month':
+            keys = [start.strftime(self.month)]
+        else:
+            first = start.toordinal()
+            keys = [date.fromordinal(ordinal).strftime(self.day) for ordinal
+                    in range(first, piece.end_date.toordinal() + 1)]
+        return [key + self.suffix for key in keys]
+
+
+def get_partition_keys(frame, formatter=None,
+                       granularities=DEFAULT_GRANULARITIES):
+    """
+    Return partition keys of the minimal cover of a DateFrame.
+
+    Argus:
+        frame - a DateFrame
+        formatter - a callable which takes a CoverPiece and returns a list
+                    of keys, PartitionFormatter() by default
+        granularities - see get_cover()
+    """
+    formatter = formatter or PartitionFormatter()
+    keys = []
+    for piece in get_cover(frame, granularities):
+        keys.extend(formatter(piece))
+    return keys
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from datetime import date
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from DateRanger.bucket import Bucketer
+from DateRanger.bucket import as_datetime64
+from DateRanger.objects import DateFrame
+
+
+# number of dates converted to an array at a time with NumPy
+CHUNK_SIZE = 1 << 16
+
+
+class CoverageAnalyzer(object):
+
+    """
+    Track which buckets of DateFrame.each_<granularity>() have data, one
+    bit per bucket, so a 100-year daily frame takes about 4.5 KB however
+    many dates are added. Dates outside the frame are counted and
+    otherwise ignored.
+
+    Example:
+        analyzer = CoverageAnalyzer(frame, 'day')
+        analyzer.update(record_dates)
+        analyzer.ratio()      # share of days with data
+        analyzer.missing()    # DateFrames of days without data
+    """
+
+    def __init__(self, frame, granularity='day'):
+        """
+        Argus:
+            frame - a DateFrame
+            granularity - 'day', 'week', 'month', 'quarter' or 'year'
+        """
+        self.bucketer = Bucketer(frame, granularity)
+        self.frame = frame
+        self.granularity = granularity
+        self.length = len(self.bucketer.buckets)
+        self.bitmap = bytearray((self.length + 7) // 8)
+        self.outside = 0
+
+    def mark(self, index):
+        """
+        Mark the bucket at `index` as covered.
+        """
+        self.bitmap[index >> 3] |= 1 << (index & 7)
+
+    def is_covered(self, index):
+        """
+        Determine whether the bucket at `index` has data.
+        """
+        return bool(self.bitmap[index >> 3] >> (index & 7) & 1)
+
+    def add(self, day):
+        """
+        Add one date. Returns False if it is outside the frame.
+        """
+        index = self.bucketer.locate(day)
+        if index < 0:
+            self.outside += 1
+            return False
+        self.mark(index)
+        return True
+
+    def update(self, dates):
+        """
+        Add many dates, sorted or not. Iterables are consumed as a stream,
+        so they may be larger than memory.
+
+        Argus:
+            dates - datetime64 array or an iterable of dates
+        """
+        if np is None:
+            if hasattr(dates, 'astype'):
+                # a datetime64 array, converted to dates a chunk at a time
+                for start in range(0, len(dates), CHUNK_SIZE):
+                    chunk = dates[start:start + CHUNK_SIZE]
+                    self._update(chunk.astype('datetime64[D]').tolist())
+                return
+            return self._update(dates)
+        if isinstance(dates, np.ndarray):
+            for start in range(0, len(dates), CHUNK_SIZE):
+                self._numpy_update(dates[start:start + CHUNK_SIZE])
+            return
+        dates = iter(dates)
+        while True:
+            chunk = list(islice(dates, CHUNK_SIZE))
+            if not chunk:
+                break
+            self._numpy_update(chunk)
+
+    def _update(self, dates):
+        previous = None
+        for day in dates:
+            # sorted streams repeat dates, which are already marked
+            if day != previous:
+                self.add(day)
+                previous = day
+            elif not self.bucketer.first_day <= day.toordinal() <= \
+                    self.bucketer.last_day:
+                self.outside += 1
+
+    def _numpy_update(self, dates):
+        indexes = self.bucketer.indexes(as_datetime64(dates))
+        inside = indexes[indexes >= 0]
+        self.outside += len(indexes) - len(inside)
+        bits = np.frombuffer(self.bitmap, dtype=np.uint8)
+        np.bitwise_or.at(bits, inside >> 3,
+                         np.left_shift(1, inside & 7).astype(np.uint8))
+
+    def count(self):
+        """
+        Count buckets which have data.
+        """
+        return bin(int.from_bytes(self.bitmap, 'little')).count('1')
+
+    def ratio(self):
+        """
+        Return the share of buckets which have data, 0.0 ~ 1.0.
+        """
+        return self.count() / float(self.length)
+
+    def missing_runs(self):
+        """
+        Return a list of (first, last) bucket indexes of runs of buckets
+        without data.
+        """
+        runs = []
+        start = None
+        for position, byte in enumerate(self.bitmap):
+            if byte == 0xff and start is None:
+                continue
+            if byte == 0 and start is not None:
+                continue
+            for index in range(position * 8,
+                               min(position * 8 + 8, self.length)):
+                if byte >> (index & 7) & 1:
+                    if start is not None:
+                        runs.append((start, index - 1))
+                        start = None
+                elif start is None:
+                    start = index
+        if start is not None:
+            runs.append((start, self.length - 1))
+        return runs
+
+    def missing(self):
+        """
+        Return a list of DateFrames of merged runs of buckets without data,
+        limited to the frame.
+        """
+        buckets = self.bucketer.buckets
+        frames = []
+        for first, last in self.missing_runs():
+            start, _ = buckets.get_ordinal_range(
+                buckets.first + first * buckets.step)
+            _, end = buckets.get_ordinal_range(
+                buckets.first + last * buckets.step)
+            start = max(start, self.bucketer.first_day)
+            end = min(end, self.bucketer.last_day)
+            frames.append(DateFrame(date.fromordinal(start),
+                                    date.fromordinal(end)))
+        return frames
+
+
+def find_gaps(frame, dates, granularity='day'):
+    """
+    Get DateFrames of runs of buckets without any of the dates. See
+    CoverageAnalyzer.
+    """
+    analyzer = CoverageAnalyzer(frame, granularity)
+    analyzer.update(dates)
+    return analyzer.missing()
@@ -9,3 +9,9 @@ class InvalidMonth(Exception): pass
 
 
 class InvalidQuarter(Exception): pass
+
+
+class OutOfCalendarRange(Exception): pass
+
+
+class InvalidExpression(Exception): pass
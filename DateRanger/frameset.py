@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from bisect import bisect_right
+from datetime import date
+
+from DateRanger.objects import DateFrame
+
+
+def _normalize(intervals):
+    """
+    Sort (start, end) ordinal pairs and merge overlapping or adjacent ones.
+    """
+    starts, ends = [], []
+    for start, end in sorted(intervals):
+        if ends and start <= ends[-1] + 1:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+class DateFrameSet(object):
+
+    """
+    A set of days stored as sorted, disjoint DateFrames. Both start_date
+    and end_date of a frame are covered, like DateFrame.each_day().
+
+    Overlapping and adjacent frames are merged. Union, intersection and
+    difference are linear sweeps over the two sorted lists, and membership
+    tests are binary searches.
+    """
+
+    def __init__(self, frames=()):
+        """
+        Argus:
+            frames - an iterable of DateFrames
+        """
+        self.starts, self.ends = _normalize(
+            (frame.start_date.toordinal(), frame.end_date.toordinal())
+            for frame in frames)
+
+    @classmethod
+    def from_ordinals(cls, intervals):
+        """
+        Build a DateFrameSet from (start, end) ordinal pairs.
+        """
+        obj = cls()
+        obj.starts, obj.ends = _normalize(intervals)
+        return obj
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        for start, end in zip(self.starts, self.ends):
+            yield DateFrame(date.fromordinal(start), date.fromordinal(end))
+
+    def __bool__(self):
+        return bool(self.starts)
+
+    def __eq__(self, other):
+        if not isinstance(other, DateFrameSet):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __ne__(self, other):
+        if not isinstance(other, DateFrameSet):
+            return NotImplemented
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.frames())
+
+    def __contains__(self, item):
+        """
+        Determine whether a date, or every day of a DateFrame, is covered.
+        """
+        if isinstance(item, DateFrame):
+            start = item.start_date.toordinal()
+            end = item.end_date.toordinal()
+        else:
+            start = end = item.toordinal()
+        index = bisect_right(self.starts, start) - 1
+        return index >= 0 and end <= self.ends[index]
+
+    def frames(self):
+        """
+        Return a list of disjoint DateFrames in order.
+        """
+        return list(self)
+
+    def days(self):
+        """
+        Return number of covered days.
+        """
+        return sum(end - start + 1 for start, end
+                   in zip(self.starts, self.ends))
+
+    def union(self, other):
+        """
+        Return days covered by either set.
+        """
+        return self.from_ordinals(
+            list(zip(self.starts, self.ends)) +
+            list(zip(other.starts, other.ends)))
+
+    def intersection(self, other):
+        """
+        Return days covered by both sets.
+        """
+        result = []
+        i, j = 0, 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+            if start <= end:
+                result.append((start, end))
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return self.from_ordinals(result)
+
+    def difference(self, other):
+        """
+        Return days covered by this set but not by `other`.
+        """
+        result = []
+        j = 0
+        for start, end in zip(self.starts, self.ends):
+            while j < len(other.starts) and other.ends[j] < start:
+                j += 1
+            k = j
+            while k < len(other.starts) and other.starts[k] <= end:
+                if other.starts[k] > start:
+                    result.append((start, other.starts[k] - 1))
+                start = max(start, other.ends[k] + 1)
+                k += 1
+            if start <= end:
+                result.append((start, end))
+        return self.from_ordinals(result)
+
+    def complement(self, frame):
+        """
+        Return days of `frame` which are not covered by this set.
+
+        Argus:
+            frame - the bounding DateFrame
+        """
+        return DateFrameSet([frame]).difference(self)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from bisect import bisect_right
+from collections import Counter
+
+
+class _Node(object):
+
+    """
+    A node of a centered interval tree. It keeps entries which contain
+    `center`, sorted by start and by end (descending).
+    """
+
+    __slots__ = ('center', 'by_start', 'start_keys', 'by_end', 'end_keys',
+                 'left', 'right')
+
+    def __init__(self, entries):
+        middles = sorted((start + end) // 2 for start, end, _ in entries)
+        self.center = center = middles[len(middles) // 2]
+        here, left, right = [], [], []
+        for entry in entries:
+            if entry[1] < center:
+                left.append(entry)
+            elif entry[0] > center:
+                right.append(entry)
+            else:
+                here.append(entry)
+
+        self.by_start = sorted(here, key=lambda entry: entry[0])
+        self.start_keys = [entry[0] for entry in self.by_start]
+        self.by_end = sorted(here, key=lambda entry: -entry[1])
+        self.end_keys = [-entry[1] for entry in self.by_end]
+        self.left = _Node(left) if left else None
+        self.right = _Node(right) if right else None
+
+    def stab(self, point, result):
+        """
+        Append entries which contain `point` to `result`.
+        """
+        node = self
+        while node is not None:
+            if point < node.center:
+                count = bisect_right(node.start_keys, point)
+                result.extend(node.by_start[:count])
+                node = node.left
+            elif point > node.center:
+                count = bisect_right(node.end_keys, -point)
+                result.extend(node.by_end[:count])
+                node = node.right
+            else:
+                result.extend(node.by_start)
+                break
+
+
+class FrameIndex(object):
+
+    """
+    An index over DateFrames for stabbing queries (frames which contain a
+    date) and overlap queries (frames which intersect another frame). Both
+    start_date and end_date of a frame are covered.
+
+    Frames are kept in a centered interval tree and a list sorted by start,
+    so queries cost O(log n + k). Inserts and removals are buffered and the
+    tree is rebuilt once the buffer grows past about sqrt(n) entries.
+    The index is a multiset: a frame inserted twice is reported twice.
+    """
+
+    MIN_BUFFER = 64
+
+    def __init__(self, frames=()):
+        """
+        Argus:
+            frames - an iterable of DateFrames for bulk build
+        """
+        self._counts = Counter()
+        self._entries = []
+        self._pending = []
+        self._removed = Counter()
+        self._tree = None
+        self._starts = []
+        self._by_start = []
+        for frame in frames:
+            self._counts[frame] += 1
+            self._entries.append(self._make_entry(frame))
+        self._build()
+
+    @staticmethod
+    def _make_entry(frame):
+        return (frame.start_date.toordinal(), frame.end_date.toordinal(),
+                frame)
+
+    def _build(self):
+        """
+        Rebuild the tree from live entries.
+        """
+        entries = []
+        removed = self._removed
+        for entry in self._entries + self._pending:
+            if removed[entry[2]]:
+                removed[entry[2]] -= 1
+            else:
+                entries.append(entry)
+        self._entries = entries
+        self._pending = []
+        self._removed = Counter()
+        self._tree = _Node(entries) if entries else None
+        self._by_start = sorted(entries, key=lambda entry: entry[0])
+        self._starts = [entry[0] for entry in self._by_start]
+
+    def _maybe_build(self):
+        dirty = len(self._pending) + sum(self._removed.values())
+        if dirty > max(self.MIN_BUFFER, int(len(self._entries) ** 0.5)):
+            self._build()
+
+    def __len__(self):
+        return sum(self._counts.values())
+
+    def __contains__(self, frame):
+        return self._counts[frame] > 0
+
+    def insert(self, frame):
+        """
+        Add a DateFrame to the index.
+        """
+        self._counts[frame] += 1
+        self._pending.append(self._make_entry(frame))
+        self._maybe_build()
+
+    def remove(self, frame):
+        """
+        Remove one occurrence of a DateFrame from the index.
+        """
+        if self._counts[frame] <= 0:
+            raise KeyError(frame)
+        self._counts[frame] -= 1
+        for n, entry in enumerate(self._pending):
+            if entry[2] == frame:
+                del self._pending[n]
+                return
+        self._removed[frame] += 1
+        self._maybe_build()
+
+    def _finish(self, entries):
+        """
+        Drop removed entries and return frames.
+        """
+        if not self._removed:
+            return [entry[2] for entry in entries]
+
+        skipped = Counter()
+        result = []
+        for entry in entries:
+            frame = entry[2]
+            if skipped[frame] < self._removed[frame]:
+                skipped[frame] += 1
+            else:
+                result.append(frame)
+        return result
+
+    def stab(self, day):
+        """
+        Return frames which contain the date.
+        """
+        point = day.toordinal()
+        entries = []
+        if self._tree is not None:
+            self._tree.stab(point, entries)
+        entries.extend(entry for entry in self._pending
+                       if entry[0] <= point <= entry[1])
+        return self._finish(entries)
+
+    def stab_many(self, days):
+        """
+        Return a list of frames which contain each date.
+        """
+        days = list(days)
+        results = {}
+        for day in days:
+            if day not in results:
+                results[day] = self.stab(day)
+        return [list(results[day]) for day in days]
+
+    def overlap(self, frame):
+        """
+        Return frames which share at least one day with the frame.
+        """
+        first = frame.start_date.toordinal()
+        last = frame.end_date.toordinal()
+        entries = []
+        if self._tree is not None:
+            self._tree.stab(first, entries)
+        low = bisect_right(self._starts, first)
+        high = bisect_right(self._starts, last)
+        entries.extend(self._by_start[low:high])
+        entries.extend(entry for entry in self._pending
+                       if entry[0] <= last and entry[1] >= first)
+        return self._finish(entries)
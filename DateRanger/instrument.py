@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import random
+import time
+from collections import namedtuple
+from functools import wraps
+from threading import Lock
+from types import FunctionType
+
+from DateRanger import DateRanger
+from DateRanger import DateFrame
+
+
+DEFAULT_RESERVOIR_SIZE = 1024
+
+INSTRUMENTED_CLASSES = (DateRanger, DateFrame)
+
+MethodSnapshot = namedtuple('MethodSnapshot', [
+    'calls', 'total', 'mean', 'p50', 'p90', 'p99', 'max', 'items'])
+
+_clock = time.perf_counter
+_lock = Lock()
+_stats = {}
+_originals = {}
+_settings = {'callback': None, 'reservoir_size': DEFAULT_RESERVOIR_SIZE}
+
+
+class MethodStats(object):
+
+    """
+    Statistics of one method. Latencies are kept in a fixed-size random
+    sample (reservoir sampling), so percentiles cost O(1) memory.
+    """
+
+    __slots__ = ('calls', 'total', 'max', 'items', 'samples', 'size')
+
+    def __init__(self, size=DEFAULT_RESERVOIR_SIZE):
+        """
+        Argus:
+            size - max number of sampled latencies
+        """
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.items = 0
+        self.samples = []
+        self.size = size
+
+    def add(self, elapsed, length=None):
+        """
+        Record one call which took `elapsed` seconds and returned `length`
+        items (None if the result has no length).
+        """
+        self.calls += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        if length is not None:
+            self.items += length
+        if len(self.samples) < self.size:
+            self.samples.append(elapsed)
+        else:
+            n = random.randrange(self.calls)
+            if n < self.size:
+                self.samples[n] = elapsed
+
+    def snapshot(self):
+        """
+        Return a MethodSnapshot. Times are in seconds.
+        """
+        samples = sorted(self.samples)
+
+        def percentile(p):
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+        mean = self.total / self.calls if self.calls else 0.0
+        return MethodSnapshot(self.calls, self.total, mean,
+                              percentile(0.5), percentile(0.9),
+                              percentile(0.99), self.max, self.items)
+
+
+def _record(name, elapsed, length):
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = MethodStats(_settings['reservoir_size'])
+        stats.add(elapsed, length)
+    callback = _settings['callback']
+    if callback is not None:
+        callback(name, elapsed, length)
+
+
+def _add_items(name, length):
+    with _lock:
+        stats = _stats.get(name)
+        if stats is not None:
+            stats.items += length
+
+
+def _count_items(name, iterator):
+    """
+    Yield the items of an each_* iterator and add their number to the
+    statistics of the method when the caller is done with it (exhausted,
+    closed or collected). Periods of (starts, ends) batches of chunk_size
+    are counted one by one.
+    """
+    length = 0
+    try:
+        for item in iterator:
+            if isinstance(item, tuple) and hasattr(item[0], '__len__'):
+                length += len(item[0])
+            else:
+                length += 1
+            yield item
+    finally:
+        _add_items(name, length)
+
+
+def _instrument(name, func):
+    """
+    Wrap a method to record its latency. Lengths of results are recorded
+    for each_* methods. Calls which return iterators (e.g. with
+    chunk_size) are recorded right away, without a length; their items
+    are counted as they are consumed.
+    """
+    count_items = name.rsplit('.', 1)[-1].startswith('each_')
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = _clock()
+        result = func(*args, **kwargs)
+        elapsed = _clock() - start
+        length = None
+        if count_items and hasattr(result, '__len__'):
+            length = len(result)
+        elif count_items and iter(result) is result:
+            _record(name, elapsed, None)
+            return _count_items(name, result)
+        _record(name, elapsed, length)
+        return result
+    return wrapper
+
+
+def enable(callback=None, reservoir_size=DEFAULT_RESERVOIR_SIZE):
+    """
+    Start instrumenting public methods of DateRanger and DateFrame. The
+    methods are wrapped only while instrumentation is on; disable() puts
+    the original methods back, so there is no cost when it is off.
+
+    Argus:
+        callback - a callable which is called as callback(name, elapsed,
+                   length) after each call, e.g. to export metrics.
+                   `length` is the number of items of each_* results and
+                   None for other methods and for iterators, whose items
+                   are only added to the statistics.
+        reservoir_size - number of latencies sampled per method
+    """
+    with _lock:
+        _settings.update(callback=callback, reservoir_size=reservoir_size)
+        if _originals:
+            return
+        for cls in INSTRUMENTED_CLASSES:
+            for attr, func in list(vars(cls).items()):
+                if attr.startswith('_') or \
+                        not isinstance(func, FunctionType):
+                    continue
+                name = '%s.%s' % (cls.__name__, attr)
+                _originals[name] = (cls, attr, func)
+                setattr(cls, attr, _instrument(name, func))
+
+
+def disable():
+    """
+    Stop instrumenting and restore the original methods. Collected
+    statistics are kept until reset().
+    """
+    with _lock:
+        for cls, attr, func in _originals.values():
+            setattr(cls, attr, func)
+        _originals.clear()
+        _settings['callback'] = None
+
+
+def is_enabled():
+    """
+    Determine whether instrumentation is on.
+    """
+    return bool(_originals)
+
+
+def snapshot():
+    """
+    Return a dict of method name ('DateRanger.base_week') and
+    MethodSnapshot of every method called since the last reset().
+    """
+    with _lock:
+        return dict((name, stats.snapshot())
+                    for name, stats in _stats.items())
+
+
+def reset():
+    """
+    Drop all collected statistics.
+    """
+    with _lock:
+        _stats.clear()
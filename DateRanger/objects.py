@@ -1,21 +1,55 @@
 #! /usr/bin/env python
 # -*- coding: utf-8 -*-
-import calendar
+from array import array
 from datetime import date
 from datetime import timedelta
+from functools import total_ordering
+from weakref import WeakValueDictionary
 
-from DateRanger.utils import get_quarter
-from DateRanger.utils import get_monthrange
+from DateRanger.utils import EPOCH_ORDINAL
+from DateRanger.utils import get_numpy
+from DateRanger.utils import get_week_start
+from DateRanger.utils import get_month_index
+from DateRanger.utils import count_weekday
+from DateRanger.utils import count_day_of_month
+from DateRanger.utils import count_month_ends
+from DateRanger.views import DaySequence
+from DateRanger.views import WeekSequence
+from DateRanger.views import MonthSequence
+from DateRanger.views import QuarterSequence
+from DateRanger.views import YearSequence
+from DateRanger.business import get_calendar
+from DateRanger.window import each_window
+from DateRanger.window import rolling
+from DateRanger.cover import DEFAULT_GRANULARITIES
+from DateRanger.cover import get_cover
+from DateRanger.cover import get_partition_keys
 from DateRanger.exceptions import InvalidDateRange
 
 
+def _chunked(periods, chunk_size, numpy):
+    """
+    Return the lazy sequence `periods`, or its (starts, ends) batches of
+    `chunk_size` periods (see PeriodSequence.chunks()).
+    """
+    if chunk_size is None:
+        return periods
+    return periods.chunks(chunk_size, numpy)
+
+
+@total_ordering
 class DateFrame(object):
 
     """
     An object for operations(get difference/yield date range) of date range.
     All methods do not include end_date.
+
+    DateFrame is immutable. Frames compare and hash by (start_date, end_date),
+    so they can be used as dict keys or in sets.
     """
 
+    __slots__ = ('start_date', 'end_date', '__weakref__')
+
     def __init__(self, start_date, end_date):
         """
         Argus:
@@ -25,8 +59,39 @@ class DateFrame(object):
         if start_date > end_date:
             raise InvalidDateRange()
 
-        self.start_date = start_date
-        self.end_date = end_date
+        _set_start_date(self, start_date)
+        _set_end_date(self, end_date)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('DateFrame is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('DateFrame is immutable')
+
+    def __reduce__(self):
+        return (self.__class__, (self.start_date, self.end_date))
+
+    def __eq__(self, other):
+        if not isinstance(other, DateFrame):
+            return NotImplemented
+        return self.get_range() == other.get_range()
+
+    def __ne__(self, other):
+        if not isinstance(other, DateFrame):
+            return NotImplemented
+        return self.get_range() != other.get_range()
+
+    def __lt__(self, other):
+        if not isinstance(other, DateFrame):
+            return NotImplemented
+        return self.get_range() < other.get_range()
+
+    def __hash__(self):
+        return hash(self.get_range())
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (self.__class__.__name__,
+                               self.start_date, self.end_date)
 
     def get_timedelta(self):
         """
@@ -38,17 +103,109 @@ class DateFrame(object):
         """
         Calcualte the difference in days.
         """
-        return int(self.get_timedelta().days)
+        return self.end_date.toordinal() - self.start_date.toordinal()
 
-    def each_day(self):
+    def each_day(self, chunk_size=None, numpy=False):
         """
-        Yield each day between start_date and end_date.
+        Return a lazy sequence of each day between start_date and end_date.
+        With chunk_size, return an iterator of (starts, ends) batches of
+        up to chunk_size days instead: lists of dates, or datetime64[D]
+        arrays with `numpy`.
         """
-        if self.days() == 0:
-            yield self.start_date
-        else:
-            for n in range(self.days()+1):
-                yield self.start_date + timedelta(n)
+        days = DaySequence(self.start_date.toordinal(), self.days() + 1, 1)
+        return _chunked(days, chunk_size, numpy)
+
+    def each_window(self, size, step=1, align='trailing', chunk_size=None,
+                    numpy=False):
+        """
+        Return a lazy sequence of (start, end) tuples of sliding windows,
+        anchored at every `step`-th day from start_date.
+
+        Argus:
+            size - window length in days
+            step - days between adjacent anchors
+            align - 'trailing', 'centered' or 'leading'
+            chunk_size, numpy - see each_day()
+        """
+        return _chunked(each_window(self, size, step, align), chunk_size,
+                        numpy)
+
+    def rolling(self, values, size, step=1, align='trailing'):
+        """
+        Yield ((start, end), RollingStats) for each window of each_window(),
+        given one value per day of each_day(). See window.rolling().
+        """
+        return rolling(self, values, size, step, align)
+
+    def count_weekday(self, weekday):
+        """
+        Count days of a weekday between start_date and end_date, both
+        included.
+
+        Argus:
+            weekday - 0 ~ 6, Monday is 0 (date.weekday())
+        """
+        return count_weekday(self.start_date.toordinal(),
+                             self.end_date.toordinal(), weekday)
+
+    def weekday_counts(self):
+        """
+        Return a list of number of Mondays, Tuesdays, ..., Sundays.
+        """
+        return [self.count_weekday(weekday) for weekday in range(7)]
+
+    def count_weekdays(self):
+        """
+        Count Mondays to Fridays.
+        """
+        return self.days() + 1 - self.count_weekend_days()
+
+    def count_weekend_days(self):
+        """
+        Count Saturdays and Sundays.
+        """
+        return self.count_weekday(5) + self.count_weekday(6)
+
+    def count_day_of_month(self, day):
+        """
+        Count dates with the day of month, e.g. 1 for first days of months.
+
+        Argus:
+            day - 1 ~ 31
+        """
+        return count_day_of_month(self.start_date, self.end_date, day)
+
+    def count_month_ends(self):
+        """
+        Count last days of months.
+        """
+        return count_month_ends(self.start_date, self.end_date)
+
+    def business_days(self, calendar=None):
+        """
+        Count working days between start_date and end_date, both included.
+
+        Argus:
+            calendar - a BusinessCalendar or the name of a registered one,
+                       None for the default calendar
+        """
+        calendar = get_calendar(calendar)
+        return calendar.count(self.start_date, self.end_date)
+
+    def each_business_day(self, calendar=None, chunk_size=None,
+                          numpy=False):
+        """
+        Return a lazy sequence of each working day between start_date and
+        end_date.
+
+        Argus:
+            calendar - a BusinessCalendar or the name of a registered one,
+                       None for the default calendar
+            chunk_size, numpy - see each_day()
+        """
+        calendar = get_calendar(calendar)
+        days = calendar.each_business_day(self.start_date, self.end_date)
+        return _chunked(days, chunk_size, numpy)
 
     def get_weekdelta(self):
         """
@@ -57,43 +214,42 @@ class DateFrame(object):
         monday1 - monday of the week of self.start_date
         monday2 - monday of the week of self.end_date
         """
-        monday1 = (self.start_date - timedelta(days=self.start_date.weekday()))
-        monday2 = (self.end_date - timedelta(days=self.end_date.weekday()))
-        # if self.start_date and self.end_date in the same week.
-        if (monday2 - timedelta(days=1)) == self.start_date:
-            return timedelta(days=0)
-        else:
-            return monday2 - monday1
+        return timedelta(days=self.weeks() * 7)
 
     def weeks(self):
         """
         Return date difference in months.
         """
-        return int(self.get_weekdelta().days / 7)
+        start = self.start_date.toordinal()
+        end = self.end_date.toordinal()
+        monday1 = start - (start + 6) % 7
+        monday2 = end - (end + 6) % 7
+        # if self.start_date and self.end_date in the same week.
+        if monday2 - 1 == start:
+            return 0
+        return (monday2 - monday1) // 7
 
-    def each_week(self):
+    def each_week(self, chunk_size=None, numpy=False):
         """
-        Yield each week between self.start_date and self.end_date
+        Return a lazy sequence of each week between self.start_date and
+        self.end_date. See each_day() for chunk_size and numpy.
         """
         if self.weeks() == 0:
-            yield (self.end_date - timedelta(days=6), self.end_date)
+            weeks = WeekSequence(self.end_date.toordinal() - 6, 1, 7)
         else:
-            dow = self.start_date.weekday()
-            start = (self.start_date - timedelta(days=dow+1))
-            for n in range(self.weeks()+1):
-                yield (start, start + timedelta(days=6))
-                start = start + timedelta(days=7)
+            start = get_week_start(self.start_date.toordinal())
+            weeks = WeekSequence(start, self.weeks() + 1, 7)
+        return _chunked(weeks, chunk_size, numpy)
 
     def get_monthdelta(self):
         """
         Get month delta.
         """
-        yeardelta = self.get_yeardelta()
-        if yeardelta == 0:
-            return self.end_date.month - self.start_date.month
-
-        monthdelta = (13 - self.start_date.month) + \
-            ((yeardelta - 1) * 12) + self.end_date.month
+        start, end = self.start_date, self.end_date
+        monthdelta = (end.year - start.year) * 12 + end.month - start.month
+        # months of different years also count the month of end_date
+        if end.year != start.year:
+            monthdelta += 1
         return monthdelta
 
     def months(self):
@@ -102,33 +258,22 @@ class DateFrame(object):
         """
         return self.get_monthdelta()
 
-    def each_month(self):
+    def each_month(self, chunk_size=None, numpy=False):
         """
-        Yield each month between self.start_date and self.end_date
+        Return a lazy sequence of each month between self.start_date and
+        self.end_date. See each_day() for chunk_size and numpy.
         """
-        start = date(self.start_date.year, self.start_date.month, 1)
-        if self.months() == 0:
-            days = calendar.monthrange(start.year, start.month)[1]
-            yield (start, date(start.year, start.month, days))
-
-        for n in range(self.months()):
-            days = calendar.monthrange(start.year, start.month)[1]
-            end = date(start.year, start.month, days)
-            yield (start, end)
-            start = end + timedelta(days=1)
+        first = get_month_index(self.start_date.year, self.start_date.month)
+        months = MonthSequence(first, max(self.months(), 1), 1)
+        return _chunked(months, chunk_size, numpy)
 
     def get_quarterdelta(self):
         """
         Calcualte date difference in quraters.
         """
-        squarter = get_quarter(self.start_date.month)
-        equarter = get_quarter(self.end_date.month)
-        yeardelta = self.get_yeardelta()
-        if yeardelta == 0:
-            return equarter - squarter
-
-        quarterdelta = (4 - squarter) + ((yeardelta - 1) * 4) + equarter
-        return quarterdelta
+        start, end = self.start_date, self.end_date
+        return (end.year - start.year) * 4 + \
+            (end.month - 1) // 3 - (start.month - 1) // 3
 
     def quarters(self):
         """
@@ -136,23 +281,15 @@ class DateFrame(object):
         """
         return self.get_quarterdelta()
 
-    def each_quarter(self):
+    def each_quarter(self, chunk_size=None, numpy=False):
         """
-        Yield each quarter.
+        Return a lazy sequence of each quarter. See each_day() for
+        chunk_size and numpy.
         """
-        quarter = get_quarter(self.start_date.month)
-        start_month, end_month = get_monthrange(quarter)
-        start = date(self.start_date.year, start_month, 1)
-        if self.quarters() == 0:
-            days = calendar.monthrange(start.year, start.month + 2)[1]
-            end = date(start.year, start.month + 2, days)
-            yield (start, end)
-
-        for n in range(self.quarters()):
-            days = calendar.monthrange(start.year, start.month + 2)[1]
-            end = date(start.year, start.month + 2, days)
-            yield (start, end)
-            start = end + timedelta(days=1)
+        first = get_month_index(self.start_date.year, self.start_date.month)
+        quarters = QuarterSequence(first - first % 3,
+                                   max(self.quarters(), 1), 3)
+        return _chunked(quarters, chunk_size, numpy)
 
     def get_yeardelta(self):
         """
@@ -166,15 +303,335 @@ class DateFrame(object):
         """
         return self.get_yeardelta()
 
-    def each_year(self):
+    def each_year(self, chunk_size=None, numpy=False):
         """
-        Yield each year.
+        Return a lazy sequence of each year. See each_day() for chunk_size
+        and numpy.
         """
-        for n in range(self.start_date.year, self.end_date.year + 1):
-            yield (date(n, 1, 1), date(n, 12, 31))
+        first = get_month_index(self.start_date.year, 1)
+        years = YearSequence(first, self.years() + 1, 12)
+        return _chunked(years, chunk_size, numpy)
 
     def get_range(self):
         """
         Return a tuple that contains self.start_date and self.end_date
         """
         return (self.start_date, self.end_date)
+
+    def cover(self, granularities=DEFAULT_GRANULARITIES):
+        """
+        Return the minimal list of calendar-aligned CoverPieces (whole
+        years, then quarters or months, then days) which covers the frame.
+        See cover.get_cover().
+        """
+        return get_cover(self, granularities)
+
+    def partition_keys(self, formatter=None,
+                       granularities=DEFAULT_GRANULARITIES):
+        """
+        Return partition keys (or glob patterns) of cover(). See
+        cover.get_partition_keys().
+        """
+        return get_partition_keys(self, formatter, granularities)
+
+
+# setters of the slots, which bypass the immutable __setattr__ and cost
+# about as much as plain assignment
+_set_start_date = DateFrame.start_date.__set__
+_set_end_date = DateFrame.end_date.__set__
+
+_interned_frames = WeakValueDictionary()
+
+
+def intern_frame(start_date, end_date):
+    """
+    Return a shared DateFrame for the given range. Equal frames created
+    by this factory are the same object while any reference to it is alive.
+
+    Argus:
+        start_date - the start date
+        end_date - the end date
+    """
+    key = (start_date, end_date)
+    frame = _interned_frames.get(key)
+    if frame is None:
+        frame = DateFrame(start_date, end_date)
+        frame = _interned_frames.setdefault(key, frame)
+    return frame
+
+
+def _int32_array(values):
+    """
+    Convert ordinals to a compact array of int32. Arrays and memoryviews
+    of int32 are used as they are, without a copy.
+    """
+    if isinstance(values, array) and values.typecode == 'i':
+        return values
+    if isinstance(values, memoryview) and values.format == 'i':
+        return values
+    np = get_numpy()
+    if np is not None and isinstance(values, np.ndarray):
+        result = array('i')
+        result.frombytes(values.astype(np.int32).tobytes())
+        return result
+    return array('i', values)
+
+
+# days in each month of a common year
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _count_days_before(ordinals, day):
+    """
+    Count dates with the day of month before each ordinal of an int64
+    array, since 0001-01-01. See utils.count_months_with_day().
+    """
+    np = get_numpy()
+    days = (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+    months = days.astype('datetime64[M]')
+    day_of_month = (days - months).astype(np.int64) + 1
+    year, month = np.divmod(months.astype(np.int64) + 1970 * 12, 12)
+    # months before each month of a year which have the day of month
+    before = np.cumsum([0] + [int(length >= day) for length in _MONTH_DAYS])
+    count = year * before[12] + before[month] + (day < day_of_month)
+    if day == 29:
+        # leap years in [0, year) and February of leap years
+        count += (year + 3) // 4 - (year + 99) // 100 + (year + 399) // 400
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        count += leap & (month >= 2)
+    return count
+
+
+class DateFrameArray(object):
+
+    """
+    A columnar collection of date frames. Start and end dates are stored as
+    two int32 arrays of ordinals (date.toordinal()), so a large number of
+    frames takes 8 bytes per frame.
+
+    days()/weeks()/months()/quarters()/years() compute the same values as
+    the DateFrame methods for every frame. They return NumPy arrays when
+    NumPy is installed, lists otherwise.
+    """
+
+    def __init__(self, starts=(), ends=()):
+        """
+        Argus:
+            starts - ordinals of start dates
+            ends - ordinals of end dates
+        """
+        self.starts = _int32_array(starts)
+        self.ends = _int32_array(ends)
+        if len(self.starts) != len(self.ends):
+            raise ValueError('starts and ends must have the same length')
+        np = get_numpy()
+        if np is not None:
+            invalid = (np.asarray(self.starts, dtype=np.int32) >
+                       np.asarray(self.ends, dtype=np.int32)).any()
+        else:
+            invalid = any(s > e for s, e in zip(self.starts, self.ends))
+        if invalid:
+            raise InvalidDateRange()
+
+    @classmethod
+    def from_columns(cls, starts, ends):
+        """
+        Build a DateFrameArray over int32 arrays or memoryviews of ordinals
+        without copying or validating them.
+        """
+        obj = cls.__new__(cls)
+        obj.starts = starts
+        obj.ends = ends
+        return obj
+
+    @classmethod
+    def from_frames(cls, frames):
+        """
+        Build a DateFrameArray from DateFrame objects.
+        """
+        starts, ends = array('i'), array('i')
+        for frame in frames:
+            starts.append(frame.start_date.toordinal())
+            ends.append(frame.end_date.toordinal())
+        return cls(starts, ends)
+
+    @classmethod
+    def from_periods(cls, periods):
+        """
+        Build a DateFrameArray from a lazy sequence of periods, such as
+        DateFrame.each_month() or DateRanger.prev_months(n).
+        """
+        starts, ends = array('i'), array('i')
+        for start, end in periods.ordinal_ranges():
+            starts.append(start)
+            ends.append(end)
+        return cls(starts, ends)
+
+    def to_frames(self):
+        """
+        Return a list of DateFrame objects.
+        """
+        return list(self)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        for start, end in zip(self.starts, self.ends):
+            yield DateFrame(date.fromordinal(start), date.fromordinal(end))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DateFrameArray.from_columns(self.starts[index],
+                                               self.ends[index])
+        return DateFrame(date.fromordinal(self.starts[index]),
+                         date.fromordinal(self.ends[index]))
+
+    def get_range(self, index):
+        """
+        Return a tuple that contains the start and end date of a frame.
+        """
+        return (date.fromordinal(self.starts[index]),
+                date.fromordinal(self.ends[index]))
+
+    def _columns(self):
+        """
+        Return start and end ordinals as int64 NumPy arrays.
+        """
+        np = get_numpy()
+        return (np.asarray(self.starts, dtype=np.int32).astype(np.int64),
+                np.asarray(self.ends, dtype=np.int32).astype(np.int64))
+
+    def _month_indexes(self):
+        """
+        Return month indexes (year * 12 + month - 1) of starts and ends.
+        """
+        np = get_numpy()
+        if np is not None:
+            result = []
+            for ordinals in self._columns():
+                days = (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+                months = days.astype('datetime64[M]').astype(np.int64)
+                result.append(months + 1970 * 12)
+            return tuple(result)
+
+        result = []
+        for ordinals in (self.starts, self.ends):
+            months = []
+            for ordinal in ordinals:
+                day = date.fromordinal(ordinal)
+                months.append(day.year * 12 + day.month - 1)
+            result.append(months)
+        return tuple(result)
+
+    def days(self):
+        """
+        Calcualte the difference in days of each frame.
+        """
+        if get_numpy() is not None:
+            starts, ends = self._columns()
+            return ends - starts
+        return [e - s for s, e in zip(self.starts, self.ends)]
+
+    def weeks(self):
+        """
+        Calcualte the difference in weeks of each frame.
+        See DateFrame.get_weekdelta().
+        """
+        if get_numpy() is not None:
+            starts, ends = self._columns()
+            monday1 = starts - (starts + 6) % 7
+            monday2 = ends - (ends + 6) % 7
+            weeks = (monday2 - monday1) // 7
+            weeks[monday2 - 1 == starts] = 0
+            return weeks
+
+        result = []
+        for s, e in zip(self.starts, self.ends):
+            monday1 = s - (s + 6) % 7
+            monday2 = e - (e + 6) % 7
+            result.append(0 if monday2 - 1 == s else (monday2 - monday1) // 7)
+        return result
+
+    def months(self):
+        """
+        Calcualte the difference in months of each frame.
+        See DateFrame.get_monthdelta().
+        """
+        starts, ends = self._month_indexes()
+        if get_numpy() is not None:
+            return ends - starts + (ends // 12 != starts // 12)
+        return [e - s + (e // 12 != s // 12) for s, e in zip(starts, ends)]
+
+    def quarters(self):
+        """
+        Calcualte the difference in quarters of each frame.
+        """
+        starts, ends = self._month_indexes()
+        if get_numpy() is not None:
+            return ends // 3 - starts // 3
+        return [e // 3 - s // 3 for s, e in zip(starts, ends)]
+
+    def count_weekday(self, weekday):
+        """
+        Count days of a weekday in each frame. See DateFrame.count_weekday().
+        """
+        np = get_numpy()
+        if np is not None:
+            starts, ends = self._columns()
+            weeks, rest = np.divmod(ends - starts + 1, 7)
+            return weeks + ((weekday - (starts + 6) % 7) % 7 < rest)
+        return [count_weekday(s, e, weekday)
+                for s, e in zip(self.starts, self.ends)]
+
+    def count_weekdays(self):
+        """
+        Count Mondays to Fridays in each frame.
+        """
+        if get_numpy() is not None:
+            return self.days() + 1 - self.count_weekend_days()
+        return [days + 1 - weekend for days, weekend
+                in zip(self.days(), self.count_weekend_days())]
+
+    def count_weekend_days(self):
+        """
+        Count Saturdays and Sundays in each frame.
+        """
+        if get_numpy() is not None:
+            return self.count_weekday(5) + self.count_weekday(6)
+        return [sat + sun for sat, sun
+                in zip(self.count_weekday(5), self.count_weekday(6))]
+
+    def count_day_of_month(self, day):
+        """
+        Count dates with the day of month in each frame.
+        See DateFrame.count_day_of_month().
+        """
+        if get_numpy() is not None:
+            starts, ends = self._columns()
+            return (_count_days_before(ends + 1, day) -
+                    _count_days_before(starts, day))
+        return [count_day_of_month(frame.start_date, frame.end_date, day)
+                for frame in self]
+
+    def count_month_ends(self):
+        """
+        Count last days of months in each frame.
+        """
+        if get_numpy() is not None:
+            starts, ends = self._month_indexes()
+            next_days = (self._columns()[1] + 1 - EPOCH_ORDINAL)
+            next_days = next_days.astype('datetime64[D]')
+            is_end = next_days == next_days.astype('datetime64[M]')
+            return ends - starts + is_end
+        return [count_month_ends(frame.start_date, frame.end_date)
+                for frame in self]
+
+    def years(self):
+        """
+        Calcualte the difference in years of each frame.
+        """
+        starts, ends = self._month_indexes()
+        if get_numpy() is not None:
+            return ends // 12 - starts // 12
+        return [e // 12 - s // 12 for s, e in zip(starts, ends)]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from datetime import date
+
+from DateRanger.bucket import get_buckets
+from DateRanger.utils import get_month_index
+from DateRanger.views import DaySequence
+from DateRanger.views import WeekSequence
+from DateRanger.views import MonthSequence
+from DateRanger.views import QuarterSequence
+from DateRanger.views import YearSequence
+
+
+_BLOCK_SEQUENCES = {
+    'month': MonthSequence,
+    'quarter': QuarterSequence,
+    'year': YearSequence,
+}
+
+
+def get_periods(granularity, first, last):
+    """
+    Get a lazy sequence of the periods of a granularity from ordinal
+    `first` to ordinal `last`. Both must be period boundaries, as in
+    shards returned by shard_frame().
+    """
+    if granularity == 'day':
+        return DaySequence(first, last - first + 1, 1)
+    if granularity == 'week':
+        return WeekSequence(first, (last - first + 1) // 7, 7)
+    cls = _BLOCK_SEQUENCES[granularity]
+    start, end = date.fromordinal(first), date.fromordinal(last)
+    index = get_month_index(start.year, start.month)
+    length = (get_month_index(end.year, end.month) - index) // cls.span + 1
+    return cls(index, length, cls.span)
+
+
+def shard_frame(frame, granularity='day', shards=None, chunk_size=None):
+    """
+    Split the periods of frame.each_<granularity>() into contiguous shards
+    of whole periods. Returns an iterator of (first, last) ordinal pairs;
+    shards are computed as they are consumed.
+
+    Argus:
+        frame - a DateFrame
+        granularity - 'day', 'week', 'month', 'quarter' or 'year'
+        shards - number of shards with balanced numbers of periods,
+                 os.cpu_count() by default
+        chunk_size - number of periods per shard instead of `shards`
+    """
+    periods = get_buckets(frame, granularity)
+    if chunk_size is not None:
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least 1: %r' %
+                             (chunk_size,))
+    else:
+        if shards is None:
+            shards = os.cpu_count() or 1
+        if shards < 1:
+            raise ValueError('Number of shards must be at least 1: %r' %
+                             (shards,))
+    return _shards(periods, shards, chunk_size)
+
+
+def _shards(periods, shards, chunk_size):
+    count = len(periods)
+    if chunk_size is None:
+        shards = min(shards, count)
+    else:
+        shards = (count + chunk_size - 1) // chunk_size
+    for n in range(shards):
+        if chunk_size is None:
+            low, high = n * count // shards, (n + 1) * count // shards
+        else:
+            low, high = n * chunk_size, min((n + 1) * chunk_size, count)
+        first = periods.get_ordinal_range(periods.first +
+                                          low * periods.step)[0]
+        last = periods.get_ordinal_range(periods.first +
+                                         (high - 1) * periods.step)[1]
+        yield (first, last)
+
+
+def run_shard(func, granularity, first, last):
+    """
+    Call func(start_date, end_date) for each period of a shard and return
+    a list of ((start_date, end_date), result). This runs in workers.
+    """
+    results = []
+    for start, end in get_periods(granularity, first, last).ordinal_ranges():
+        period = (date.fromordinal(start), date.fromordinal(end))
+        results.append((period, func(*period)))
+    return results
+
+
+def map_shards(func, frame, granularity='day', executor='process',
+               workers=None, chunk_size=1, max_in_flight=None, ordered=True):
+    """
+    Call func(start_date, end_date) for each period of
+    frame.each_<granularity>() in a pool and yield ((start_date,
+    end_date), result) as results arrive.
+
+    Workers only receive the function, the granularity and two ordinals
+    per task; periods are rebuilt there. With a process pool, `func` must
+    be picklable (a module-level function).
+
+    Argus:
+        func - a callable which takes the start and end date of a period
+        frame - a DateFrame
+        granularity - 'day', 'week', 'month', 'quarter' or 'year'
+        executor - 'process', 'thread' or a concurrent.futures.Executor,
+                   which is not shut down afterwards
+        workers - number of workers of a new pool
+        chunk_size - number of periods per task
+        max_in_flight - max number of submitted but unfinished tasks,
+                        twice the number of workers by default
+        ordered - yield results in period order; otherwise as soon as
+                  each task is done
+    """
+    shards = shard_frame(frame, granularity, chunk_size=chunk_size)
+    if isinstance(executor, Executor):
+        pool, owned = executor, False
+    elif executor == 'process':
+        pool, owned = ProcessPoolExecutor(workers), True
+    elif executor == 'thread':
+        pool, owned = ThreadPoolExecutor(workers or os.cpu_count()), True
+    else:
+        raise ValueError('Unknown executor: %r' % (executor,))
+    max_in_flight = max_in_flight or 2 * (workers or os.cpu_count() or 1)
+
+    pending = deque()
+    try:
+        while True:
+            for first, last in shards:
+                pending.append(pool.submit(run_shard, func, granularity,
+                                           first, last))
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                break
+
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done = wait(pending, return_when=FIRST_COMPLETED)[0]
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                for item in future.result():
+                    yield item
+    finally:
+        # the consumer may stop early; drop tasks which have not started
+        for future in pending:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=True)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import re
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from DateRanger.objects import DateFrame
+from DateRanger.batch import BatchDateRanger
+from DateRanger.cache import LRUCache
+from DateRanger.utils import get_week_start
+from DateRanger.utils import get_month_index
+from DateRanger.utils import get_block_dates
+from DateRanger.exceptions import InvalidExpression
+
+
+UNITS = ('day', 'week', 'month', 'quarter', 'year')
+
+# months in a block of each month-based unit
+_SPANS = {'month': 1, 'quarter': 3, 'year': 12}
+
+# sign of the offset of each relative keyword
+_DIRECTIONS = {
+    'this': 0, 'current': 0,
+    'prev': -1, 'previous': -1, 'last': -1,
+    'next': 1,
+}
+
+_KEYWORDS = {'today': 0, 'yesterday': -1, 'tomorrow': 1}
+
+_RELATIVE = re.compile(r'^(%s)(?:\s+(\d+))?\s+(%s)s?$' % (
+    '|'.join(_DIRECTIONS), '|'.join(UNITS)))
+_DAY = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
+_MONTH = re.compile(r'^(\d{4})-(\d{1,2})$')
+_QUARTER = re.compile(r'^(\d{4})-q([1-4])$')
+_YEAR = re.compile(r'^(\d{4})$')
+
+_expressions = LRUCache()
+
+
+class Relative(object):
+
+    """
+    A period `offset` units away from the period of the base date, the
+    same as DateRanger.relative_<unit>(offset).
+    """
+
+    def __init__(self, unit, offset):
+        self.unit = unit
+        self.offset = offset
+
+    def get_range(self, base_date):
+        """
+        Get the first and last date of the period for a base date.
+        """
+        if self.unit == 'day':
+            day = date.fromordinal(base_date.toordinal() + self.offset)
+            return (day, day)
+        if self.unit == 'week':
+            start = get_week_start(base_date.toordinal()) + 7 * self.offset
+            return (date.fromordinal(start), date.fromordinal(start + 6))
+        span = _SPANS[self.unit]
+        index = get_month_index(base_date.year, base_date.month)
+        return get_block_dates(index - index % span + span * self.offset,
+                               span)
+
+    def get_batch_ranges(self, ranger):
+        """
+        Get (starts, ends) for all base dates of a BatchDateRanger.
+        """
+        return getattr(ranger, 'relative_' + self.unit)(self.offset)
+
+
+class Absolute(object):
+
+    """
+    A fixed period which does not depend on the base date.
+    """
+
+    def __init__(self, start_date, end_date):
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def get_range(self, base_date):
+        return (self.start_date, self.end_date)
+
+    def get_batch_ranges(self, ranger):
+        count = len(ranger)
+        if np is not None:
+            return (np.full(count, self.start_date, dtype='datetime64[D]'),
+                    np.full(count, self.end_date, dtype='datetime64[D]'))
+        return ([self.start_date] * count, [self.end_date] * count)
+
+
+def _parse_period(text):
+    """
+    Parse one period without '..' into a Relative or an Absolute.
+    """
+    if text in _KEYWORDS:
+        return Relative('day', _KEYWORDS[text])
+
+    match = _RELATIVE.match(text)
+    if match:
+        direction, count, unit = match.groups()
+        if count is not None and _DIRECTIONS[direction] == 0:
+            raise InvalidExpression(text)
+        count = 1 if count is None else int(count)
+        return Relative(unit, _DIRECTIONS[direction] * count)
+
+    try:
+        match = _DAY.match(text)
+        if match:
+            day = date(*map(int, match.groups()))
+            return Absolute(day, day)
+
+        match = _MONTH.match(text) or _QUARTER.match(text)
+        if match:
+            year, number = map(int, match.groups())
+            if match.re is _QUARTER:
+                span, number = 3, number * 3 - 2
+            else:
+                span = 1
+                if not 1 <= number <= 12:
+                    raise ValueError(text)
+            return Absolute(*get_block_dates(
+                get_month_index(year, number), span))
+
+        match = _YEAR.match(text)
+        if match:
+            year = int(match.group(1))
+            return Absolute(date(year, 1, 1), date(year, 12, 31))
+    except ValueError:
+        raise InvalidExpression(text)
+
+    raise InvalidExpression(text)
+
+
+class Expression(object):
+
+    """
+    A compiled period expression. Parsing happens once in parse();
+    resolving only does integer arithmetic on the base date, and the last
+    result is kept for repeated calls with the same base date.
+
+    Supported expressions (case-insensitive):
+        today, yesterday, tomorrow
+        this|current <unit>
+        prev|previous|last|next [N] <unit>(s)   - same as prev_<unit>(N)
+        2014-11-05, 2014-11, 2014-Q3, 2014
+        <expression>..<expression>              - from the start of the
+                                                  first to the end of the
+                                                  second
+    where <unit> is day, week, month, quarter or year.
+    """
+
+    def __init__(self, text):
+        """
+        Argus:
+            text - the expression
+        """
+        self.text = text
+        normalized = ' '.join(text.lower().split())
+        parts = [part.strip() for part in normalized.split('..')]
+        if len(parts) > 2 or not all(parts):
+            raise InvalidExpression(text)
+        self.first = _parse_period(parts[0])
+        # None for a single period
+        self.last = _parse_period(parts[1]) if len(parts) == 2 else None
+        self._last_result = (None, None)
+
+    def __repr__(self):
+        return 'Expression(%r)' % (self.text,)
+
+    def get_range(self, base_date):
+        """
+        Get the first and last date of the expression for a base date.
+        """
+        if self.last is None:
+            return self.first.get_range(base_date)
+        start = self.first.get_range(base_date)[0]
+        end = self.last.get_range(base_date)[1]
+        if start > end:
+            raise InvalidExpression(self.text)
+        return (start, end)
+
+    def resolve(self, base_date=None):
+        """
+        Return the DateFrame of the expression for a base date.
+
+        Argus:
+            base_date - the base day, date.today() by default
+        """
+        base_date = base_date or date.today()
+        last_date, frame = self._last_result
+        if last_date == base_date:
+            return frame
+        frame = DateFrame(*self.get_range(base_date))
+        self._last_result = (base_date, frame)
+        return frame
+
+    def resolve_many(self, base_dates):
+        """
+        Resolve the expression for many base dates at once. Returns a
+        tuple of (starts, ends) like BatchDateRanger.
+
+        Argus:
+            base_dates - datetime64[D] array or a list of dates
+        """
+        ranger = BatchDateRanger(base_dates)
+        starts, ends = self.first.get_batch_ranges(ranger)
+        if self.last is None:
+            return (starts, ends)
+        ends = self.last.get_batch_ranges(ranger)[1]
+        if np is not None and isinstance(starts, np.ndarray):
+            invalid = (starts > ends).any()
+        else:
+            invalid = any(start > end for start, end in zip(starts, ends))
+        if invalid:
+            raise InvalidExpression(self.text)
+        return (starts, ends)
+
+
+def parse(text):
+    """
+    Return the compiled Expression of a text. Expressions are cached, so
+    parsing the same text again costs a dict lookup.
+    """
+    expression = _expressions.get(text)
+    if expression is None:
+        expression = Expression(text)
+        _expressions.put(text, expression)
+    return expression
+
+
+def resolve(text, base_date=None):
+    """
+    Return the DateFrame of an expression for a base date.
+
+    Example:
+        resolve('last 3 months', date(2015, 1, 19))
+        resolve('2014-Q3..2014-11')
+    """
+    return parse(text).resolve(base_date)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import time
+from collections import namedtuple
+from datetime import datetime
+from datetime import timedelta
+from threading import Lock
+
+from DateRanger import DateRanger
+
+
+UNITS = ('day', 'week', 'month', 'quarter', 'year')
+
+RangerSnapshot = namedtuple('RangerSnapshot', ['base_date', 'expires'] + [
+    '%s_%s' % (kind, unit) for unit in UNITS
+    for kind in ('base', 'prev', 'next')])
+
+
+def build_snapshot(base_date, expires=float('inf')):
+    """
+    Compute base, previous and next day/week/month/quarter/year of a date.
+
+    Argus:
+        base_date - the base day
+        expires - timestamp after which the snapshot is out of date
+    """
+    ranger = DateRanger(base_date)
+    frames = []
+    for unit in UNITS:
+        frames.append(getattr(ranger, 'base_' + unit)())
+        frames.append(getattr(ranger, 'prev_' + unit)())
+        frames.append(getattr(ranger, 'next_' + unit)())
+    return RangerSnapshot(base_date, expires, *frames)
+
+
+def get_next_midnight(timestamp, tz=None):
+    """
+    Get the date of a timestamp in a timezone and the timestamp of the
+    following midnight there.
+
+    Argus:
+        timestamp - seconds since the epoch
+        tz - a tzinfo, None for local time
+    """
+    today = datetime.fromtimestamp(timestamp, tz).date()
+    midnight = datetime.combine(today + timedelta(days=1),
+                                datetime.min.time())
+    if tz is not None and hasattr(tz, 'localize'):
+        # pytz zones only get the offset of the date from localize()
+        midnight = tz.localize(midnight)
+    else:
+        midnight = midnight.replace(tzinfo=tz)
+    return (today, midnight.timestamp())
+
+
+def _base(name):
+    def method(self):
+        return getattr(self.snapshot(), name)
+    method.__name__ = name
+    method.__doc__ = 'Same as DateRanger().%s(), precomputed.' % name
+    return method
+
+
+def _relative(name):
+    # prev_month(months=1) and so on, like DateRanger
+    keyword = name.split('_', 1)[1] + 's'
+
+    def method(self, *args, **kwargs):
+        snapshot = self.snapshot()
+        if args in ((), (1,)) and not kwargs or \
+                not args and kwargs == {keyword: 1}:
+            return getattr(snapshot, name)
+        ranger = DateRanger(snapshot.base_date)
+        return getattr(ranger, name)(*args, **kwargs)
+    method.__name__ = name
+    method.__doc__ = 'Same as DateRanger().%s(%s=1), precomputed for 1.' % (
+        name, keyword)
+    return method
+
+
+class SharedDateRanger(object):
+
+    """
+    A DateRanger of today which can be shared by many threads.
+
+    Ranges of the current date are computed once into an immutable
+    RangerSnapshot. When the clock passes midnight in the given timezone,
+    the first reader builds the next snapshot and swaps it in with a
+    single assignment; other readers keep using the old one meanwhile and
+    never wait for a lock.
+
+    Example:
+        TODAY = SharedDateRanger(tz=ZoneInfo('Asia/Taipei'))
+        TODAY.prev_week()
+        TODAY.snapshot().base_month
+    """
+
+    def __init__(self, tz=None, clock=time.time, base_date=None):
+        """
+        Argus:
+            tz - a tzinfo which decides when a day starts, None for local
+                 time
+            clock - a callable which returns seconds since the epoch
+            base_date - a fixed base day which never expires, for tests
+        """
+        self.tz = tz
+        self.clock = clock
+        self._refresh_lock = Lock()
+        if base_date is not None:
+            self._snapshot = build_snapshot(base_date)
+        else:
+            self._snapshot = self._build()
+
+    def _build(self):
+        base_date, expires = get_next_midnight(self.clock(), self.tz)
+        return build_snapshot(base_date, expires)
+
+    def snapshot(self):
+        """
+        Return the RangerSnapshot of today.
+        """
+        snapshot = self._snapshot
+        if self.clock() < snapshot.expires:
+            return snapshot
+        # only one thread rebuilds; the others read the old snapshot
+        if not self._refresh_lock.acquire(False):
+            return snapshot
+        try:
+            if self.clock() >= self._snapshot.expires:
+                self._snapshot = self._build()
+            return self._snapshot
+        finally:
+            self._refresh_lock.release()
+
+    def set_base_date(self, base_date=None):
+        """
+        Pin the base date, or follow the clock again with None.
+        """
+        if base_date is not None:
+            self._snapshot = build_snapshot(base_date)
+        else:
+            self._snapshot = self._build()
+
+    @property
+    def bdate(self):
+        return self.snapshot().base_date
+
+    base_day = _base('base_day')
+    prev_day = _relative('prev_day')
+    next_day = _relative('next_day')
+    base_week = _base('base_week')
+    prev_week = _relative('prev_week')
+    next_week = _relative('next_week')
+    base_month = _base('base_month')
+    prev_month = _relative('prev_month')
+    next_month = _relative('next_month')
+    base_quarter = _base('base_quarter')
+    prev_quarter = _relative('prev_quarter')
+    next_quarter = _relative('next_quarter')
+    base_year = _base('base_year')
+    prev_year = _relative('prev_year')
+    next_year = _relative('next_year')
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from DateRanger.objects import DateFrameArray
+
+
+MAGIC = b'DFRA'
+VERSION = 1
+
+# flags
+SORTED = 1
+
+# magic, version, flags and number of frames, little-endian
+HEADER = struct.Struct('<4sHHQ')
+
+Header = namedtuple('Header', ['version', 'flags', 'count'])
+
+
+def _to_bytes(values):
+    """
+    Return int32 ordinals as little-endian bytes.
+    """
+    if sys.byteorder == 'little':
+        return memoryview(values).tobytes()
+    values = array('i', values)
+    values.byteswap()
+    return values.tobytes()
+
+
+def _is_sorted(frames):
+    """
+    Determine whether frames are sorted by (start, end).
+    """
+    if np is not None:
+        starts = np.asarray(frames.starts, dtype=np.int32)
+        ends = np.asarray(frames.ends, dtype=np.int32)
+        return bool(np.all((starts[1:] > starts[:-1]) | (
+            (starts[1:] == starts[:-1]) & (ends[1:] >= ends[:-1]))))
+
+    previous = None
+    for pair in zip(frames.starts, frames.ends):
+        if previous is not None and pair < previous:
+            return False
+        previous = pair
+    return True
+
+
+def dump(frames, fileobj, sort=False):
+    """
+    Write frames in the binary format: a 16-byte header (magic 'DFRA',
+    version, flags and number of frames) followed by the int32 ordinals of
+    all start dates and then of all end dates, little-endian.
+
+    Argus:
+        frames - a DateFrameArray or an iterable of DateFrames
+        fileobj - a file opened in binary mode, or a path
+        sort - sort frames by (start_date, end_date) before writing. The
+               SORTED flag is also set if frames are already sorted.
+    """
+    if not hasattr(fileobj, 'write'):
+        with open(fileobj, 'wb') as output:
+            return dump(frames, output, sort)
+
+    if not isinstance(frames, DateFrameArray):
+        frames = DateFrameArray.from_frames(frames)
+    if sort and np is not None:
+        starts = np.asarray(frames.starts, dtype=np.int32)
+        ends = np.asarray(frames.ends, dtype=np.int32)
+        order = np.lexsort((ends, starts))
+        frames = DateFrameArray.from_columns(memoryview(starts[order]),
+                                             memoryview(ends[order]))
+    elif sort:
+        pairs = sorted(zip(frames.starts, frames.ends))
+        frames = DateFrameArray.from_columns(
+            array('i', [start for start, _ in pairs]),
+            array('i', [end for _, end in pairs]))
+
+    flags = SORTED if sort or _is_sorted(frames) else 0
+    fileobj.write(HEADER.pack(MAGIC, VERSION, flags, len(frames)))
+    fileobj.write(_to_bytes(frames.starts))
+    fileobj.write(_to_bytes(frames.ends))
+
+
+def _parse_header(data, size):
+    """
+    Parse and check the header of a file of `size` bytes.
+    """
+    if size < HEADER.size:
+        raise ValueError('Not a DateFrame file: too short')
+    magic, version, flags, count = HEADER.unpack(data[:HEADER.size])
+    if magic != MAGIC:
+        raise ValueError('Not a DateFrame file: bad magic %r' % (magic,))
+    if version != VERSION:
+        raise ValueError('Unsupported DateFrame file version: %d' % version)
+    if size != HEADER.size + count * 8:
+        raise ValueError('DateFrame file is truncated or has extra data')
+    return Header(version, flags, count)
+
+
+class StoredFrames(DateFrameArray):
+
+    """
+    A DateFrameArray loaded by load(). Frames and metrics are computed from
+    the mapped ordinals on access; no DateFrame object is built up front.
+    Slices are copied out of the mapping into a DateFrameArray, so they
+    stay valid after close().
+    """
+
+    def __init__(self, starts=(), ends=(), header=None, source=None):
+        """
+        Argus:
+            starts - int32 ordinals of start dates
+            ends - int32 ordinals of end dates
+            header - the Header of the file
+            source - the mmap which backs starts and ends, if any
+        """
+        super(StoredFrames, self).__init__(starts, ends)
+        self.header = header or Header(VERSION, 0, len(self.starts))
+        self.source = source
+
+    @classmethod
+    def from_columns(cls, starts, ends, header=None, source=None):
+        """
+        Build StoredFrames over int32 arrays or memoryviews without copying
+        or validating them.
+        """
+        obj = super(StoredFrames, cls).from_columns(starts, ends)
+        obj.header = header or Header(VERSION, 0, len(starts))
+        obj.source = source
+        return obj
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            starts, ends = array('i'), array('i')
+            starts.frombytes(self.starts[index].tobytes())
+            ends.frombytes(self.ends[index].tobytes())
+            return DateFrameArray.from_columns(starts, ends)
+        return super(StoredFrames, self).__getitem__(index)
+
+    @property
+    def is_sorted(self):
+        """
+        Determine whether frames are sorted by (start_date, end_date).
+        """
+        return bool(self.header.flags & SORTED)
+
+    def find_starts(self, start_date, end_date=None):
+        """
+        Return the range of positions of frames which start between
+        start_date and end_date (inclusive). Only for sorted files.
+        """
+        if not self.is_sorted:
+            raise ValueError('Frames are not sorted')
+        first = start_date.toordinal()
+        last = (end_date or start_date).toordinal()
+        if np is not None:
+            starts = np.asarray(self.starts, dtype=np.int32)
+            low = int(np.searchsorted(starts, first, 'left'))
+            high = int(np.searchsorted(starts, last, 'right'))
+        else:
+            low = bisect_left(self.starts, first)
+            high = bisect_right(self.starts, last)
+        return range(low, high)
+
+    def close(self):
+        """
+        Release the mapping. Frames can not be accessed afterwards. If a
+        buffer over the mapping is still exported (e.g. a NumPy array made
+        from starts), the mapping is closed once it is garbage collected.
+        """
+        if self.source is None:
+            return
+        source, self.source = self.source, None
+        try:
+            self.starts.release()
+            self.ends.release()
+            source.close()
+        except BufferError:
+            pass
+        self.starts = self.ends = array('i')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load(path, use_mmap=True):
+    """
+    Open a file written by dump() and return StoredFrames.
+
+    With use_mmap, the file is memory-mapped read-only and the ordinals
+    are memoryviews over the mapping, so opening costs O(1) whatever the
+    number of frames, and processes which load the same file share its
+    pages. Otherwise the ordinals are read into arrays.
+
+    Argus:
+        path - path of the file
+        use_mmap - map the file instead of reading it
+    """
+    with open(path, 'rb') as input_file:
+        if not use_mmap or sys.byteorder != 'little':
+            data = input_file.read()
+            header = _parse_header(data, len(data))
+            count = header.count
+            starts, ends = array('i'), array('i')
+            starts.frombytes(data[HEADER.size:HEADER.size + count * 4])
+            ends.frombytes(data[HEADER.size + count * 4:])
+            if sys.byteorder != 'little':
+                starts.byteswap()
+                ends.byteswap()
+            return StoredFrames.from_columns(starts, ends, header)
+
+        source = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    header = _parse_header(source, len(source))
+    view = memoryview(source)
+    middle = HEADER.size + header.count * 4
+    starts = view[HEADER.size:middle].cast('i')
+    ends = view[middle:].cast('i')
+    view.release()
+    return StoredFrames.from_columns(starts, ends, header, source)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from array import array
+from datetime import date
+from threading import Lock
+
+from DateRanger.utils import get_days_in_month
+from DateRanger.utils import get_week_start
+
+
+DEFAULT_FIRST_YEAR = 1970
+DEFAULT_LAST_YEAR = 2100
+
+_settings = {
+    'enabled': False,
+    'first_year': DEFAULT_FIRST_YEAR,
+    'last_year': DEFAULT_LAST_YEAR,
+}
+_tables = []
+_lock = Lock()
+
+
+class CalendarTable(object):
+
+    """
+    A precomputed index of week and quarter boundaries for every day from
+    January 1st of `first_year` to December 31st of `last_year`. Each array
+    is keyed by `ordinal - self.first` and holds ordinals
+    (date.toordinal()).
+    """
+
+    def __init__(self, first_year=DEFAULT_FIRST_YEAR,
+                 last_year=DEFAULT_LAST_YEAR):
+        """
+        Argus:
+            first_year - the first year in the table
+            last_year - the last year in the table
+        """
+        self.first_year = first_year
+        self.last_year = last_year
+        self.first = date(first_year, 1, 1).toordinal()
+        self.last = date(last_year, 12, 31).toordinal()
+
+        self.quarter_start = array('i')
+        self.quarter_end = array('i')
+        self.week_start = array('i', [get_week_start(ordinal) for ordinal
+                                      in range(self.first, self.last + 1)])
+
+        start = self.first
+        for year in range(first_year, last_year + 1):
+            for quarter in range(4):
+                days = sum(get_days_in_month(year, quarter * 3 + n)
+                           for n in (1, 2, 3))
+                self.quarter_start.extend([start] * days)
+                self.quarter_end.extend([start + days - 1] * days)
+                start += days
+
+    def covers(self, ordinal):
+        """
+        Determine whether the ordinal is in the table.
+        """
+        return self.first <= ordinal <= self.last
+
+    def quarter_range(self, ordinal):
+        """
+        Get the first and last ordinal of the quarter of `ordinal`.
+        """
+        key = ordinal - self.first
+        return (self.quarter_start[key], self.quarter_end[key])
+
+    def week_range(self, ordinal):
+        """
+        Get the first and last ordinal of the week of `ordinal`.
+        See DateRanger.get_week_range().
+        """
+        start = self.week_start[ordinal - self.first]
+        return (start, start + 6)
+
+
+def enable(first_year=DEFAULT_FIRST_YEAR, last_year=DEFAULT_LAST_YEAR):
+    """
+    Turn on the calendar table for the given span of years.
+    The table is built on first use.
+    """
+    with _lock:
+        _settings.update(enabled=True, first_year=first_year,
+                         last_year=last_year)
+        del _tables[:]
+
+
+def disable():
+    """
+    Turn off the calendar table and release its memory.
+    """
+    with _lock:
+        _settings['enabled'] = False
+        del _tables[:]
+
+
+def get_table():
+    """
+    Return the CalendarTable, or None if the table is turned off.
+    """
+    if not _settings['enabled']:
+        return None
+    if not _tables:
+        with _lock:
+            if _settings['enabled'] and not _tables:
+                _tables.append(CalendarTable(_settings['first_year'],
+                                             _settings['last_year']))
+    return _tables[0] if _tables else None
+
+
+def lookup(ordinal):
+    """
+    Return the CalendarTable if it is turned on and covers `ordinal`,
+    otherwise None.
+    """
+    table = get_table()
+    if table is not None and table.covers(ordinal):
+        return table
+    return None
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+from datetime import timedelta
+
+from DateRanger import DateFrame
+from DateRanger.aggregate import StreamAggregator
+from DateRanger.aggregate import aggregate
+
+
+class TestStreamAggregator(unittest.TestCase):
+
+    """
+    Test cases for StreamAggregator
+    """
+
+    def setUp(self):
+        self.frame = DateFrame(date(2013, 12, 1), date(2014, 2, 28))
+        start = date(2013, 11, 25)
+        self.records = [(start + timedelta(days=n), n) for n in range(110)]
+
+    def summary(self, result):
+        return [(bucket, stats.count, stats.sum, stats.min, stats.max)
+                for bucket, stats in result]
+
+    def test_sorted(self):
+        result = self.summary(aggregate(self.frame, 'month', self.records))
+        expect = [((date(2013, 12, 1), date(2013, 12, 31)), 31, 651, 6, 36),
+                  ((date(2014, 1, 1), date(2014, 1, 31)), 31, 1612, 37, 67),
+                  ((date(2014, 2, 1), date(2014, 2, 28)), 28, 2282, 68, 95)]
+        self.assertEqual(result, expect)
+
+    def test_unsorted(self):
+        records = list(reversed(self.records))
+        result = self.summary(aggregate(self.frame, 'month', records,
+                                        presorted=False))
+        expect = self.summary(aggregate(self.frame, 'month', self.records))
+        self.assertEqual(result, expect)
+
+    def test_not_sorted(self):
+        records = list(reversed(self.records))
+        with self.assertRaises(ValueError):
+            list(aggregate(self.frame, 'month', records))
+
+    def test_emit_on_close(self):
+        obj = StreamAggregator(self.frame, 'year')
+        self.assertEqual(obj.add(date(2014, 1, 5), 1), [])
+        self.assertEqual(obj.add(date(2014, 2, 5), 2), [])
+        self.assertEqual(obj.add(date(2013, 2, 5), 2), [])
+        self.assertEqual(obj.skipped, 1)
+        closed = obj.flush()
+        self.assertEqual(len(closed), 1)
+        self.assertEqual(closed[0][1].mean, 1.5)
+
+    def test_closed_buckets(self):
+        obj = StreamAggregator(self.frame, 'day')
+        obj.add(date(2014, 1, 5), 1)
+        closed = obj.add(date(2014, 1, 6), 1)
+        self.assertEqual([bucket for bucket, stats in closed],
+                         [date(2014, 1, 5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+from datetime import timedelta
+
+from DateRanger import DateRanger
+from DateRanger import utils
+from DateRanger.batch import BatchDateRanger
+
+
+class TestBatchDateRanger(unittest.TestCase):
+
+    """
+    Test cases for BatchDateRanger
+    """
+
+    def setUp(self):
+        start = date(2011, 12, 20)
+        self.dates = [start + timedelta(days=n) for n in range(0, 800, 3)]
+        self.obj = BatchDateRanger(self.dates)
+
+    def assertMatches(self, method, *args):
+        starts, ends = getattr(self.obj, method)(*args)
+        result = list(zip(list(starts), list(ends)))
+        if utils.get_numpy() is not None:
+            result = [(s.tolist(), e.tolist()) for s, e in result]
+        expect = [getattr(DateRanger(d), method)(*args).get_range()
+                  for d in self.dates]
+        self.assertEqual(result, expect)
+
+    def test_len(self):
+        self.assertEqual(len(self.obj), len(self.dates))
+
+    def test_days(self):
+        for method in ('base_day', 'prev_day', 'next_day'):
+            self.assertMatches(method)
+        self.assertMatches('prev_day', 40)
+        self.assertMatches('next_day', 40)
+
+    def test_weeks(self):
+        for method in ('base_week', 'prev_week', 'next_week'):
+            self.assertMatches(method)
+        self.assertMatches('prev_week', 9)
+        self.assertMatches('next_week', 60)
+
+    def test_months(self):
+        for method in ('base_month', 'prev_month', 'next_month'):
+            self.assertMatches(method)
+        for n in (0, 11, 12, 13, 25):
+            self.assertMatches('prev_month', n)
+            self.assertMatches('next_month', n)
+
+    def test_quarters(self):
+        for method in ('base_quarter', 'prev_quarter', 'next_quarter'):
+            self.assertMatches(method)
+        for n in (0, 3, 4, 5, 9):
+            self.assertMatches('prev_quarter', n)
+            self.assertMatches('next_quarter', n)
+
+    def test_years(self):
+        for method in ('base_year', 'prev_year', 'next_year'):
+            self.assertMatches(method)
+        self.assertMatches('prev_year', 3)
+        self.assertMatches('next_year', 3)
+
+
+class TestBatchDateRangerPython(TestBatchDateRanger):
+
+    """
+    Test cases for BatchDateRanger without NumPy
+    """
+
+    def setUp(self):
+        self.numpy = utils._numpy[:]
+        utils._numpy[:] = [None]
+        super(TestBatchDateRangerPython, self).setUp()
+
+    def tearDown(self):
+        utils._numpy[:] = self.numpy
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+
+from DateRanger import DateFrame
+from DateRanger.blocks import BlockCache
+from DateRanger.blocks import get_blocks
+from DateRanger.blocks import get_block_key
+from DateRanger.blocks import get_fingerprint
+
+
+class TestBlocks(unittest.TestCase):
+
+    """
+    Test cases for canonical blocks and BlockCache
+    """
+
+    def setUp(self):
+        self.calls = []
+
+    def count_days(self, start_date, end_date):
+        self.calls.append((start_date, end_date))
+        return DateFrame(start_date, end_date).days() + 1
+
+    def test_keys(self):
+        frame = DateFrame(date(2014, 12, 21), date(2016, 1, 9))
+        keys = [get_block_key(piece) for piece in
+                get_blocks(frame, ('year', 'quarter', 'week'))]
+        self.assertEqual(keys, [
+            'week:2014-12-21', 'day:2014-12-28', 'day:2014-12-29',
+            'day:2014-12-30', 'day:2014-12-31', 'year:2015',
+            'day:2016-01-01', 'day:2016-01-02', 'week:2016-01-03'])
+        keys = [get_block_key(piece) for piece in
+                get_blocks(frame, ('quarter', 'month'))]
+        self.assertEqual(keys[11:13], ['quarter:2015-Q1', 'quarter:2015-Q2'])
+
+    def test_fingerprint(self):
+        piece = get_blocks(DateFrame(date(2015, 1, 1), date(2015, 1, 31)))[0]
+        fingerprint = get_fingerprint(piece, 'events')
+        self.assertEqual(len(fingerprint), 40)
+        self.assertEqual(fingerprint, get_fingerprint(piece, 'events'))
+        self.assertNotEqual(fingerprint, get_fingerprint(piece, 'users'))
+        self.assertNotEqual(fingerprint, get_fingerprint(piece))
+
+    def test_reuse(self):
+        cache = BlockCache(self.count_days, sum, namespace='days')
+        frame = DateFrame(date(2015, 1, 1), date(2015, 3, 15))
+        self.assertEqual(cache.get(frame), frame.days() + 1)
+        self.assertEqual(cache.misses, 2 + 15)
+        del self.calls[:]
+
+        frame = DateFrame(date(2015, 2, 1), date(2015, 3, 10))
+        self.assertEqual(cache.get(frame), frame.days() + 1)
+        self.assertEqual(self.calls, [])
+        self.assertEqual(cache.hits, 11)
+
+        frame = DateFrame(date(2015, 1, 15), date(2015, 4, 30))
+        self.assertEqual(cache.get(frame), frame.days() + 1)
+        self.assertEqual(self.calls[-1], (date(2015, 4, 1), date(2015, 4, 30)))
+
+    def test_store(self):
+        store = {}
+
+        class DictStore(object):
+            def get(self, key, default=None):
+                return store.get(key, default)
+
+            def put(self, key, value):
+                store[key] = value
+
+        cache = BlockCache(self.count_days, list, store=DictStore())
+        result = cache.get(DateFrame(date(2015, 1, 30), date(2015, 2, 28)))
+        self.assertEqual(result, [1, 1, 28])
+        self.assertEqual(len(store), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
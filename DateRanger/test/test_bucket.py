@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+
+from DateRanger import DateFrame
+from DateRanger import bucket
+from DateRanger.bucket import Bucketer
+from DateRanger.bucket import bucket_indexes
+from DateRanger.bucket import bucket_starts
+
+
+class TestBucketer(unittest.TestCase):
+
+    """
+    Test cases for Bucketer
+    """
+
+    def setUp(self):
+        start = date(2013, 11, 20)
+        self.dates = [start + timedelta(days=n) for n in range(0, 900, 5)]
+        self.frames = [DateFrame(date(2014, 1, 9), date(2015, 2, 14)),
+                       DateFrame(date(2014, 5, 20), date(2014, 5, 22)),
+                       DateFrame(date(2014, 5, 18), date(2014, 5, 24))]
+
+    def expected(self, frame, granularity):
+        buckets = list(getattr(frame, 'each_' + granularity)())
+        result = []
+        for day in self.dates:
+            index = -1
+            if frame.start_date <= day <= frame.end_date:
+                for n, item in enumerate(buckets):
+                    if not isinstance(item, tuple):
+                        item = (item, item)
+                    if item[0] <= day <= item[1]:
+                        index = n
+                        break
+            result.append(index)
+        return result
+
+    def test_indexes(self):
+        for frame in self.frames:
+            for granularity in bucket.GRANULARITIES:
+                result = bucket_indexes(frame, granularity, self.dates)
+                self.assertEqual([int(n) for n in result],
+                                 self.expected(frame, granularity))
+
+    def test_starts(self):
+        frame = self.frames[0]
+        result = list(bucket_starts(frame, 'month', [
+            date(2014, 3, 15), date(2013, 3, 15), date(2015, 2, 14)]))
+        if bucket.np is not None:
+            result = [None if day != day else day.tolist() for day in result]
+        expect = [date(2014, 3, 1), None, date(2015, 2, 1)]
+        self.assertEqual(result, expect)
+
+    def test_locate(self):
+        obj = Bucketer(self.frames[0], 'week')
+        self.assertEqual(obj.locate(date(2014, 1, 9)), 0)
+        self.assertEqual(obj.locate(date(2014, 1, 12)), 1)
+        self.assertEqual(obj.locate(date(2014, 1, 8)), -1)
+        self.assertEqual(obj.get_start(1), date(2014, 1, 12))
+
+    def test_datetimes(self):
+        result = bucket_indexes(self.frames[0], 'quarter',
+                                [datetime(2014, 4, 1, 12, 30)])
+        self.assertEqual([int(n) for n in result], [1])
+
+    def test_unknown_granularity(self):
+        self.assertRaises(ValueError, Bucketer, self.frames[0], 'hour')
+
+
+class TestBucketerPython(TestBucketer):
+
+    """
+    Test cases for Bucketer without NumPy
+    """
+
+    def setUp(self):
+        self.np = bucket.np
+        bucket.np = None
+        super(TestBucketerPython, self).setUp()
+
+    def tearDown(self):
+        bucket.np = self.np
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+from datetime import timedelta
+
+from DateRanger import DateFrame
+from DateRanger import DateRanger
+from DateRanger.business import BusinessCalendar
+from DateRanger.business import register_calendar
+from DateRanger.business import get_calendar
+from DateRanger.exceptions import OutOfCalendarRange
+
+
+HOLIDAYS = [date(2015, 1, 1), date(2015, 2, 19), date(2015, 2, 20),
+            date(2015, 12, 25)]
+
+
+class TestBusinessCalendar(unittest.TestCase):
+
+    """
+    Test cases for BusinessCalendar
+    """
+
+    def setUp(self):
+        self.obj = BusinessCalendar(HOLIDAYS, first_year=2014,
+                                    last_year=2016)
+        self.expect = []
+        day = date(2014, 1, 1)
+        while day <= date(2016, 12, 31):
+            if day.weekday() < 5 and day not in HOLIDAYS:
+                self.expect.append(day)
+            day += timedelta(days=1)
+
+    def test_is_business_day(self):
+        self.assertFalse(self.obj.is_business_day(date(2015, 1, 1)))
+        self.assertTrue(self.obj.is_business_day(date(2015, 1, 2)))
+        self.assertFalse(self.obj.is_business_day(date(2015, 1, 3)))
+        self.assertRaises(OutOfCalendarRange, self.obj.is_business_day,
+                          date(2017, 1, 2))
+
+    def test_count(self):
+        start, end = date(2014, 12, 20), date(2015, 3, 3)
+        expect = len([day for day in self.expect if start <= day <= end])
+        self.assertEqual(self.obj.count(start, end), expect)
+
+    def test_add_business_days(self):
+        day = date(2014, 12, 31)
+        self.assertEqual(self.obj.add_business_days(day, 1), date(2015, 1, 2))
+        self.assertEqual(self.obj.add_business_days(day, 0), day)
+        self.assertEqual(self.obj.add_business_days(date(2015, 1, 1), 0),
+                         date(2015, 1, 2))
+        self.assertEqual(self.obj.add_business_days(date(2015, 1, 5), -2),
+                         date(2014, 12, 31))
+        self.assertEqual(self.obj.add_business_days(date(2015, 2, 18), 1),
+                         date(2015, 2, 23))
+        self.assertRaises(OutOfCalendarRange, self.obj.add_business_days,
+                          date(2016, 12, 30), 5)
+
+    def test_each_business_day(self):
+        start, end = date(2015, 2, 1), date(2015, 3, 1)
+        days = self.obj.each_business_day(start, end)
+        expect = [day for day in self.expect if start <= day <= end]
+        self.assertEqual(list(days), expect)
+        self.assertEqual(len(days), len(expect))
+        self.assertEqual(days[-1], expect[-1])
+        self.assertEqual(list(days[::5]), expect[::5])
+        self.assertIn(date(2015, 2, 18), days)
+        self.assertNotIn(date(2015, 2, 19), days)
+        self.assertEqual(days.index(expect[3]), 3)
+
+
+class TestBusinessDays(unittest.TestCase):
+
+    """
+    Test cases for business day methods of DateFrame and DateRanger
+    """
+
+    def setUp(self):
+        register_calendar('test', BusinessCalendar(HOLIDAYS))
+
+    def test_date_frame(self):
+        frame = DateFrame(date(2015, 2, 16), date(2015, 2, 22))
+        self.assertEqual(frame.business_days('test'), 3)
+        self.assertEqual(frame.business_days(), 5)
+        self.assertEqual(list(frame.each_business_day('test')),
+                         [date(2015, 2, 16), date(2015, 2, 17),
+                          date(2015, 2, 18)])
+
+    def test_date_ranger(self):
+        obj = DateRanger(date(2015, 2, 18))
+        expect = (date(2015, 2, 23), date(2015, 2, 23))
+        self.assertEqual(obj.next_business_day(calendar='test').get_range(),
+                         expect)
+        expect = (date(2015, 2, 16), date(2015, 2, 16))
+        self.assertEqual(obj.prev_business_day(2, 'test').get_range(),
+                         expect)
+
+    def test_unknown_calendar(self):
+        self.assertRaises(ValueError, get_calendar, 'unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+
+from DateRanger import DateRanger
+from DateRanger import cache
+from DateRanger.cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+
+    """
+    Test cases for LRUCache
+    """
+
+    def setUp(self):
+        self.obj = LRUCache(maxsize=2)
+
+    def test_get(self):
+        self.obj.put('a', 1)
+        self.assertEqual(self.obj.get('a'), 1)
+        self.assertEqual(self.obj.get('b'), None)
+        self.assertEqual(self.obj.info(), (1, 1, 2, 1))
+
+    def test_eviction(self):
+        self.obj.put('a', 1)
+        self.obj.put('b', 2)
+        self.obj.get('a')
+        self.obj.put('c', 3)
+        self.assertEqual(self.obj.get('b'), None)
+        self.assertEqual(self.obj.get('a'), 1)
+        self.assertEqual(len(self.obj), 2)
+
+    def test_resize(self):
+        self.obj.put('a', 1)
+        self.obj.put('b', 2)
+        self.obj.resize(1)
+        self.assertEqual(self.obj.get('a'), None)
+        self.assertEqual(self.obj.get('b'), 2)
+
+    def test_clear(self):
+        self.obj.put('a', 1)
+        self.obj.get('a')
+        self.obj.clear()
+        self.assertEqual(self.obj.info(), (0, 0, 2, 0))
+
+
+class TestDateRangerCache(unittest.TestCase):
+
+    """
+    Test cases for caches of DateRanger methods
+    """
+
+    def setUp(self):
+        cache.cache_clear()
+
+    def tearDown(self):
+        cache.configure(maxsize=cache.DEFAULT_MAXSIZE, enabled=True)
+        cache.cache_clear()
+
+    def test_hits(self):
+        DateRanger(date(2015, 1, 5)).base_quarter()
+        DateRanger(date(2015, 2, 9)).base_quarter()
+        info = cache.cache_info()['get_quarter_range']
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_relative_quarter(self):
+        obj = DateRanger(date(2015, 1, 5))
+        expect = obj.prev_quarter(2).get_range()
+        self.assertEqual(obj.prev_quarter(2).get_range(), expect)
+        obj.set_base_date(date(2015, 7, 5))
+        expect = (date(2015, 1, 1), date(2015, 3, 31))
+        self.assertEqual(obj.prev_quarter(2).get_range(), expect)
+        self.assertEqual(cache.cache_info()['relative_quarter'].hits, 1)
+
+    def test_disabled(self):
+        cache.configure(enabled=False)
+        self.assertFalse(cache.is_enabled())
+        obj = DateRanger(date(2015, 1, 5))
+        expect = (date(2015, 1, 1), date(2015, 3, 31))
+        self.assertEqual(obj.base_quarter().get_range(), expect)
+        self.assertEqual(cache.cache_info()['get_quarter_range'].currsize, 0)
+
+    def test_maxsize(self):
+        cache.configure(maxsize=3)
+        for month in range(1, 13):
+            DateRanger(date(2015, month, 1)).base_week()
+        self.assertEqual(cache.cache_info()['get_week_range'].currsize, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from datetime import date
+from datetime import timedelta
+
+from DateRanger import DateFrame
+from DateRanger.cover import CoverPiece
+from DateRanger.cover import PartitionFormatter
+
+
+class TestCover(unittest.TestCase):
+
+    """
+    Test cases for calendar-aligned covers of DateFrame
+    """
+
+    def assertCovers(self, frame, pieces):
+        days = []
+        for piece in pieces:
+            days.extend(DateFrame(piece.start_date,
+                                  piece.end_date).each_day())
+        self.assertEqual(days, list(frame.each_day()))
+
+    def test_mixed(self):
+        frame = DateFrame(date(2013, 11, 29), date(2016, 2, 2))
+        pieces = frame.cover()
+        self.assertEqual(pieces[:3], [
+            CoverPiece('day', date(2013, 11, 29), date(2013, 11, 29)),
+            CoverPiece('day', date(2013, 11, 30), date(2013, 11, 30)),
+            CoverPiece('month', date(2013, 12, 1), date(2013, 12, 31)),
+        ])
+        self.assertEqual(pieces[3:5], [
+            CoverPiece('year', date(2014, 1, 1), date(2014, 12, 31)),
+            CoverPiece('year', date(2015, 1, 1), date(2015, 12, 31)),
+        ])
+        self.assertEqual(pieces[5],
+                         CoverPiece('month', date(2016, 1, 1),
+                                    date(2016, 1, 31)))
+        self.assertEqual(len(pieces), 8)
+        self.assertCovers(frame, pieces)
+
+    def test_quarters(self):
+        frame = DateFrame(date(2014, 2, 1), date(2014, 12, 30))
+        levels = [piece.granularity for piece in
+                  frame.cover(('year', 'quarter', 'month', 'day'))]
+        self.assertEqual(levels, ['month', 'month'] + ['quarter'] * 2 +
+                         ['month', 'month'] + ['day'] * 30)
+
+    def test_weeks(self):
+        frame = DateFrame(date(2015, 1, 1), date(2015, 1, 31))
+        pieces = frame.cover(('week',))
+        self.assertEqual(pieces[3], CoverPiece('week', date(2015, 1, 4),
+                                               date(2015, 1, 10)))
+        self.assertEqual(len(pieces), 3 + 4 + 0)
+        self.assertCovers(frame, pieces)
+        self.assertRaises(ValueError, frame.cover, ('day', 'month'))
+        self.assertRaises(ValueError, frame.cover, ('hour',))
+
+    def test_random(self):
+        rand = random.Random(15)
+        for n in range(100):
+            start = date(2012, 1, 1) + timedelta(rand.randint(0, 1000))
+            end = start + timedelta(rand.randint(0, 800))
+            frame = DateFrame(start, end)
+            self.assertCovers(frame, frame.cover())
+            self.assertCovers(frame, frame.cover(('quarter',)))
+
+    def test_partition_keys(self):
+        frame = DateFrame(date(2014, 12, 31), date(2015, 4, 30))
+        self.assertEqual(frame.partition_keys(), [
+            'year=2014/month=12/day=31',
+            'year=2015/month=01', 'year=2015/month=02',
+            'year=2015/month=03', 'year=2015/month=04',
+        ])
+        formatter = PartitionFormatter(year='%Y', month='%Y/%m',
+                                       day='%Y/%m/%d', suffix='/*')
+        self.assertEqual(
+            frame.partition_keys(formatter, ('year', 'quarter', 'day')),
+            ['2014/12/31/*', '2015/01/*', '2015/02/*', '2015/03/*'] +
+            ['2015/04/%02d/*' % day for day in range(1, 31)])
+        frame = DateFrame(date(2010, 1, 1), date(2019, 12, 31))
+        self.assertEqual(len(frame.partition_keys()), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
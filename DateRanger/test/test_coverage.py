@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+from datetime import timedelta
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from DateRanger import DateFrame
+from DateRanger import bucket
+from DateRanger import coverage
+from DateRanger.coverage import CoverageAnalyzer
+from DateRanger.coverage import find_gaps
+
+
+class TestCoverage(unittest.TestCase):
+
+    """
+    Test cases for coverage and gap detection
+    """
+
+    def setUp(self):
+        self.frame = DateFrame(date(2015, 1, 10), date(2015, 4, 20))
+        start = date(2015, 1, 1)
+        self.dates = [start + timedelta(days=n) for n in range(120)
+                      if not 20 <= n < 30 and n % 45 != 44]
+        # sorted with repeats
+        self.dates = sorted(self.dates * 3)
+
+    def test_days(self):
+        analyzer = CoverageAnalyzer(self.frame)
+        analyzer.update(self.dates)
+        self.assertEqual(analyzer.length, 101)
+        self.assertEqual(analyzer.outside, 9 * 3 + 10 * 3)
+        self.assertEqual(analyzer.missing(), [
+            DateFrame(date(2015, 1, 21), date(2015, 1, 30)),
+            DateFrame(date(2015, 2, 14), date(2015, 2, 14)),
+            DateFrame(date(2015, 3, 31), date(2015, 3, 31)),
+        ])
+        self.assertEqual(analyzer.count(), 89)
+        self.assertAlmostEqual(analyzer.ratio(), 89 / 101.0)
+        self.assertTrue(analyzer.is_covered(0))
+        self.assertFalse(analyzer.is_covered(11))
+
+    def test_unsorted(self):
+        dates = self.dates[::-1]
+        self.assertEqual(find_gaps(self.frame, dates),
+                         find_gaps(self.frame, self.dates))
+
+    def test_granularities(self):
+        dates = [date(2015, 1, 12), date(2015, 3, 31)]
+        # buckets are those of each_month(), each_week(), ...
+        self.assertEqual(find_gaps(self.frame, dates, 'month'),
+                         [DateFrame(date(2015, 2, 1), date(2015, 2, 28))])
+        self.assertEqual(find_gaps(self.frame, dates, 'year'), [])
+        self.assertEqual(find_gaps(self.frame, dates, 'week'), [
+            DateFrame(date(2015, 1, 10), date(2015, 1, 10)),
+            DateFrame(date(2015, 1, 18), date(2015, 3, 28)),
+            DateFrame(date(2015, 4, 5), date(2015, 4, 20)),
+        ])
+
+    def test_empty(self):
+        analyzer = CoverageAnalyzer(self.frame, 'week')
+        analyzer.update([])
+        self.assertEqual(analyzer.count(), 0)
+        self.assertEqual(analyzer.ratio(), 0.0)
+        self.assertEqual(analyzer.missing(), [self.frame])
+        self.assertTrue(analyzer.add(date(2015, 4, 20)))
+        self.assertFalse(analyzer.add(date(2015, 4, 21)))
+        self.assertEqual(analyzer.outside, 1)
+
+    def test_long_frame(self):
+        frame = DateFrame(date(1950, 1, 1), date(2049, 12, 31))
+        analyzer = CoverageAnalyzer(frame)
+        self.assertEqual(len(analyzer.bitmap), (36525 + 7) // 8)
+        analyzer.update(frame.each_day()[::2])
+        self.assertEqual(analyzer.count(), 18263)
+        self.assertEqual(len(analyzer.missing()), 18262)
+
+    @unittest.skipUnless(np, 'NumPy is not installed')
+    def test_numpy(self):
+        dates = np.array(self.dates, dtype='datetime64[D]')
+        np.random.shuffle(dates)
+        analyzer = CoverageAnalyzer(self.frame)
+        analyzer.update(dates.astype('datetime64[s]'))
+        self.assertEqual(analyzer.missing(), find_gaps(self.frame,
+                                                       self.dates))
+        self.assertEqual(analyzer.outside, 57)
+
+
+class TestCoverageWithoutNumPy(TestCoverage):
+
+    """
+    Test cases for coverage and gap detection without NumPy
+    """
+
+    def setUp(self):
+        super(TestCoverageWithoutNumPy, self).setUp()
+        self.np = coverage.np, bucket.np
+        coverage.np = None
+        bucket.np = None
+
+    def tearDown(self):
+        coverage.np, bucket.np = self.np
+
+
+if __name__ == '__main__':
+    unittest.main()
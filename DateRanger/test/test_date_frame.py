@@ -1,9 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import pickle
+import random
 import unittest
 from datetime import date
+from datetime import timedelta
 
 from DateRanger import DateFrame
+from DateRanger import DateRanger
+from DateRanger import intern_frame
 
 
 class TestDateFrame(unittest.TestCase):
@@ -119,6 +124,82 @@ class TestDateFrame(unittest.TestCase):
         result = [item for item in self.obj.each_year()]
         self.assertEqual(len(result), 2)
 
+    def test_equality(self):
+        self.set_dates(date(2009, 5, 20), date(2010, 6, 22))
+        self.assertEqual(self.obj, DateFrame(self.start_date, self.end_date))
+        self.assertNotEqual(self.obj, DateFrame(self.start_date,
+                                                date(2010, 6, 23)))
+        self.assertNotEqual(self.obj, (self.start_date, self.end_date))
+
+    def test_hash(self):
+        self.set_dates(date(2009, 5, 20), date(2010, 6, 22))
+        frames = set([self.obj, DateFrame(self.start_date, self.end_date)])
+        self.assertEqual(len(frames), 1)
+
+    def test_ordering(self):
+        frames = [DateFrame(date(2010, 1, 1), date(2010, 1, 3)),
+                  DateFrame(date(2009, 1, 1), date(2010, 1, 3)),
+                  DateFrame(date(2009, 1, 1), date(2009, 1, 3))]
+        expect = [frames[2], frames[1], frames[0]]
+        self.assertEqual(sorted(frames), expect)
+        self.assertTrue(frames[2] <= frames[1])
+
+    def test_repr(self):
+        self.set_dates(date(2009, 5, 20), date(2010, 6, 22))
+        expect = 'DateFrame(datetime.date(2009, 5, 20), ' \
+            'datetime.date(2010, 6, 22))'
+        self.assertEqual(repr(self.obj), expect)
+
+    def test_immutable(self):
+        self.set_dates(date(2009, 5, 20), date(2010, 6, 22))
+        with self.assertRaises(AttributeError):
+            self.obj.start_date = date(2009, 1, 1)
+        with self.assertRaises(AttributeError):
+            self.obj.foo = 1
+
+    def test_pickle(self):
+        self.set_dates(date(2009, 5, 20), date(2010, 6, 22))
+        self.assertEqual(pickle.loads(pickle.dumps(self.obj)), self.obj)
+
+    def test_intern_frame(self):
+        frame1 = intern_frame(date(2015, 1, 1), date(2015, 1, 31))
+        frame2 = intern_frame(date(2015, 1, 1), date(2015, 1, 31))
+        self.assertIs(frame1, frame2)
+
+    def test_intern_frames_ranger(self):
+        frame1 = DateRanger(date(2015, 1, 5), intern_frames=True).base_month()
+        frame2 = DateRanger(date(2015, 1, 9), intern_frames=True).base_month()
+        self.assertIs(frame1, frame2)
+
+    def test_weekday_counts(self):
+        self.set_dates(date(2015, 1, 1), date(2015, 1, 31))
+        self.assertEqual(self.obj.weekday_counts(), [4, 4, 4, 5, 5, 5, 4])
+        self.assertEqual(self.obj.count_weekdays(), 22)
+        self.assertEqual(self.obj.count_weekend_days(), 9)
+
+    def test_day_of_month_counts(self):
+        self.set_dates(date(2015, 1, 31), date(2016, 3, 29))
+        self.assertEqual(self.obj.count_day_of_month(1), 14)
+        self.assertEqual(self.obj.count_day_of_month(29), 13)
+        self.assertEqual(self.obj.count_day_of_month(31), 8)
+        self.assertEqual(self.obj.count_month_ends(), 14)
+
+    def test_counts_random(self):
+        rand = random.Random(2015)
+        for n in range(200):
+            start = date(1999, 1, 1) + timedelta(days=rand.randint(0, 800))
+            end = start + timedelta(days=rand.choice((0, 3, 27, 60, 400)))
+            self.set_dates(start, end)
+            days = list(self.obj.each_day())
+            self.assertEqual(self.obj.weekday_counts(), [
+                len([d for d in days if d.weekday() == weekday])
+                for weekday in range(7)])
+            for day in (1, 15, 28, 29, 30, 31):
+                self.assertEqual(self.obj.count_day_of_month(day),
+                                 len([d for d in days if d.day == day]))
+            self.assertEqual(self.obj.count_month_ends(), len(
+                [d for d in days if (d + timedelta(days=1)).day == 1]))
+
 
 if __name__ == '__main__':
     unittest.main()
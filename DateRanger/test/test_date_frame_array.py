@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from datetime import date
+
+from DateRanger import utils
+from DateRanger.objects import DateFrame
+from DateRanger.objects import DateFrameArray
+from DateRanger.exceptions import InvalidDateRange
+
+
+class TestDateFrameArray(unittest.TestCase):
+
+    """
+    Test cases for DateFrameArray
+    """
+
+    def setUp(self):
+        rand = random.Random(20150101)
+        base = date(2009, 1, 1).toordinal()
+        self.frames = []
+        for n in range(500):
+            start = base + rand.randint(0, 3000)
+            end = start + rand.choice((0, 1, 6, 7, 30, 90, 400, 2000))
+            self.frames.append(
+                DateFrame(date.fromordinal(start), date.fromordinal(end)))
+        self.obj = DateFrameArray.from_frames(self.frames)
+
+    def assertMatches(self, method, *args):
+        result = [int(value) for value in getattr(self.obj, method)(*args)]
+        expect = [getattr(frame, method)(*args) for frame in self.frames]
+        self.assertEqual(result, expect)
+
+    def test_len(self):
+        self.assertEqual(len(self.obj), 500)
+
+    def test_to_frames(self):
+        result = [frame.get_range() for frame in self.obj.to_frames()]
+        expect = [frame.get_range() for frame in self.frames]
+        self.assertEqual(result, expect)
+
+    def test_getitem(self):
+        self.assertEqual(self.obj[3].get_range(), self.frames[3].get_range())
+        self.assertEqual(self.obj.get_range(-1), self.frames[-1].get_range())
+        self.assertEqual(len(self.obj[10:20]), 10)
+
+    def test_invalid_range(self):
+        with self.assertRaises(InvalidDateRange):
+            DateFrameArray([10], [9])
+
+    def test_days(self):
+        self.assertMatches('days')
+
+    def test_weeks(self):
+        self.assertMatches('weeks')
+
+    def test_months(self):
+        self.assertMatches('months')
+
+    def test_quarters(self):
+        self.assertMatches('quarters')
+
+    def test_years(self):
+        self.assertMatches('years')
+
+    def test_count_weekday(self):
+        for weekday in range(7):
+            self.assertMatches('count_weekday', weekday)
+        self.assertMatches('count_weekdays')
+        self.assertMatches('count_weekend_days')
+
+    def test_count_day_of_month(self):
+        for day in range(1, 32):
+            self.assertMatches('count_day_of_month', day)
+        # leap days around century years
+        self.frames = [DateFrame(date(1896, 3, 1), date(2104, 2, 29)),
+                       DateFrame(date(1900, 2, 1), date(1900, 3, 1)),
+                       DateFrame(date(2000, 2, 29), date(2000, 2, 29))]
+        self.obj = DateFrameArray.from_frames(self.frames)
+        for day in (28, 29, 30):
+            self.assertMatches('count_day_of_month', day)
+        self.assertMatches('count_month_ends')
+
+
+class TestDateFrameArrayPython(TestDateFrameArray):
+
+    """
+    Test cases for DateFrameArray without NumPy
+    """
+
+    def setUp(self):
+        self.numpy = utils._numpy[:]
+        utils._numpy[:] = [None]
+        super(TestDateFrameArrayPython, self).setUp()
+
+    def tearDown(self):
+        utils._numpy[:] = self.numpy
+
+
+if __name__ == '__main__':
+    unittest.main()
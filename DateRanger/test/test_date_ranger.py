@@ -1,5 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
 import unittest
 from datetime import date
 from datetime import timedelta
@@ -119,6 +122,12 @@ class TestDateRanger(unittest.TestCase):
         expect = (date(2015, 1, 1), date(2015, 1, 31))
         self.assertEqual(self.obj.next_month(2).get_range(), expect)
 
+    def test_next_12month(self):
+        test_date = date(2014, 12, 16)
+        self.set_date(test_date)
+        expect = (date(2015, 12, 1), date(2015, 12, 31))
+        self.assertEqual(self.obj.next_month(12).get_range(), expect)
+
     def test_base_quarter(self):
         test_date = date(2015, 1, 16)
         self.set_date(test_date)
@@ -167,6 +176,12 @@ class TestDateRanger(unittest.TestCase):
         expect = (date(2015, 1, 1), date(2015, 3, 31))
         self.assertEqual(self.obj.next_quarter(6).get_range(), expect)
 
+    def test_next_4quarter(self):
+        test_date = date(2013, 11, 16)
+        self.set_date(test_date)
+        expect = (date(2014, 10, 1), date(2014, 12, 31))
+        self.assertEqual(self.obj.next_quarter(4).get_range(), expect)
+
     def test_base_year(self):
         test_date = date(2013, 7, 16)
         self.set_date(test_date)
@@ -197,6 +212,25 @@ class TestDateRanger(unittest.TestCase):
         expect = (date(2017, 1, 1), date(2017, 12, 31))
         self.assertEqual(self.obj.next_year(2).get_range(), expect)
 
+    def test_get_month_range(self):
+        self.set_date(date(2015, 7, 16))
+        self.assertEqual(self.obj.get_month_range(2016, 2),
+                         (date(2016, 2, 1), date(2016, 2, 29)))
+        self.assertEqual(self.obj.get_month_range(2015, 12),
+                         (date(2015, 12, 1), date(2015, 12, 31)))
+        for month in (0, 13, -1):
+            self.assertRaises(ValueError, self.obj.get_month_range, 2015,
+                              month)
+
+    def test_import_without_numpy(self):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys, DateRanger; print("numpy" in sys.modules)'],
+            cwd=root)
+        self.assertEqual(output.strip(), b'False')
+
 
 if __name__ == '__main__':
     unittest.main()
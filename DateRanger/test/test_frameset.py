@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from datetime import date
+
+from DateRanger import DateFrame
+from DateRanger.frameset import DateFrameSet
+
+
+def random_frames(rand, count):
+    base = date(2014, 1, 1).toordinal()
+    frames = []
+    for n in range(count):
+        start = base + rand.randint(0, 300)
+        end = start + rand.randint(0, 20)
+        frames.append(DateFrame(date.fromordinal(start),
+                                date.fromordinal(end)))
+    return frames
+
+
+def to_days(frames):
+    days = set()
+    for frame in frames:
+        days.update(frame.each_day())
+    return days
+
+
+class TestDateFrameSet(unittest.TestCase):
+
+    """
+    Test cases for DateFrameSet
+    """
+
+    def setUp(self):
+        rand = random.Random(2015)
+        self.frames1 = random_frames(rand, 30)
+        self.frames2 = random_frames(rand, 30)
+        self.obj1 = DateFrameSet(self.frames1)
+        self.obj2 = DateFrameSet(self.frames2)
+
+    def assertDays(self, obj, expect):
+        self.assertEqual(to_days(obj), expect)
+        frames = obj.frames()
+        for prev, frame in zip(frames, frames[1:]):
+            self.assertTrue(prev.end_date.toordinal() + 1 <
+                            frame.start_date.toordinal())
+
+    def test_normalize(self):
+        obj = DateFrameSet([DateFrame(date(2014, 1, 5), date(2014, 1, 9)),
+                            DateFrame(date(2014, 1, 1), date(2014, 1, 4)),
+                            DateFrame(date(2014, 1, 7), date(2014, 1, 8)),
+                            DateFrame(date(2014, 2, 1), date(2014, 2, 1))])
+        expect = [DateFrame(date(2014, 1, 1), date(2014, 1, 9)),
+                  DateFrame(date(2014, 2, 1), date(2014, 2, 1))]
+        self.assertEqual(obj.frames(), expect)
+        self.assertEqual(len(obj), 2)
+        self.assertEqual(obj.days(), 10)
+
+    def test_union(self):
+        self.assertDays(self.obj1 | self.obj2,
+                        to_days(self.frames1) | to_days(self.frames2))
+
+    def test_intersection(self):
+        self.assertDays(self.obj1 & self.obj2,
+                        to_days(self.frames1) & to_days(self.frames2))
+
+    def test_difference(self):
+        self.assertDays(self.obj1 - self.obj2,
+                        to_days(self.frames1) - to_days(self.frames2))
+        self.assertDays(self.obj2 - self.obj1,
+                        to_days(self.frames2) - to_days(self.frames1))
+
+    def test_complement(self):
+        frame = DateFrame(date(2014, 3, 1), date(2014, 6, 30))
+        self.assertDays(self.obj1.complement(frame),
+                        to_days([frame]) - to_days(self.frames1))
+
+    def test_days(self):
+        self.assertEqual(self.obj1.days(), len(to_days(self.frames1)))
+
+    def test_contains(self):
+        days = to_days(self.frames1)
+        for ordinal in range(date(2013, 12, 25).toordinal(),
+                             date(2014, 12, 31).toordinal()):
+            day = date.fromordinal(ordinal)
+            self.assertEqual(day in self.obj1, day in days)
+        frame = self.frames1[0]
+        self.assertIn(frame, self.obj1)
+
+    def test_empty(self):
+        obj = DateFrameSet()
+        self.assertFalse(obj)
+        self.assertEqual(obj.days(), 0)
+        self.assertEqual(obj | self.obj1, self.obj1)
+        self.assertNotIn(date(2014, 1, 1), obj)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from datetime import date
+
+from DateRanger import DateFrame
+from DateRanger.index import FrameIndex
+
+
+class TestFrameIndex(unittest.TestCase):
+
+    """
+    Test cases for FrameIndex
+    """
+
+    def setUp(self):
+        self.rand = random.Random(2015)
+        self.frames = [self.random_frame() for n in range(400)]
+        self.obj = FrameIndex(self.frames)
+
+    def random_frame(self):
+        start = date(2014, 1, 1).toordinal() + self.rand.randint(0, 365)
+        end = start + self.rand.choice((0, 1, 5, 30, 90, 200))
+        return DateFrame(date.fromordinal(start), date.fromordinal(end))
+
+    def check(self):
+        for n in range(50):
+            day = date.fromordinal(date(2013, 12, 1).toordinal() +
+                                   self.rand.randint(0, 650))
+            expect = [frame for frame in self.frames
+                      if frame.start_date <= day <= frame.end_date]
+            self.assertEqual(sorted(self.obj.stab(day)), sorted(expect))
+
+            query = self.random_frame()
+            expect = [frame for frame in self.frames
+                      if frame.start_date <= query.end_date and
+                      frame.end_date >= query.start_date]
+            self.assertEqual(sorted(self.obj.overlap(query)), sorted(expect))
+
+    def test_bulk(self):
+        self.assertEqual(len(self.obj), 400)
+        self.check()
+
+    def test_insert_remove(self):
+        for n in range(300):
+            if self.rand.random() < 0.5:
+                frame = self.random_frame()
+                self.frames.append(frame)
+                self.obj.insert(frame)
+            else:
+                frame = self.frames.pop(self.rand.randrange(len(self.frames)))
+                self.obj.remove(frame)
+            if n % 60 == 0:
+                self.check()
+        self.assertEqual(len(self.obj), len(self.frames))
+        self.check()
+
+    def test_duplicates(self):
+        frame = DateFrame(date(2020, 1, 1), date(2020, 1, 5))
+        obj = FrameIndex([frame, frame])
+        self.assertEqual(obj.stab(date(2020, 1, 2)), [frame, frame])
+        obj.remove(frame)
+        self.assertEqual(obj.stab(date(2020, 1, 2)), [frame])
+        self.assertIn(frame, obj)
+        obj.remove(frame)
+        self.assertNotIn(frame, obj)
+        self.assertRaises(KeyError, obj.remove, frame)
+
+    def test_stab_many(self):
+        days = [date(2014, 5, 1), date(2014, 5, 2), date(2014, 5, 1)]
+        result = self.obj.stab_many(days)
+        self.assertEqual([sorted(frames) for frames in result],
+                         [sorted(self.obj.stab(day)) for day in days])
+        result = self.obj.stab_many(day for day in days)
+        self.assertEqual([sorted(frames) for frames in result],
+                         [sorted(self.obj.stab(day)) for day in days])
+
+    def test_empty(self):
+        obj = FrameIndex()
+        self.assertEqual(obj.stab(date(2014, 5, 1)), [])
+        frame = DateFrame(date(2014, 5, 1), date(2014, 5, 1))
+        obj.insert(frame)
+        self.assertEqual(obj.overlap(frame), [frame])
+
+
+if __name__ == '__main__':
+    unittest.main()
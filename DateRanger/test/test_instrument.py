@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import threading
+import unittest
+from datetime import date
+
+from DateRanger import DateRanger
+from DateRanger import DateFrame
+from DateRanger import instrument
+
+
+class TestInstrument(unittest.TestCase):
+
+    """
+    Test cases for opt-in instrumentation
+    """
+
+    def setUp(self):
+        self.base_week = DateRanger.base_week
+        self.events = []
+        instrument.reset()
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+
+    def test_disabled(self):
+        self.assertFalse(instrument.is_enabled())
+        DateRanger(date(2015, 1, 19)).base_week()
+        self.assertEqual(instrument.snapshot(), {})
+
+    def test_calls(self):
+        instrument.enable()
+        self.assertTrue(instrument.is_enabled())
+        obj = DateRanger(date(2015, 1, 19))
+        for n in range(10):
+            obj.prev_week(n)
+        stats = instrument.snapshot()['DateRanger.prev_week']
+        self.assertEqual(stats.calls, 10)
+        self.assertTrue(0 < stats.p50 <= stats.p90 <= stats.p99 <= stats.max)
+        self.assertAlmostEqual(stats.mean * 10, stats.total)
+        self.assertEqual(stats.items, 0)
+
+    def test_items(self):
+        instrument.enable()
+        frame = DateFrame(date(2015, 1, 1), date(2015, 1, 31))
+        frame.each_day()
+        frame.each_week()
+        self.assertEqual(instrument.snapshot()['DateFrame.each_day'].items,
+                         31)
+        self.assertEqual(instrument.snapshot()['DateFrame.each_week'].items,
+                         5)
+
+    def test_iterator_items(self):
+        instrument.enable()
+        frame = DateFrame(date(2015, 1, 1), date(2015, 1, 31))
+        batches = frame.each_day(chunk_size=10)
+        stats = instrument.snapshot()['DateFrame.each_day']
+        self.assertEqual((stats.calls, stats.items), (1, 0))
+        self.assertEqual(len(list(batches)), 4)
+        stats = instrument.snapshot()['DateFrame.each_day']
+        self.assertEqual((stats.calls, stats.items), (1, 31))
+
+        batches = frame.each_week(chunk_size=2)
+        next(batches)
+        batches.close()
+        stats = instrument.snapshot()['DateFrame.each_week']
+        self.assertEqual((stats.calls, stats.items), (1, 2))
+
+        # a result which is never iterated is still a call
+        frame.each_month(chunk_size=1)
+        stats = instrument.snapshot()['DateFrame.each_month']
+        self.assertEqual((stats.calls, stats.items), (1, 0))
+
+    def test_concurrent_enable(self):
+        def toggle():
+            for n in range(50):
+                instrument.enable()
+                instrument.disable()
+        threads = [threading.Thread(target=toggle) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(DateRanger.base_week, self.base_week)
+        instrument.enable()
+        DateRanger(date(2015, 1, 19)).base_week()
+        self.assertEqual(
+            instrument.snapshot()['DateRanger.base_week'].calls, 1)
+
+    def test_callback(self):
+        instrument.enable(callback=lambda *event: self.events.append(event))
+        DateFrame(date(2015, 1, 1), date(2015, 3, 31)).each_month()
+        name, elapsed, length = self.events[-1]
+        self.assertEqual((name, length), ('DateFrame.each_month', 2))
+        self.assertTrue(elapsed >= 0)
+
+    def test_reservoir(self):
+        instrument.enable(reservoir_size=8)
+        frame = DateFrame(date(2015, 1, 1), date(2015, 3, 31))
+        for n in range(100):
+            frame.days()
+        self.assertEqual(instrument.snapshot()['DateFrame.days'].calls, 100)
+        self.assertEqual(len(instrument._stats['DateFrame.days'].samples), 8)
+
+    def test_disable(self):
+        instrument.enable()
+        self.assertNotEqual(DateRanger.base_week, self.base_week)
+        instrument.disable()
+        self.assertEqual(DateRanger.base_week, self.base_week)
+        DateRanger(date(2015, 1, 19)).base_week()
+        self.assertNotIn('DateRanger.base_week', instrument.snapshot())
+
+    def test_reset(self):
+        instrument.enable()
+        DateRanger(date(2015, 1, 19)).base_week()
+        instrument.reset()
+        self.assertEqual(instrument.snapshot(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
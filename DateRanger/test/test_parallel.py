@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from DateRanger import DateFrame
+from DateRanger.parallel import get_periods
+from DateRanger.parallel import map_shards
+from DateRanger.parallel import shard_frame
+
+
+def count_days(start_date, end_date):
+    return (end_date - start_date).days + 1
+
+
+class TestParallel(unittest.TestCase):
+
+    """
+    Test cases for sharded execution over DateFrames
+    """
+
+    def setUp(self):
+        self.frame = DateFrame(date(2014, 11, 20), date(2016, 3, 10))
+
+    def get_periods(self, granularity):
+        periods = getattr(self.frame, 'each_' + granularity)()
+        if granularity == 'day':
+            return [(day, day) for day in periods]
+        return list(periods)
+
+    def test_shard_frame(self):
+        shards = list(shard_frame(self.frame, 'day', shards=4))
+        self.assertEqual(len(shards), 4)
+        self.assertEqual(shards[0][0], date(2014, 11, 20).toordinal())
+        self.assertEqual(shards[-1][1], date(2016, 3, 10).toordinal())
+        sizes = [last - first + 1 for first, last in shards]
+        self.assertTrue(max(sizes) - min(sizes) <= 1)
+        for previous, current in zip(shards, shards[1:]):
+            self.assertEqual(previous[1] + 1, current[0])
+
+        shards = list(shard_frame(self.frame, 'month', chunk_size=5))
+        self.assertEqual(len(shards), 4)
+        self.assertEqual(shards[0], (date(2014, 11, 1).toordinal(),
+                                     date(2015, 3, 31).toordinal()))
+        self.assertEqual(len(list(shard_frame(self.frame, 'year', shards=8))),
+                         3)
+        self.assertRaises(ValueError, shard_frame, self.frame, 'day',
+                          chunk_size=0)
+        self.assertRaises(ValueError, shard_frame, self.frame, 'day',
+                          shards=0)
+        self.assertRaises(ValueError, shard_frame, self.frame, 'hour')
+
+    def test_get_periods(self):
+        for granularity in ('day', 'week', 'month', 'quarter', 'year'):
+            expect = self.get_periods(granularity)
+            periods = []
+            for first, last in shard_frame(self.frame, granularity, 3):
+                periods.extend(get_periods(granularity, first, last))
+            if granularity == 'day':
+                periods = [(day, day) for day in periods]
+            self.assertEqual(periods, expect, granularity)
+
+    def test_map_shards(self):
+        for granularity in ('day', 'week', 'month', 'quarter', 'year'):
+            expect = [(period, count_days(*period))
+                      for period in self.get_periods(granularity)]
+            results = list(map_shards(count_days, self.frame, granularity,
+                                      executor='thread', workers=3,
+                                      chunk_size=7, max_in_flight=2))
+            self.assertEqual(results, expect, granularity)
+
+    def test_unordered(self):
+        with ThreadPoolExecutor(4) as executor:
+            results = list(map_shards(count_days, self.frame, 'month',
+                                      executor=executor, ordered=False))
+            self.assertEqual(sorted(results),
+                             [(period, count_days(*period))
+                              for period in self.get_periods('month')])
+            # a given executor is not shut down
+            self.assertEqual(executor.submit(abs, -1).result(), 1)
+
+    def test_early_stop(self):
+        started = []
+
+        def record(start_date, end_date):
+            started.append(start_date)
+            return start_date
+
+        with ThreadPoolExecutor(1) as executor:
+            results = map_shards(record, self.frame, 'day',
+                                 executor=executor, max_in_flight=50)
+            next(results)
+            results.close()
+            executor.submit(abs, -1).result()
+        # queued tasks were cancelled instead of run
+        self.assertTrue(len(started) < 50)
+
+    def test_process_pool(self):
+        results = list(map_shards(count_days, self.frame, 'quarter',
+                                  workers=2))
+        self.assertEqual(results, [(period, count_days(*period))
+                                   for period in self.get_periods('quarter')])
+        self.assertRaises(ValueError, list, map_shards(
+            count_days, self.frame, executor='fiber'))
+
+
+if __name__ == '__main__':
+    unittest.main()
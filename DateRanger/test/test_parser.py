@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+from datetime import timedelta
+
+from DateRanger import DateRanger
+from DateRanger import DateFrame
+from DateRanger import parser
+from DateRanger import utils
+from DateRanger.parser import parse
+from DateRanger.parser import resolve
+from DateRanger.exceptions import InvalidExpression
+
+
+class TestParser(unittest.TestCase):
+
+    """
+    Test cases for period expressions
+    """
+
+    def setUp(self):
+        self.bdate = date(2015, 1, 19)
+        self.ranger = DateRanger(self.bdate)
+
+    def test_relative(self):
+        cases = (
+            ('today', self.ranger.base_day()),
+            ('Yesterday', self.ranger.prev_day()),
+            ('tomorrow', self.ranger.next_day()),
+            ('this week', self.ranger.base_week()),
+            ('current  quarter', self.ranger.base_quarter()),
+            ('prev week', self.ranger.prev_week()),
+            ('previous year', self.ranger.prev_year()),
+            ('last 3 months', self.ranger.prev_month(3)),
+            ('next 2 quarters', self.ranger.next_quarter(2)),
+            ('next 14 days', self.ranger.next_day(14)),
+        )
+        for text, expect in cases:
+            self.assertEqual(resolve(text, self.bdate), expect, text)
+
+    def test_absolute(self):
+        cases = (
+            ('2014-Q3', (date(2014, 7, 1), date(2014, 9, 30))),
+            ('2014-11', (date(2014, 11, 1), date(2014, 11, 30))),
+            ('2016-2', (date(2016, 2, 1), date(2016, 2, 29))),
+            ('2014', (date(2014, 1, 1), date(2014, 12, 31))),
+            ('2014-11-05', (date(2014, 11, 5), date(2014, 11, 5))),
+            ('2014-11-01..2014-12-20', (date(2014, 11, 1),
+                                        date(2014, 12, 20))),
+            ('2014-Q3 .. 2014-11', (date(2014, 7, 1), date(2014, 11, 30))),
+            ('last 2 months..this month', (date(2014, 11, 1),
+                                           date(2015, 1, 31))),
+        )
+        for text, expect in cases:
+            self.assertEqual(resolve(text, self.bdate).get_range(), expect,
+                             text)
+
+    def test_invalid(self):
+        for text in ('', 'this 2 weeks', 'last hour', '2014-13', '2014-Q5',
+                     '2014-02-30', 'a..b..c', '..2014', 'next month..2014'):
+            self.assertRaises(InvalidExpression, resolve, text, self.bdate)
+
+    def test_cache(self):
+        expression = parse('last 3 months')
+        self.assertIs(parse('last 3 months'), expression)
+        frame = expression.resolve(self.bdate)
+        self.assertIs(expression.resolve(self.bdate), frame)
+        self.assertEqual(expression.resolve(date(2015, 3, 5)).get_range(),
+                         (date(2014, 12, 1), date(2014, 12, 31)))
+        self.assertEqual(resolve('today'), DateFrame(date.today(),
+                                                     date.today()))
+
+    def test_resolve_many(self):
+        bdates = [self.bdate + timedelta(days=n * 17) for n in range(30)]
+        for text in ('prev week', 'next 5 months', '2014-Q3..this year',
+                     'yesterday..tomorrow', '2014'):
+            starts, ends = parse(text).resolve_many(bdates)
+            for n, bdate in enumerate(bdates):
+                expect = resolve(text, bdate).get_range()
+                self.assertEqual((starts[n], ends[n]), expect, text)
+
+    def test_resolve_many_invalid(self):
+        expression = parse('next 3 months..last year')
+        self.assertRaises(InvalidExpression, expression.resolve_many,
+                          [date(2015, 6, 1)])
+        # valid for some base dates only
+        expression = parse('2015-03..next month')
+        self.assertRaises(InvalidExpression, expression.resolve_many,
+                          [date(2015, 6, 1), date(2015, 1, 10)])
+        starts, ends = expression.resolve_many([date(2015, 6, 1)])
+        self.assertEqual((starts[0], ends[0]),
+                         (date(2015, 3, 1), date(2015, 7, 31)))
+
+
+class TestParserWithoutNumPy(TestParser):
+
+    """
+    Test cases for period expressions without NumPy
+    """
+
+    def setUp(self):
+        super(TestParserWithoutNumPy, self).setUp()
+        self.np = parser.np, utils._numpy[:]
+        parser.np = None
+        utils._numpy[:] = [None]
+
+    def tearDown(self):
+        parser.np, utils._numpy[:] = self.np
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+
+from DateRanger import DateRanger
+from DateRanger import DateFrameArray
+
+
+class TestRelativePeriods(unittest.TestCase):
+
+    """
+    Test cases for bulk relative periods of DateRanger
+    """
+
+    def setUp(self):
+        self.dates = [date(2015, 1, 16), date(2014, 12, 31),
+                      date(2015, 3, 1), date(2015, 1, 18)]
+
+    def assertMatches(self, unit, plural):
+        for base_date in self.dates:
+            obj = DateRanger(base_date)
+            relative = getattr(obj, 'relative_' + plural)(-25, 26, 3)
+            self.assertEqual(len(relative), 17)
+            for n, item in enumerate(relative):
+                offset = -25 + n * 3
+                expect = getattr(obj, 'next_' + unit)(offset).get_range()
+                if unit == 'day':
+                    expect = expect[0]
+                self.assertEqual(item, expect)
+
+            prev = getattr(obj, 'prev_' + plural)(24)
+            next = getattr(obj, 'next_' + plural)(24)
+            self.assertEqual(len(prev), 24)
+            for n in (0, 11, 23):
+                expect = getattr(obj, 'prev_' + unit)(n + 1).get_range()
+                result = prev[n] if unit != 'day' else (prev[n], prev[n])
+                self.assertEqual(result, expect)
+                expect = getattr(obj, 'next_' + unit)(n + 1).get_range()
+                result = next[n] if unit != 'day' else (next[n], next[n])
+                self.assertEqual(result, expect)
+
+    def test_days(self):
+        self.assertMatches('day', 'days')
+
+    def test_weeks(self):
+        self.assertMatches('week', 'weeks')
+
+    def test_months(self):
+        self.assertMatches('month', 'months')
+
+    def test_quarters(self):
+        self.assertMatches('quarter', 'quarters')
+
+    def test_years(self):
+        self.assertMatches('year', 'years')
+
+    def test_range_signature(self):
+        obj = DateRanger(date(2015, 1, 16))
+        self.assertEqual(list(obj.relative_months(3)),
+                         list(obj.relative_months(0, 3)))
+        self.assertEqual(len(obj.relative_months(3, 0)), 0)
+
+    def test_frame_array(self):
+        obj = DateRanger(date(2015, 1, 16))
+        months = obj.prev_months(12)
+        result = DateFrameArray.from_periods(months)
+        self.assertEqual(len(result), 12)
+        self.assertEqual([frame.get_range() for frame in result],
+                         list(months))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import threading
+import unittest
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from datetime import tzinfo
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+from DateRanger import DateRanger
+from DateRanger.shared import SharedDateRanger
+from DateRanger.shared import get_next_midnight
+
+
+TAIPEI = timezone(timedelta(hours=8))
+
+
+class PytzLikeZone(tzinfo):
+
+    """
+    A zone which behaves like pytz: attached with replace(), it has the
+    local mean time offset of Taipei (+08:06); localize() and fromutc()
+    use the standard one.
+    """
+
+    def utcoffset(self, dt):
+        return timedelta(hours=8, minutes=6)
+
+    def dst(self, dt):
+        return timedelta(0)
+
+    def fromutc(self, dt):
+        return (dt + timedelta(hours=8)).replace(tzinfo=self)
+
+    def localize(self, dt):
+        return dt.replace(tzinfo=TAIPEI)
+
+
+class FakeClock(object):
+
+    def __init__(self, moment):
+        self.now = (moment - datetime(1970, 1, 1, tzinfo=timezone.utc)) \
+            .total_seconds()
+
+    def __call__(self):
+        return self.now
+
+
+class TestSharedDateRanger(unittest.TestCase):
+
+    """
+    Test cases for SharedDateRanger
+    """
+
+    def setUp(self):
+        # 23:59:59 on 2015-01-18 in Taipei
+        self.clock = FakeClock(datetime(2015, 1, 18, 23, 59, 59,
+                                        tzinfo=TAIPEI))
+        self.obj = SharedDateRanger(tz=TAIPEI, clock=self.clock)
+
+    def assertSameRanges(self, base_date):
+        expect = DateRanger(base_date)
+        for unit in ('day', 'week', 'month', 'quarter', 'year'):
+            for kind in ('base_', 'prev_', 'next_'):
+                name = kind + unit
+                self.assertEqual(getattr(self.obj, name)(),
+                                 getattr(expect, name)(), name)
+
+    def test_next_midnight(self):
+        today, expires = get_next_midnight(self.clock.now, TAIPEI)
+        self.assertEqual(today, date(2015, 1, 18))
+        self.assertEqual(expires, self.clock.now + 1)
+        today, expires = get_next_midnight(self.clock.now, timezone.utc)
+        self.assertEqual(today, date(2015, 1, 18))
+        self.assertEqual(expires, self.clock.now + 8 * 3600 + 1)
+
+    def test_next_midnight_localize(self):
+        today, expires = get_next_midnight(self.clock.now, PytzLikeZone())
+        self.assertEqual(today, date(2015, 1, 18))
+        self.assertEqual(expires, self.clock.now + 1)
+
+    @unittest.skipIf(ZoneInfo is None, 'zoneinfo is not available')
+    def test_next_midnight_zoneinfo(self):
+        # clocks go forward at 2:00 on 2015-03-08 in New York
+        zone = ZoneInfo('America/New_York')
+        clock = FakeClock(datetime(2015, 3, 8, 12, tzinfo=zone))
+        today, expires = get_next_midnight(clock.now, zone)
+        self.assertEqual(today, date(2015, 3, 8))
+        self.assertEqual(expires, clock.now + 12 * 3600)
+        # the first second of the day, 11 hours before noon
+        today, expires = get_next_midnight(clock.now - 11 * 3600, zone)
+        self.assertEqual(today, date(2015, 3, 8))
+        self.assertEqual(expires, clock.now + 12 * 3600)
+
+    def test_ranges(self):
+        self.assertEqual(self.obj.bdate, date(2015, 1, 18))
+        self.assertSameRanges(date(2015, 1, 18))
+        self.assertEqual(self.obj.prev_month(3),
+                         DateRanger(date(2015, 1, 18)).prev_month(3))
+
+    def test_keywords(self):
+        ranger = DateRanger(date(2015, 1, 18))
+        snapshot = self.obj.snapshot()
+        self.assertIs(self.obj.prev_week(weeks=1), snapshot.prev_week)
+        self.assertIs(self.obj.next_day(1), snapshot.next_day)
+        self.assertEqual(self.obj.prev_month(months=3),
+                         ranger.prev_month(months=3))
+        self.assertEqual(self.obj.next_quarter(quarters=2),
+                         ranger.next_quarter(2))
+        self.assertEqual(self.obj.prev_year(years=0), ranger.prev_year(0))
+        self.assertEqual(self.obj.prev_day(days=5), ranger.prev_day(5))
+        self.assertRaises(TypeError, self.obj.prev_month, weeks=1)
+        self.assertRaises(TypeError, self.obj.prev_month, 1, months=1)
+
+    def test_midnight(self):
+        snapshot = self.obj.snapshot()
+        self.assertIs(self.obj.snapshot(), snapshot)
+        self.clock.now += 1
+        self.assertEqual(self.obj.bdate, date(2015, 1, 19))
+        self.assertSameRanges(date(2015, 1, 19))
+        self.assertEqual(snapshot.base_date, date(2015, 1, 18))
+
+    def test_base_date(self):
+        obj = SharedDateRanger(clock=self.clock, base_date=date(2014, 2, 28))
+        self.clock.now += 86400 * 10
+        self.assertEqual(obj.next_day().get_range(),
+                         (date(2014, 3, 1), date(2014, 3, 1)))
+        obj.set_base_date()
+        self.assertEqual(obj.bdate,
+                         datetime.fromtimestamp(self.clock.now).date())
+
+    def test_threads(self):
+        results = []
+
+        def read():
+            for n in range(200):
+                results.append(self.obj.base_week())
+
+        threads = [threading.Thread(target=read) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        self.clock.now += 1
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 800)
+        self.assertTrue(set(results) <= set([
+            DateRanger(date(2015, 1, 18)).base_week(),
+            DateRanger(date(2015, 1, 19)).base_week()]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from DateRanger import DateFrame
+from DateRanger import storage
+from DateRanger import utils
+from DateRanger.objects import DateFrameArray
+
+
+class TestStorage(unittest.TestCase):
+
+    """
+    Test cases for binary serialization of DateFrames
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'frames.bin')
+        self.frames = [
+            DateFrame(date(2015, 3, 1), date(2015, 3, 31)),
+            DateFrame(date(2014, 1, 1), date(2014, 12, 31)),
+            DateFrame(date(2015, 3, 1), date(2015, 3, 2)),
+            DateFrame(date(2016, 2, 29), date(2016, 2, 29)),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_format(self):
+        output = io.BytesIO()
+        storage.dump(self.frames, output)
+        data = output.getvalue()
+        self.assertEqual(len(data), 16 + 4 * 8)
+        self.assertEqual(data[:4], b'DFRA')
+        self.assertEqual(storage.HEADER.unpack(data[:16])[1:], (1, 0, 4))
+
+    def test_round_trip(self):
+        storage.dump(self.frames, self.path)
+        for use_mmap in (True, False):
+            stored = storage.load(self.path, use_mmap)
+            self.assertEqual(len(stored), 4)
+            self.assertFalse(stored.is_sorted)
+            self.assertEqual(stored.to_frames(), self.frames)
+            self.assertEqual(stored[1], self.frames[1])
+            self.assertEqual(stored[1:3].to_frames(), self.frames[1:3])
+            self.assertEqual(list(stored.days()), [30, 364, 1, 0])
+            self.assertEqual(list(stored.months()), [0, 11, 0, 0])
+            stored.close()
+
+    def test_sorted(self):
+        storage.dump(DateFrameArray.from_frames(self.frames), self.path,
+                     sort=True)
+        with storage.load(self.path) as stored:
+            self.assertTrue(stored.is_sorted)
+            self.assertEqual(stored.to_frames(), sorted(self.frames))
+            positions = stored.find_starts(date(2015, 3, 1))
+            self.assertEqual(list(positions), [1, 2])
+            positions = stored.find_starts(date(2015, 1, 1),
+                                           date(2016, 12, 31))
+            self.assertEqual(list(positions), [1, 2, 3])
+
+        storage.dump(sorted(self.frames), self.path)
+        with storage.load(self.path) as stored:
+            self.assertTrue(stored.is_sorted)
+
+    def test_close_with_slices(self):
+        storage.dump(self.frames, self.path)
+        stored = storage.load(self.path)
+        part = stored[1:3]
+        stored.close()
+        stored.close()
+        self.assertEqual(part.to_frames(), self.frames[1:3])
+        self.assertEqual(len(stored), 0)
+
+        with storage.load(self.path) as stored:
+            part = stored[::-2]
+        self.assertEqual(part.to_frames(), self.frames[::-2])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_close_with_exports(self):
+        storage.dump(self.frames, self.path)
+        stored = storage.load(self.path)
+        starts = np.asarray(stored.starts)
+        stored.close()
+        self.assertEqual(starts[0], self.frames[0].start_date.toordinal())
+
+    def test_empty(self):
+        storage.dump([], self.path)
+        with storage.load(self.path) as stored:
+            self.assertEqual(len(stored), 0)
+            self.assertEqual(stored.to_frames(), [])
+
+    def test_invalid(self):
+        with open(self.path, 'wb') as output:
+            output.write(b'DFRB' + b'\0' * 12)
+        self.assertRaises(ValueError, storage.load, self.path)
+        storage.dump(self.frames, self.path)
+        with open(self.path, 'ab') as output:
+            output.write(b'\0')
+        self.assertRaises(ValueError, storage.load, self.path)
+        with open(self.path, 'wb') as output:
+            output.write(b'DFRA')
+        self.assertRaises(ValueError, storage.load, self.path)
+
+
+class TestStorageWithoutNumPy(TestStorage):
+
+    """
+    Test cases for binary serialization without NumPy
+    """
+
+    def setUp(self):
+        super(TestStorageWithoutNumPy, self).setUp()
+        self.np = storage.np, utils._numpy[:]
+        storage.np = None
+        utils._numpy[:] = [None]
+
+    def tearDown(self):
+        storage.np, utils._numpy[:] = self.np
+        super(TestStorageWithoutNumPy, self).tearDown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+from datetime import timedelta
+
+from DateRanger import DateRanger
+from DateRanger import DateFrame
+from DateRanger import cache
+from DateRanger import table
+from DateRanger.table import CalendarTable
+
+
+class TestCalendarTable(unittest.TestCase):
+
+    """
+    Test cases for CalendarTable
+    """
+
+    def setUp(self):
+        self.obj = CalendarTable(1999, 2001)
+
+    def test_span(self):
+        self.assertTrue(self.obj.covers(date(1999, 1, 1).toordinal()))
+        self.assertTrue(self.obj.covers(date(2001, 12, 31).toordinal()))
+        self.assertFalse(self.obj.covers(date(2002, 1, 1).toordinal()))
+        self.assertEqual(len(self.obj.week_start), 365 * 3 + 1)
+
+    def test_lookups(self):
+        day = date(1999, 1, 1)
+        while day <= date(2001, 12, 31):
+            ordinal = day.toordinal()
+            ranger = DateRanger(day)
+            start, end = self.obj.quarter_range(ordinal)
+            expect = ranger.base_quarter().get_range()
+            self.assertEqual((date.fromordinal(start),
+                              date.fromordinal(end)), expect)
+            start, end = self.obj.week_range(ordinal)
+            expect = ranger.base_week().get_range()
+            self.assertEqual((date.fromordinal(start),
+                              date.fromordinal(end)), expect)
+            day += timedelta(days=1)
+
+
+class TestTableLookup(unittest.TestCase):
+
+    """
+    Test cases for DateRanger with the calendar table
+    """
+
+    def setUp(self):
+        cache.configure(enabled=False)
+        table.enable(2014, 2015)
+
+    def tearDown(self):
+        cache.configure(enabled=True)
+        table.disable()
+
+    def test_enable(self):
+        self.assertEqual(table.get_table().first_year, 2014)
+        self.assertIsNone(table.lookup(date(2016, 1, 1).toordinal()))
+        table.disable()
+        self.assertIsNone(table.get_table())
+
+    def test_date_ranger(self):
+        for day in (date(2013, 12, 31), date(2014, 2, 14),
+                    date(2015, 11, 15), date(2016, 1, 1)):
+            obj = DateRanger(day)
+            self.assertEqual(obj.base_month().get_range(),
+                             obj.get_month_range(obj.byear, obj.bmonth))
+            self.assertEqual(obj.base_quarter(), DateFrame(
+                *obj.get_quarter_range(obj.byear, obj.bquarter)))
+            self.assertEqual(obj.base_week().get_range(),
+                             obj.get_week_range(day))
+
+
+if __name__ == '__main__':
+    unittest.main()
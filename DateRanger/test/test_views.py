@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+from datetime import timedelta
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from DateRanger import DateFrame
+from DateRanger import utils
+
+
+class TestPeriodSequence(unittest.TestCase):
+
+    """
+    Test cases for lazy sequences returned by DateFrame.each_*()
+    """
+
+    def set_dates(self, start_date, end_date):
+        self.obj = DateFrame(start_date, end_date)
+
+    def test_day_len(self):
+        self.set_dates(date(1990, 1, 1), date(2029, 12, 31))
+        self.assertEqual(len(self.obj.each_day()), 14610)
+
+    def test_day_getitem(self):
+        self.set_dates(date(1990, 1, 1), date(2029, 12, 31))
+        days = self.obj.each_day()
+        self.assertEqual(days[0], date(1990, 1, 1))
+        self.assertEqual(days[500], date(1991, 5, 16))
+        self.assertEqual(days[-1], date(2029, 12, 31))
+        self.assertRaises(IndexError, lambda: days[14610])
+
+    def test_day_slice(self):
+        self.set_dates(date(2014, 12, 30), date(2015, 1, 10))
+        days = self.obj.each_day()
+        expect = [date(2014, 12, 31), date(2015, 1, 2), date(2015, 1, 4)]
+        self.assertEqual(list(days[1:7:2]), expect)
+        self.assertEqual(len(days[1:7:2]), 3)
+        self.assertEqual(list(days[-2:]),
+                         [date(2015, 1, 9), date(2015, 1, 10)])
+        self.assertEqual(len(days[20:]), 0)
+
+    def test_day_reversed(self):
+        self.set_dates(date(2014, 12, 30), date(2015, 1, 2))
+        result = list(reversed(self.obj.each_day()))
+        expect = [date(2015, 1, 2), date(2015, 1, 1),
+                  date(2014, 12, 31), date(2014, 12, 30)]
+        self.assertEqual(result, expect)
+
+    def test_day_contains(self):
+        self.set_dates(date(2014, 12, 30), date(2015, 1, 2))
+        days = self.obj.each_day()
+        self.assertIn(date(2015, 1, 1), days)
+        self.assertNotIn(date(2015, 1, 3), days)
+        self.assertNotIn('2015-01-01', days)
+        self.assertEqual(days.index(date(2015, 1, 1)), 2)
+        self.assertEqual(days.count(date(2015, 1, 3)), 0)
+
+    def test_week(self):
+        self.set_dates(date(2014, 12, 2), date(2015, 1, 19))
+        weeks = self.obj.each_week()
+        self.assertEqual(len(weeks), 8)
+        expect = (date(2015, 1, 18), date(2015, 1, 24))
+        self.assertEqual(weeks[-1], expect)
+        self.assertIn(expect, weeks)
+        self.assertNotIn((date(2015, 1, 19), date(2015, 1, 25)), weeks)
+        self.assertEqual(list(weeks[2:4]), list(weeks)[2:4])
+
+    def test_month(self):
+        self.set_dates(date(2009, 5, 20), date(2011, 6, 22))
+        months = self.obj.each_month()
+        self.assertEqual(len(months), 26)
+        self.assertEqual(months[9], (date(2010, 2, 1), date(2010, 2, 28)))
+        self.assertEqual(months.index((date(2010, 2, 1), date(2010, 2, 28))),
+                         9)
+        self.assertNotIn((date(2010, 2, 1), date(2010, 2, 27)), months)
+        self.assertEqual(list(reversed(months))[0],
+                         (date(2011, 6, 1), date(2011, 6, 30)))
+
+    def test_quarter(self):
+        self.set_dates(date(2011, 2, 20), date(2013, 9, 22))
+        quarters = self.obj.each_quarter()
+        self.assertEqual(len(quarters), 10)
+        self.assertEqual(quarters[4], (date(2012, 1, 1), date(2012, 3, 31)))
+        self.assertEqual(list(quarters[::4]),
+                         [(date(2011, 1, 1), date(2011, 3, 31)),
+                          (date(2012, 1, 1), date(2012, 3, 31)),
+                          (date(2013, 1, 1), date(2013, 3, 31))])
+
+    def test_year(self):
+        self.set_dates(date(1990, 5, 20), date(2030, 6, 22))
+        years = self.obj.each_year()
+        self.assertEqual(len(years), 41)
+        self.assertEqual(years[-1], (date(2030, 1, 1), date(2030, 12, 31)))
+        self.assertIn((date(2000, 1, 1), date(2000, 12, 31)), years)
+
+    def test_leap_years(self):
+        self.set_dates(date(1896, 1, 1), date(2104, 12, 31))
+        months = [month for month in self.obj.each_month()
+                  if month[0].month == 2]
+        for start, end in months:
+            self.assertEqual(end, date(start.year, 3, 1) - timedelta(1))
+        quarters = self.obj.each_quarter()
+        self.assertEqual(quarters.index((date(1900, 1, 1),
+                                         date(1900, 3, 31))), 16)
+        self.assertEqual(quarters[16 + 400],
+                         (date(2000, 1, 1), date(2000, 3, 31)))
+        self.assertEqual(self.obj.each_year()[104],
+                         (date(2000, 1, 1), date(2000, 12, 31)))
+
+    def get_chunk_cases(self):
+        self.set_dates(date(1999, 11, 20), date(2004, 3, 10))
+        return (
+            (self.obj.each_day, ()),
+            (self.obj.each_week, ()),
+            (self.obj.each_month, ()),
+            (self.obj.each_quarter, ()),
+            (self.obj.each_year, ()),
+            (self.obj.each_window, (7, 3, 'centered')),
+            (self.obj.each_business_day, ()),
+        )
+
+    def test_chunks(self):
+        for method, args in self.get_chunk_cases():
+            periods = list(method(*args))
+            if isinstance(periods[0], date):
+                periods = [(day, day) for day in periods]
+            chunks = list(method(*args, chunk_size=50))
+            self.assertEqual(len(chunks), (len(periods) + 49) // 50)
+            self.assertTrue(all(len(starts) == len(ends) == 50
+                                for starts, ends in chunks[:-1]))
+            self.assertEqual([pair for starts, ends in chunks
+                              for pair in zip(starts, ends)], periods)
+        starts, ends = self.obj.each_day()[::-3].columns()
+        self.assertEqual(starts[:2], [date(2004, 3, 10), date(2004, 3, 7)])
+        self.assertEqual(ends, starts)
+        self.assertRaises(ValueError, self.obj.each_day, chunk_size=0)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_numpy_chunks(self):
+        for method, args in self.get_chunk_cases():
+            expect = list(method(*args, chunk_size=64))
+            chunks = list(method(*args, chunk_size=64, numpy=True))
+            self.assertEqual(len(chunks), len(expect))
+            for (starts, ends), (start_dates, end_dates) in zip(chunks,
+                                                                expect):
+                self.assertEqual(starts.dtype, np.dtype('datetime64[D]'))
+                self.assertEqual(starts.tolist(), start_dates)
+                self.assertEqual(ends.tolist(), end_dates)
+        numpy, utils._numpy[:] = utils._numpy[:], [None]
+        try:
+            self.assertRaises(ImportError, self.obj.each_day, chunk_size=10,
+                              numpy=True)
+        finally:
+            utils._numpy[:] = numpy
+        days = self.obj.each_business_day()[::-3]
+        starts, ends = days.columns(numpy=True)
+        self.assertEqual(starts.tolist(), list(days))
+        self.assertEqual(ends.tolist(), list(days))
+        starts, ends = self.obj.each_month()[::-2].columns(numpy=True)
+        self.assertEqual(starts[:2].tolist(), [date(2004, 3, 1),
+                                               date(2004, 1, 1)])
+        self.assertEqual(ends[:2].tolist(), [date(2004, 3, 31),
+                                             date(2004, 1, 31)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import random
+import unittest
+from datetime import date
+
+from DateRanger import DateFrame
+
+
+class TestWindow(unittest.TestCase):
+
+    """
+    Test cases for sliding windows of DateFrame
+    """
+
+    def setUp(self):
+        self.obj = DateFrame(date(2015, 1, 1), date(2015, 3, 31))
+        rand = random.Random(2015)
+        self.values = [rand.choice((None, 1, 2, 5, 8, -3))
+                       for n in range(self.obj.days() + 1)]
+
+    def test_trailing(self):
+        windows = self.obj.each_window(7)
+        self.assertEqual(len(windows), 90)
+        self.assertEqual(windows[0], (date(2014, 12, 26), date(2015, 1, 1)))
+        self.assertEqual(windows[-1], (date(2015, 3, 25), date(2015, 3, 31)))
+
+    def test_centered(self):
+        windows = self.obj.each_window(30, step=7, align='centered')
+        self.assertEqual(len(windows), 13)
+        self.assertEqual(windows[1], (date(2014, 12, 25), date(2015, 1, 23)))
+        self.assertIn((date(2014, 12, 25), date(2015, 1, 23)), windows)
+
+    def test_leading(self):
+        windows = self.obj.each_window(3, align='leading')
+        self.assertEqual(windows[0], (date(2015, 1, 1), date(2015, 1, 3)))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, self.obj.each_window, 0)
+        self.assertRaises(ValueError, self.obj.each_window, 3, 0)
+        self.assertRaises(ValueError, self.obj.each_window, 3, 1, 'middle')
+        self.assertRaises(ValueError, list, self.obj.rolling([1], 3))
+
+    def test_rolling(self):
+        days = list(self.obj.each_day())
+        for size, step, align in ((7, 1, 'trailing'), (30, 3, 'centered'),
+                                  (4, 5, 'leading'), (1, 1, 'trailing'),
+                                  (200, 1, 'centered')):
+            result = list(self.obj.rolling(self.values, size, step, align))
+            windows = self.obj.each_window(size, step, align)
+            self.assertEqual([window for window, stats in result],
+                             list(windows))
+            for (start, end), stats in result:
+                values = [value for day, value in zip(days, self.values)
+                          if start <= day <= end and value is not None]
+                self.assertEqual(stats.count, len(values))
+                self.assertEqual(stats.sum, sum(values))
+                self.assertEqual(stats.min, min(values) if values else None)
+                self.assertEqual(stats.max, max(values) if values else None)
+
+    def test_mean(self):
+        values = [1] * 10 + [None] * (self.obj.days() + 1 - 10)
+        result = list(self.obj.rolling(values, 4))
+        self.assertEqual(result[1][1].mean, 1.0)
+        self.assertEqual(result[-1][1].mean, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
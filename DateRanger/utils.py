@@ -1,9 +1,33 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+from datetime import date
+
 from DateRanger.exceptions import InvalidMonth
 from DateRanger.exceptions import InvalidQuarter
 
 
+# Ordinal of 1970-01-01, the epoch of NumPy datetime64 values.
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# NumPy, or None if it is not installed; filled in by get_numpy()
+_numpy = []
+
+
+def get_numpy():
+    """
+    Import NumPy on first use and return it, or None if it is not
+    installed. Modules loaded by `import DateRanger` call this in their
+    array code paths, so importing the package does not load NumPy.
+    """
+    if not _numpy:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy.append(numpy)
+    return _numpy[0]
+
+
 def get_quarter(month):
     """
     Determine a month belongs to which quarter.
@@ -11,14 +35,10 @@ def get_quarter(month):
     Argus:
         month - 1 ~ 12 (Integer)
     """
-    if month not in range(1, 13):
+    if not 1 <= month <= 12:
         raise InvalidMonth()
 
-    quarter = 4
-    if month in (1, 2, 3): quarter = 1
-    if month in (4, 5, 6): quarter = 2
-    if month in (7, 8, 9): quarter = 3
-    return quarter
+    return (month - 1) // 3 + 1
 
 
 def get_monthrange(quarter):
@@ -33,3 +53,160 @@ def get_monthrange(quarter):
 
     monthranges = ((1, 3), (4, 6), (7, 9), (10, 12))
     return monthranges[quarter-1]
+
+
+def is_leap_year(year):
+    """
+    Determine whether the year is a leap year.
+    """
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def get_days_in_month(year, month):
+    """
+    Get number of days in the given month.
+
+    Argus:
+        year - the year
+        month - 1 ~ 12 (Integer)
+    """
+    if month == 2:
+        return 29 if is_leap_year(year) else 28
+    if month in (4, 6, 9, 11):
+        return 30
+    return 31
+
+
+# Days before the first day of each month (and of the next year) in a
+# common year.
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334,
+                      365)
+
+
+def get_year_start(year):
+    """
+    Get the ordinal of January 1st of the year without building a date.
+    """
+    year -= 1
+    return year * 365 + year // 4 - year // 100 + year // 400 + 1
+
+
+def get_week_start(ordinal):
+    """
+    Get the ordinal of the Sunday that starts the week of `ordinal`,
+    following the same rule as DateRanger.get_week_range().
+
+    Argus:
+        ordinal - proleptic Gregorian ordinal (date.toordinal())
+    """
+    return ordinal - (ordinal + 6) % 7 - 1
+
+
+def get_month_index(year, month):
+    """
+    Count months since the beginning of the proleptic calendar.
+
+    Argus:
+        year - the year
+        month - 1 ~ 12 (Integer)
+    """
+    return year * 12 + month - 1
+
+
+def get_block_range(index, span=1):
+    """
+    Get the first and last ordinal of the block of `span` months which
+    contains the month index. Blocks are aligned to January, so span 1, 3
+    and 12 give months, quarters and years.
+
+    Argus:
+        index - month index (see get_month_index)
+        span - 1, 3 or 12
+    """
+    year, month = divmod(index - index % span, 12)
+    # blocks never cross a year, so both ends share the year start
+    base = get_year_start(year)
+    start = base + _DAYS_BEFORE_MONTH[month]
+    end = base + _DAYS_BEFORE_MONTH[month + span] - 1
+    if is_leap_year(year):
+        start += month > 1
+        end += month + span > 1
+    return (start, end)
+
+
+def get_block_dates(index, span=1):
+    """
+    Get the first and last date of the block of `span` months which
+    starts at the month index. The block must not cross a year.
+
+    Argus:
+        index - month index (see get_month_index)
+        span - 1, 3 or 12
+    """
+    year, month = divmod(index, 12)
+    last = month + span
+    return (date(year, month + 1, 1),
+            date(year, last, get_days_in_month(year, last)))
+
+
+def count_weekday(first, last, weekday):
+    """
+    Count days of a weekday between two ordinals, both included.
+
+    Argus:
+        first - the first ordinal
+        last - the last ordinal
+        weekday - 0 ~ 6, Monday is 0 (date.weekday())
+    """
+    weeks, rest = divmod(last - first + 1, 7)
+    return weeks + ((weekday - (first + 6) % 7) % 7 < rest)
+
+
+def count_months_with_day(index, day):
+    """
+    Count months before the month index which have the day of month.
+
+    Argus:
+        index - month index (see get_month_index)
+        day - 1 ~ 31
+    """
+    year, month = divmod(index, 12)
+    month_days = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+    count = year * sum(1 for days in month_days if days >= day)
+    count += sum(1 for days in month_days[:month] if days >= day)
+    if day == 29:
+        # leap years in [0, year) and February of this year
+        count += (year + 3) // 4 - (year + 99) // 100 + (year + 399) // 400
+        if month >= 2 and is_leap_year(year):
+            count += 1
+    return count
+
+
+def count_day_of_month(start_date, end_date, day):
+    """
+    Count dates with the day of month between two dates, both included.
+
+    Argus:
+        start_date - the start date
+        end_date - the end date
+        day - 1 ~ 31
+    """
+    first = get_month_index(start_date.year, start_date.month)
+    last = get_month_index(end_date.year, end_date.month)
+    days = get_days_in_month(start_date.year, start_date.month)
+    if first == last:
+        return int(start_date.day <= day <= min(end_date.day, days))
+
+    count = int(start_date.day <= day <= days) + int(day <= end_date.day)
+    return count + count_months_with_day(last, day) - \
+        count_months_with_day(first + 1, day)
+
+
+def count_month_ends(start_date, end_date):
+    """
+    Count last days of months between two dates, both included.
+    """
+    first = get_month_index(start_date.year, start_date.month)
+    last = get_month_index(end_date.year, end_date.month)
+    days = get_days_in_month(end_date.year, end_date.month)
+    return last - first + int(end_date.day == days)
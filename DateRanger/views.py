@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from collections.abc import Sequence
+from datetime import date
+from operator import index as as_index
+
+from DateRanger.utils import EPOCH_ORDINAL
+from DateRanger.utils import get_numpy
+from DateRanger.utils import get_month_index
+from DateRanger.utils import get_block_range
+
+
+class PeriodSequence(Sequence):
+
+    """
+    A lazy sequence of periods which works like range(). Item `n` is built
+    from the integer key `first + n * step`, so len(), indexing, slicing,
+    reversed() and `in` cost O(1) and nothing is materialized.
+    """
+
+    def __init__(self, first, length, step):
+        """
+        Argus:
+            first - key of the first item
+            length - number of items
+            step - difference between keys of adjacent items
+        """
+        self.first = first
+        self.length = max(length, 0)
+        self.step = step
+
+    # number of keys covered by one item
+    width = 1
+
+    def make_item(self, key):
+        """
+        Build the item of `key`.
+        """
+        raise NotImplementedError()
+
+    def get_date_key(self, day):
+        """
+        Get the key of the period which contains `day`.
+        """
+        raise NotImplementedError()
+
+    def get_ordinal_range(self, key):
+        """
+        Get the first and last ordinal of the period of `key`.
+        """
+        raise NotImplementedError()
+
+    def ordinal_ranges(self):
+        """
+        Yield (first, last) ordinals of each period without building
+        date objects.
+        """
+        key = self.first
+        for n in range(self.length):
+            yield self.get_ordinal_range(key)
+            key += self.step
+
+    def get_key(self, item):
+        """
+        Get the key of `item`, or None if `item` can not be in the sequence.
+        """
+        raise NotImplementedError()
+
+    def get_keys(self):
+        """
+        Get the keys of all items as an int64 array.
+        """
+        np = get_numpy()
+        return self.first + self.step * np.arange(self.length, dtype=np.int64)
+
+    def columns(self, numpy=False):
+        """
+        Get the first and last dates of all periods as a tuple of (starts,
+        ends): two lists of dates, or two datetime64[D] arrays with `numpy`.
+
+        Subclasses compute the arrays from the keys with array arithmetic
+        (_numpy_columns); one which does not falls back to converting
+        ordinal_ranges() one period at a time.
+        """
+        if not numpy:
+            return self._columns()
+        if get_numpy() is None:
+            raise ImportError('NumPy is required for numpy=True')
+        return self._numpy_columns(self.get_keys())
+
+    def _columns(self):
+        fromordinal = date.fromordinal
+        ranges = list(self.ordinal_ranges())
+        return ([fromordinal(first) for first, _ in ranges],
+                [fromordinal(last) for _, last in ranges])
+
+    def _numpy_columns(self, keys):
+        # per-period fallback for subclasses without array arithmetic
+        np = get_numpy()
+        ranges = np.array(list(self.ordinal_ranges()), dtype=np.int64)
+        ranges = ranges.reshape(-1, 2) - EPOCH_ORDINAL
+        return (ranges[:, 0].astype('datetime64[D]'),
+                ranges[:, 1].astype('datetime64[D]'))
+
+    def chunks(self, size, numpy=False):
+        """
+        Return an iterator of (starts, ends) batches of up to `size`
+        periods, as returned by columns(). Each batch can be passed to a
+        bulk loader as is.
+
+        Argus:
+            size - number of periods per batch
+            numpy - build datetime64[D] arrays instead of lists of dates
+        """
+        if size < 1:
+            raise ValueError('Chunk size must be at least 1: %r' % (size,))
+        if numpy and get_numpy() is None:
+            raise ImportError('NumPy is required for numpy=True')
+        return self._chunks(size, numpy)
+
+    def _chunks(self, size, numpy):
+        for start in range(0, self.length, size):
+            yield self[start:start + size].columns(numpy)
+
+    def replace(self, first, length, step):
+        """
+        Return a sequence of the same kind with other keys.
+        """
+        return self.__class__(first, length, step)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            length = len(range(start, stop, step))
+            return self.replace(self.first + start * self.step, length,
+                                self.step * step)
+
+        index = as_index(index)
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('%s index out of range' %
+                             self.__class__.__name__)
+        return self.make_item(self.first + index * self.step)
+
+    def __iter__(self):
+        key = self.first
+        for n in range(self.length):
+            yield self.make_item(key)
+            key += self.step
+
+    def __reversed__(self):
+        return iter(self[::-1])
+
+    def __contains__(self, item):
+        return self._find(item) is not None
+
+    def __repr__(self):
+        return '<%s of %d items>' % (self.__class__.__name__, self.length)
+
+    def _find(self, item):
+        """
+        Get the position of `item`, or None if it is not in the sequence.
+        """
+        key = self.get_key(item)
+        if key is None:
+            return None
+        index, remainder = divmod(key - self.first, self.step)
+        if remainder or not 0 <= index < self.length:
+            return None
+        if self.make_item(key) != item:
+            return None
+        return index
+
+    def locate(self, day):
+        """
+        Get the position of the item which contains `day`, or -1 if no
+        item contains it.
+        """
+        if self.step < 0:
+            index = self[::-1].locate(day)
+            return -1 if index < 0 else self.length - 1 - index
+
+        key = self.get_date_key(day)
+        index = (key - self.first) // self.step
+        if not 0 <= index < self.length:
+            return -1
+        if key >= self.first + index * self.step + self.width:
+            return -1
+        return index
+
+    def index(self, item):
+        index = self._find(item)
+        if index is None:
+            raise ValueError('%r is not in sequence' % (item,))
+        return index
+
+    def count(self, item):
+        return 0 if self._find(item) is None else 1
+
+
+class DaySequence(PeriodSequence):
+
+    """
+    A lazy sequence of dates. Keys are ordinals.
+    """
+
+    def make_item(self, key):
+        return date.fromordinal(key)
+
+    def _columns(self):
+        stop = self.first + self.length * self.step
+        starts = list(map(date.fromordinal,
+                          range(self.first, stop, self.step)))
+        return (starts, list(starts))
+
+    def _numpy_columns(self, keys):
+        starts = (keys - EPOCH_ORDINAL).astype('datetime64[D]')
+        return (starts, starts.copy())
+
+    def get_date_key(self, day):
+        return day.toordinal()
+
+    def get_ordinal_range(self, key):
+        return (key, key)
+
+    def get_key(self, item):
+        if not isinstance(item, date):
+            return None
+        return item.toordinal()
+
+
+class WeekSequence(PeriodSequence):
+
+    """
+    A lazy sequence of (start, end) tuples of weeks. Keys are ordinals of
+    the first day of each week.
+    """
+
+    width = 7
+
+    def make_item(self, key):
+        return (date.fromordinal(key), date.fromordinal(key + 6))
+
+    def _numpy_columns(self, keys):
+        starts = (keys - EPOCH_ORDINAL).astype('datetime64[D]')
+        return (starts, starts + 6)
+
+    def get_date_key(self, day):
+        return day.toordinal()
+
+    def get_ordinal_range(self, key):
+        return (key, key + 6)
+
+    def get_key(self, item):
+        if not isinstance(item, tuple) or len(item) != 2:
+            return None
+        if not isinstance(item[0], date):
+            return None
+        return item[0].toordinal()
+
+
+class BlockSequence(PeriodSequence):
+
+    """
+    A lazy sequence of (start, end) tuples of blocks of `span` months.
+    Keys are month indexes (see get_month_index).
+    """
+
+    span = 1
+
+    @property
+    def width(self):
+        return self.span
+
+    def make_item(self, key):
+        start, end = get_block_range(key, self.span)
+        return (date.fromordinal(start), date.fromordinal(end))
+
+    def _numpy_columns(self, keys):
+        # datetime64[M] counts months from 1970-01
+        months = keys - 1970 * 12
+        starts = months.astype('datetime64[M]').astype('datetime64[D]')
+        ends = (months + self.span).astype('datetime64[M]')
+        return (starts, ends.astype('datetime64[D]') - 1)
+
+    def get_date_key(self, day):
+        return get_month_index(day.year, day.month)
+
+    def get_ordinal_range(self, key):
+        return get_block_range(key, self.span)
+
+    def get_key(self, item):
+        if not isinstance(item, tuple) or len(item) != 2:
+            return None
+        if not isinstance(item[0], date):
+            return None
+        return get_month_index(item[0].year, item[0].month)
+
+
+class MonthSequence(BlockSequence):
+
+    """
+    A lazy sequence of (start, end) tuples of months.
+    """
+
+    span = 1
+
+
+class QuarterSequence(BlockSequence):
+
+    """
+    A lazy sequence of (start, end) tuples of quarters.
+    """
+
+    span = 3
+
+
+class YearSequence(BlockSequence):
+
+    """
+    A lazy sequence of (start, end) tuples of years.
+    """
+
+    span = 12
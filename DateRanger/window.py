@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from collections import deque
+from collections import namedtuple
+from datetime import date
+
+from DateRanger.utils import EPOCH_ORDINAL
+from DateRanger.views import PeriodSequence
+
+
+ALIGNMENTS = ('trailing', 'centered', 'leading')
+
+
+_RollingStats = namedtuple('RollingStats', ['count', 'sum', 'min', 'max'])
+
+
+class RollingStats(_RollingStats):
+
+    """
+    Count, sum, min and max of the values in one window.
+    """
+
+    __slots__ = ()
+
+    @property
+    def mean(self):
+        """
+        Return the mean of values, or None if there is no value.
+        """
+        if not self.count:
+            return None
+        return self.sum / float(self.count)
+
+
+def get_window_offsets(size, align='trailing'):
+    """
+    Get number of days before and after the anchor day of a window.
+
+    Argus:
+        size - window length in days
+        align - 'trailing', 'centered' or 'leading'
+    """
+    if size < 1:
+        raise ValueError('Window size must be at least 1: %r' % (size,))
+    if align == 'trailing':
+        return (size - 1, 0)
+    if align == 'centered':
+        return ((size - 1) // 2, size // 2)
+    if align == 'leading':
+        return (0, size - 1)
+    raise ValueError('Unknown alignment: %r' % (align,))
+
+
+class WindowSequence(PeriodSequence):
+
+    """
+    A lazy sequence of (start, end) tuples of sliding windows. Keys are
+    ordinals of anchor days; a window covers `before` days before and
+    `after` days after its anchor.
+    """
+
+    def __init__(self, first, length, step, before=0, after=0):
+        """
+        Argus:
+            first - ordinal of the first anchor day
+            length - number of windows
+            step - days between adjacent anchors
+            before - days before the anchor
+            after - days after the anchor
+        """
+        super(WindowSequence, self).__init__(first, length, step)
+        self.before = before
+        self.after = after
+
+    def replace(self, first, length, step):
+        return self.__class__(first, length, step, self.before, self.after)
+
+    def make_item(self, key):
+        return (date.fromordinal(key - self.before),
+                date.fromordinal(key + self.after))
+
+    def get_key(self, item):
+        if not isinstance(item, tuple) or len(item) != 2:
+            return None
+        if not isinstance(item[0], date):
+            return None
+        return item[0].toordinal() + self.before
+
+    def get_date_key(self, day):
+        return day.toordinal()
+
+    def get_ordinal_range(self, key):
+        return (key - self.before, key + self.after)
+
+    def _numpy_columns(self, keys):
+        anchors = (keys - EPOCH_ORDINAL).astype('datetime64[D]')
+        return (anchors - self.before, anchors + self.after)
+
+
+def each_window(frame, size, step=1, align='trailing'):
+    """
+    Return a lazy sequence of windows anchored at every `step`-th day of
+    the frame, starting from start_date.
+
+    Argus:
+        frame - a DateFrame
+        size - window length in days
+        step - days between adjacent anchors
+        align - 'trailing', 'centered' or 'leading'
+    """
+    if step < 1:
+        raise ValueError('Step must be at least 1: %r' % (step,))
+    before, after = get_window_offsets(size, align)
+    length = frame.days() // step + 1
+    return WindowSequence(frame.start_date.toordinal(), length, step,
+                          before, after)
+
+
+def rolling(frame, values, size, step=1, align='trailing'):
+    """
+    Yield ((start, end), RollingStats) for each window of each_window().
+
+    Values are given per day of frame.each_day(); None means no value.
+    Days of a window outside the frame have no value. Sums, counts and
+    min/max are maintained incrementally, so the total cost is O(days).
+
+    Argus:
+        frame - a DateFrame
+        values - a sequence of values, one per day of the frame
+        size - window length in days
+        step - days between adjacent anchors
+        align - 'trailing', 'centered' or 'leading'
+    """
+    windows = each_window(frame, size, step, align)
+    days = frame.days() + 1
+    if len(values) != days:
+        raise ValueError('Expected %d values, got %d' % (days, len(values)))
+
+    before, after = windows.before, windows.after
+    total, count = 0, 0
+    lows, highs = deque(), deque()
+    added = 0
+    for anchor in range(days):
+        # add values up to the last day of this window
+        while added < days and added <= anchor + after:
+            value = values[added]
+            if value is not None:
+                total += value
+                count += 1
+                while lows and values[lows[-1]] >= value:
+                    lows.pop()
+                lows.append(added)
+                while highs and values[highs[-1]] <= value:
+                    highs.pop()
+                highs.append(added)
+            added += 1
+
+        # remove the value which just left the window
+        leaving = anchor - before - 1
+        if leaving >= 0 and values[leaving] is not None:
+            total -= values[leaving]
+            count -= 1
+        while lows and lows[0] <= leaving:
+            lows.popleft()
+        while highs and highs[0] <= leaving:
+            highs.popleft()
+
+        if anchor % step == 0:
+            stats = RollingStats(
+                count, total,
+                values[lows[0]] if lows else None,
+                values[highs[0]] if highs else None)
+            yield (windows[anchor // step], stats)
@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of every public method of DateRanger and DateFrame.
+
+Usage:
+    python benchmarks/run.py                       # print a table
+    python benchmarks/run.py -o baseline.json      # save results
+    python benchmarks/run.py --compare baseline.json --threshold 0.1
+
+With --compare, the exit status is 1 if any benchmark got slower (or
+allocates more memory) than the baseline by more than the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from datetime import date
+from datetime import timedelta
+from functools import partial
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from DateRanger import DateRanger
+from DateRanger import DateFrame
+from DateRanger import cache
+
+
+BASE_DATE = date(1990, 5, 17)
+
+# days of DateFrames and offsets of DateRanger methods for each span
+SPANS = (
+    ('small', 6, 1),
+    ('medium', 365, 12),
+    ('decades', 365 * 30 + 7, 360),
+)
+
+# growth of allowed memory before a benchmark is flagged, in bytes
+MEMORY_SLACK = 1024
+
+
+def get_frame_cases(frame):
+    """
+    Get benchmarks of DateFrame methods. Lazy sequences are materialized,
+    so their cost grows with the length of the frame.
+    """
+    values = [1] * (frame.days() + 1)
+    return {
+        'days': frame.days,
+        'weeks': frame.weeks,
+        'months': frame.months,
+        'quarters': frame.quarters,
+        'years': frame.years,
+        'get_timedelta': frame.get_timedelta,
+        'get_weekdelta': frame.get_weekdelta,
+        'get_monthdelta': frame.get_monthdelta,
+        'get_quarterdelta': frame.get_quarterdelta,
+        'get_yeardelta': frame.get_yeardelta,
+        'get_range': frame.get_range,
+        'each_day': lambda: list(frame.each_day()),
+        'each_week': lambda: list(frame.each_week()),
+        'each_month': lambda: list(frame.each_month()),
+        'each_quarter': lambda: list(frame.each_quarter()),
+        'each_year': lambda: list(frame.each_year()),
+        'each_window': lambda: list(frame.each_window(7)),
+        'each_day_chunks': lambda: list(frame.each_day(chunk_size=1024)),
+        'each_week_chunks': lambda: list(frame.each_week(chunk_size=1024)),
+        'rolling': lambda: list(frame.rolling(values, 7)),
+        'count_weekday': lambda: frame.count_weekday(0),
+        'weekday_counts': frame.weekday_counts,
+        'count_weekdays': frame.count_weekdays,
+        'count_weekend_days': frame.count_weekend_days,
+        'count_day_of_month': lambda: frame.count_day_of_month(31),
+        'count_month_ends': frame.count_month_ends,
+        'business_days': frame.business_days,
+        'each_business_day': lambda: list(frame.each_business_day()),
+        'cover': frame.cover,
+        'partition_keys': frame.partition_keys,
+    }
+
+
+def get_ranger_cases(ranger, offset):
+    """
+    Get benchmarks of DateRanger methods with `offset` periods.
+    """
+    before = BASE_DATE - timedelta(days=offset * 30)
+    after = BASE_DATE + timedelta(days=offset * 30)
+    cases = {
+        'set_base_date': lambda: ranger.set_base_date(BASE_DATE),
+        'from_date': lambda: ranger.from_date(before),
+        'to_date': lambda: ranger.to_date(after),
+        'get_week_range': lambda: ranger.get_week_range(after),
+        'get_month_range': lambda: ranger.get_month_range(after.year,
+                                                          after.month),
+        'get_quarter_range': lambda: ranger.get_quarter_range(after.year, 4),
+        'get_year_range': lambda: ranger.get_year_range(after.year),
+        'prev_business_day': lambda: ranger.prev_business_day(offset),
+        'next_business_day': lambda: ranger.next_business_day(offset),
+    }
+    for unit in ('day', 'week', 'month', 'quarter', 'year'):
+        cases['base_' + unit] = getattr(ranger, 'base_' + unit)
+        for prefix in ('prev_', 'next_', 'relative_'):
+            name = prefix + unit
+            cases[name] = partial(getattr(ranger, name), offset)
+            cases[name + 's'] = partial(materialize,
+                                        getattr(ranger, name + 's'), offset)
+    return cases
+
+
+def get_cache_cases(ranger):
+    """
+    Get benchmarks of memoized DateRanger methods: a cache hit against
+    the same computation without the cache. They run with caches enabled.
+    """
+    after = BASE_DATE + timedelta(days=30)
+    calls = (
+        ('get_week_range', (after,)),
+        ('get_quarter_range', (after.year, 4)),
+        ('relative_quarter', (1,)),
+    )
+    cases = {}
+    for name, args in calls:
+        method = getattr(DateRanger, name)
+        cases['%s[hit]' % name] = partial(method, ranger, *args)
+        cases['%s[compute]' % name] = partial(method.__wrapped__, ranger,
+                                              *args)
+    return cases
+
+
+def materialize(method, *args):
+    """
+    Call a method which returns a lazy sequence and build all its items.
+    """
+    return list(method(*args))
+
+
+def check_coverage(frame_cases, ranger_cases):
+    """
+    Make sure every public method has a benchmark.
+    """
+    missing = []
+    for cls, cases in ((DateFrame, frame_cases), (DateRanger, ranger_cases)):
+        for name in dir(cls):
+            attr = getattr(cls, name)
+            if name.startswith('_') or not callable(attr):
+                continue
+            if name not in cases:
+                missing.append('%s.%s' % (cls.__name__, name))
+    if missing:
+        raise SystemExit('No benchmark for: %s' % ', '.join(missing))
+
+
+def get_cases():
+    """
+    Get a dict of benchmark name and function over all spans.
+    """
+    cases = {}
+    for span, days, offset in SPANS:
+        frame = DateFrame(BASE_DATE, BASE_DATE + timedelta(days=days))
+        frame_cases = get_frame_cases(frame)
+        ranger_cases = get_ranger_cases(DateRanger(BASE_DATE), offset)
+        check_coverage(frame_cases, ranger_cases)
+        for prefix, group in (('DateFrame', frame_cases),
+                              ('DateRanger', ranger_cases)):
+            for name, func in group.items():
+                cases['%s.%s[%s]' % (prefix, name, span)] = func
+    for name, func in get_cache_cases(DateRanger(BASE_DATE)).items():
+        cases['Cache.' + name] = func
+    return cases
+
+
+def measure(func, repeat, min_time):
+    """
+    Time a function. The number of calls per repeat is raised until one
+    repeat takes at least `min_time` seconds; the best and median time
+    per call over `repeat` repeats are returned in nanoseconds, with the
+    peak memory of one call in bytes (None without tracemalloc).
+    """
+    func()
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+    times = sorted(timer.timeit(number) / number * 1e9
+                   for _ in range(repeat))
+    result = {
+        'best': times[0],
+        'median': times[len(times) // 2],
+        'calls': number * repeat,
+        'peak': None,
+    }
+    if tracemalloc is not None:
+        tracemalloc.start()
+        func()
+        result['peak'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def run(pattern=None, repeat=5, min_time=0.05):
+    """
+    Run benchmarks whose name contains `pattern` and return a dict of
+    results.
+    """
+    results = {}
+    for name, func in sorted(get_cases().items()):
+        if pattern and pattern not in name:
+            continue
+        enabled = cache.is_enabled()
+        if name.startswith('Cache.'):
+            cache.configure(enabled=True)
+        try:
+            results[name] = measure(func, repeat, min_time)
+        finally:
+            cache.configure(enabled=enabled)
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'cache': cache.is_enabled(),
+        'results': results,
+    }
+
+
+def compare(report, baseline, threshold):
+    """
+    Compare results to a baseline. Return names of regressed benchmarks.
+    """
+    regressions = []
+    print('%-45s %11s %11s %7s' % ('benchmark', 'baseline ns', 'ns',
+                                   'ratio'))
+    for name, result in sorted(report['results'].items()):
+        old = baseline['results'].get(name)
+        if old is None:
+            continue
+        ratio = result['best'] / old['best']
+        flags = []
+        if ratio > 1 + threshold:
+            flags.append('SLOWER')
+        if result['peak'] is not None and old['peak'] is not None and \
+                result['peak'] > old['peak'] * (1 + threshold) + \
+                MEMORY_SLACK:
+            flags.append('MEMORY')
+        if flags:
+            regressions.append(name)
+        print('%-45s %11.0f %11.0f %6.2fx %s' % (
+            name, old['best'], result['best'], ratio, ' '.join(flags)))
+    return regressions
+
+
+def print_report(report):
+    print('%-45s %11s %11s %10s' % ('benchmark', 'best ns', 'median ns',
+                                   'peak B'))
+    for name, result in sorted(report['results'].items()):
+        peak = '-' if result['peak'] is None else result['peak']
+        print('%-45s %11.0f %11.0f %10s' % (name, result['best'],
+                                            result['median'], peak))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('-k', dest='pattern',
+                        help='only run benchmarks containing this string')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='repeats per benchmark (default: 5)')
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help='min seconds per repeat (default: 0.05)')
+    parser.add_argument('--cache', action='store_true',
+                        help='keep the DateRanger caches enabled')
+    parser.add_argument('-o', '--output',
+                        help='write results as JSON to this file')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='compare results to a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='allowed slowdown ratio (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    cache.configure(enabled=args.cache)
+    report = run(args.pattern, args.repeat, args.min_time)
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+
+    if not args.compare:
+        print_report(report)
+        return 0
+
+    with open(args.compare) as baseline:
+        regressions = compare(report, json.load(baseline), args.threshold)
+    if regressions:
+        print('%d regression(s) over %.0f%%' % (len(regressions),
+                                                args.threshold * 100))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())